@@ -1,5 +1,41 @@
-from src.game import Game
+import argparse
+
+from src.constants import FPS, SAVE_FILE
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Corsica Game - Tower Defense")
+    parser.add_argument('--headless', action='store_true',
+                        help="Simule les vagues sans fenêtre ni son et affiche les statistiques")
+    parser.add_argument('--layout', nargs='+', default=[SAVE_FILE],
+                        help="Fichier(s) de disposition des tours au format map_save.json")
+    parser.add_argument('--ticks', type=int, default=FPS * 600,
+                        help="Nombre maximal de pas de simulation par disposition")
+    parser.add_argument('--tick-rate', type=float, default=FPS,
+                        help="Nombre de pas de simulation par seconde simulée")
+    parser.add_argument('--batched', action='store_true',
+                        help="Utilise le stockage vectorisé (NumPy) des monstres")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Graine aléatoire pour des résultats reproductibles")
+    return parser.parse_args()
+
+
+def run_headless(args):
+    from src.simulation import run_headless as simulate
+
+    results = simulate(args.layout, args.ticks, args.tick_rate, args.seed, args.batched)
+    for layout_path, stats in zip(args.layout, results):
+        print(f"{layout_path}: score={stats.score} village={stats.village_health:.1f} "
+              f"vagues={stats.waves_cleared} ticks={stats.ticks_run}"
+              f"{' (game over)' if stats.game_over else ''}")
+
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    if args.headless:
+        run_headless(args)
+    else:
+        from src.game import Game
+
+        game = Game()
+        game.run()
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pygame
+
+from src.constants import AUDIO_CACHE_DIR
+from src.map_cache import source_hash, save_arrays
+
+
+def pcm_cache_name(path: str) -> str:
+    """Nom du fichier de cache : empreinte de la source et format du mixer (le PCM en dépend)"""
+    frequency, sample_format, channels = pygame.mixer.get_init()
+    return f"{source_hash(path)}-{frequency}-{sample_format}-{channels}"
+
+
+def load_pcm(path: str) -> np.ndarray:
+    """Échantillons décodés d'un fichier audio, au format du mixer.
+
+    Lus en memory-map depuis le cache ; au premier lancement, le fichier est
+    décodé une fois par pygame puis le PCM est écrit dans le cache. Le tableau
+    renvoyé reste sur disque : seules les parties lues occupent la mémoire.
+    """
+    name = pcm_cache_name(path)
+    cache_path = os.path.join(AUDIO_CACHE_DIR, f"{name}.npy")
+    try:
+        return np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+
+    samples = pygame.sndarray.array(pygame.mixer.Sound(path))
+    if save_arrays(AUDIO_CACHE_DIR, {name: samples}):
+        return np.load(cache_path, mmap_mode='r')
+    return samples
+
+
+def load_sound(path: str) -> pygame.mixer.Sound:
+    """Son gardé en mémoire (effets courts), créé depuis le PCM en cache"""
+    return pygame.sndarray.make_sound(np.ascontiguousarray(load_pcm(path)))
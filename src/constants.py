@@ -5,6 +5,9 @@ WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 GRID_SIZE = 32
 FPS = 60
+SIM_TICK_RATE = 60  # Pas de simulation fixes par seconde de jeu
+MAX_SUBSTEPS_PER_FRAME = 30  # Nombre maximal de pas de simulation par image
+MAX_FRAME_TIME = 0.25  # Durée d'image maximale prise en compte (évite la spirale après un blocage)
 
 # Game Elements Sizes
 TOWER_PANEL_HEIGHT = 100  # Hauteur de la zone des tours en bas
@@ -20,10 +23,28 @@ MIN_SPAWN_DISTANCE = 800  # Distance minimale de spawn du village
 MAX_SPAWN_DISTANCE = 1200  # Distance maximale de spawn du village
 MAX_ZOOM = 4.0
 MIN_ZOOM = 0.5
+ZOOM_STEPS_PER_DOUBLING = 16  # Quantification du zoom pour les caches de rendu
+SPATIAL_GRID_CELL_SIZE = 100  # Taille des cellules de l'index spatial des monstres et des tours
+BATCHED_MONSTERS = False  # Stockage vectorisé (NumPy) des monstres pour les très grandes vagues
+TERRAIN_GRID_RESOLUTION = None  # Cellules par côté de la grille de terrain (None = résolution de speedmask.png)
+MAP_CACHE_DIR = "cache/maps"  # Terrain, mips du fond et atlas des sprites précalculés, indexés par empreinte des sources
+ASSET_LOADER_WORKERS = 4  # Threads de décodage des images et des sons au démarrage
+PRINT_ASSET_TIMINGS = False  # Affiche les temps de chargement de chaque ressource et du premier affichage
 
 # Visual Effects
 RANGE_ALPHA = 128  # Transparence des cercles de portée (0-255)
 DEBUG_LINE_ALPHA = 128  # Transparence des lignes de debug
+SPRITE_CACHE_BUDGET = 64 * 1024 * 1024  # Mémoire maximale des sprites redimensionnés (octets)
+BACKGROUND_TILE_SIZE = 256  # Taille des tuiles du fond (pixels de l'image source)
+TERRAIN_HEATMAP_ALPHA = 64  # Transparence de la carte des vitesses du debug terrain
+OVERLAY_STAMP_MAX_RADIUS = 256  # Rayon maximal des cercles de calque gardés en cache (pixels)
+OVERLAY_STAMP_CACHE_SIZE = 128  # Nombre de cercles de calque gardés en cache
+VIEW_CULL_MARGIN = 150  # Marge autour de l'écran pour les sprites, barres de vie et noms (unités du monde)
+BATCH_SPRITE_CACHE_SIZE = 512  # Nombre de barres de vie et projectiles pré-rendus gardés en cache
+TEXT_CACHE_SIZE = 256  # Nombre de textes rendus gardés en cache
+GLYPH_ATLAS_CHARS = "0123456789.:-+()xs% "  # Caractères pré-rendus pour composer les valeurs numériques
+ATLAS_SPRITE_MAX_SIZE = 512  # Taille maximale d'un sprite dans l'atlas (au-delà de l'affichage au zoom maximal)
+ATLAS_MAX_WIDTH = 2048  # Largeur maximale de l'image de l'atlas des sprites
 
 # Game Mechanics
 TIME_ACCELERATIONS = [1.0, 5.0, 10.0, 15.0, 20.0]  # Différents niveaux d'accélération
@@ -50,6 +71,9 @@ LIGHT_RECHARGE_DELAY = 2.0  # Délai en secondes avant que la recharge ne commen
 LIGHT_POWER_BAR_WIDTH = 200  # Largeur de la barre de puissance
 LIGHT_POWER_BAR_HEIGHT = 15  # Hauteur de la barre de puissance
 LIGHT_RADIUS = 200    # Rayon d'effet de la lumière
+LIGHT_STAMP_MAX_SIZE = 1024  # Taille maximale d'un tampon de lumière précalculé (pixels)
+LIGHT_STAMP_CACHE_SIZE = 64  # Nombre de tampons de lumière gardés en cache
+LIGHT_STAMP_FALLOFF = 0.15  # Largeur relative du fondu au bord des lumières
 
 # Monster Behavior
 MONSTER_FEAR_DURATION = 5.0  # Durée pendant laquelle le monstre fuit (en secondes)
@@ -58,9 +82,32 @@ FLEE_DISTANCE_MIN = 300  # Distance minimale de fuite
 FLEE_DISTANCE_MAX = 500  # Distance maximale de fuite
 FLEE_ANGLE_VARIATION = math.pi / 4  # Variation maximale de l'angle de fuite (±45 degrés)
 MAX_VISIBILITY_RANGE = 800  # Distance maximale de visibilité depuis le village
+VISIBILITY_CELL_SIZE = 10  # Taille des cellules des rasters de visibilité et de zone de lumière
+
+# Audio
+AUDIO_RESERVED_CHANNELS = 12  # Canaux du mixer réservés aux effets sonores
+AUDIO_FREE_CHANNELS = 4  # Canaux du mixer laissés libres (ni effets, ni voix)
+VOICE_CHUNK_SECONDS = 2.0  # Durée des morceaux envoyés au canal des voix
+AUDIO_CACHE_DIR = "cache/audio"  # PCM décodé des sons et des voix, indexé par empreinte des fichiers sources
+SOUND_FALLOFF_DISTANCE = 1500  # Distance à la caméra à laquelle un effet atteint son volume minimal
+SOUND_MIN_DISTANCE_VOLUME = 0.2  # Fraction du volume conservée pour les effets lointains
+SOUND_LIMITS = {  # Nom du son: (lectures simultanées maximales, délai minimal entre deux lectures en secondes)
+    'tower_fire': (3, 0.08),
+    'monster_death': (3, 0.05),
+    'tower_destroyed': (2, 0.1),
+}
 
 # File Paths
 SAVE_FILE = "map_save.json"
+SCORE_LOG_FILE = "src/assets/score_log.jsonl"  # Journal de tous les scores (une ligne JSON par partie)
+LEADERBOARD_SIZE = 10  # Nombre de scores affichés dans le leaderboard
+SCORE_COMPACT_INTERVAL = 20  # Nombre de scores ajoutés entre deux réécritures de leaderboard.json
+SCORE_BACKEND = "log"  # Stockage des scores : "log" (journal JSON) ou "sqlite" (base SQLite)
+SCORE_DB_FILE = "src/assets/scores.db"  # Base des scores du stockage "sqlite"
+DEFAULT_MAP_NAME = "default"  # Carte associée aux scores
+AUTOSAVE_DIR = "saves"  # Sauvegardes automatiques de la partie en cours
+AUTOSAVE_INTERVAL = 5.0  # Temps simulé entre deux sauvegardes automatiques (secondes)
+AUTOSAVE_KEYFRAME_INTERVAL = 12  # Sauvegardes en delta entre deux sauvegardes complètes
 
 # Colors
 WHITE = (255, 255, 255)
@@ -2,5 +2,6 @@ from .monster import Monster, WaveMonster
 from .tower import Tower
 from .projectile import Projectile
 from .explosion import Explosion
+from .monster_store import MonsterStore, BatchedMonster
 
-__all__ = ['Monster', 'WaveMonster', 'Tower', 'Projectile', 'Explosion'] 
\ No newline at end of file
+__all__ = ['Monster', 'WaveMonster', 'Tower', 'Projectile', 'Explosion', 'MonsterStore', 'BatchedMonster'] 
\ No newline at end of file
@@ -1,4 +1,3 @@
-import pygame
 from ..constants import WINDOW_WIDTH, WINDOW_HEIGHT
 
 class Explosion:
@@ -16,7 +15,8 @@ class Explosion:
         if self.time >= self.duration:
             self.finished = True
     
-    def draw(self, screen, camera_x, camera_y, zoom):
+    def draw(self, overlay, camera_x, camera_y, zoom):
+        """Dessine l'explosion dans le calque `overlay` (OverlayLayer)"""
         if not self.finished:
             progress = self.time / self.duration
             current_radius = self.max_radius * progress
@@ -25,9 +25,6 @@ class Explosion:
             screen_x = (self.x - camera_x) * zoom + WINDOW_WIDTH/2
             screen_y = (self.y - camera_y) * zoom + WINDOW_HEIGHT/2
             
-            explosion_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(explosion_surface, 
-                             (*self.color, alpha),
-                             (int(screen_x), int(screen_y)), 
-                             int(current_radius * zoom))
-            screen.blit(explosion_surface, (0, 0)) 
\ No newline at end of file
+            # Rayon et transparence changent à chaque image : pas de mise en cache
+            overlay.circle((*self.color, alpha), (screen_x, screen_y),
+                           int(current_radius * zoom), cache=False)
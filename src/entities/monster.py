@@ -164,6 +164,8 @@ class Monster:
         self.monster_type = monster_type
         self.x = x
         self.y = y
+        self.prev_x = x  # Position au pas précédent, pour l'interpolation du rendu
+        self.prev_y = y
         self.game = game  # Référence au jeu pour accéder au terrain
         
         # Récupérer les stats de base pour ce type de monstre
@@ -420,15 +422,21 @@ class Monster:
                 self.current_target_type = 'village'
                 self.current_target = None
 
-    def draw(self, screen, camera_x, camera_y, zoom, show_names=False, show_monster_ranges=False):
-        """Dessine le monstre et ses effets"""
-        screen_x, screen_y = self.world_to_screen(camera_x, camera_y, zoom)
+    def draw(self, screen, camera_x, camera_y, zoom, show_names=False, show_monster_ranges=False, alpha=1.0,
+             overlay=None):
+        """Dessine le monstre et ses effets, interpolé entre les deux derniers pas selon `alpha`
+
+        Les zones d'effet sont dessinées dans le calque `overlay` (OverlayLayer).
+        """
+        screen_x, screen_y = self.world_to_screen(camera_x, camera_y, zoom, alpha)
         
         # Dessiner le triangle du monstre
         points = self.calculate_triangle_points(screen_x, screen_y, zoom)
         pygame.draw.polygon(screen, (*self.color, 128), points, 2)
 
-        screen.blit(pygame.transform.scale(self.game.monster_sprites[self.monster_type], (int(MONSTER_SIZE * zoom * self.size), int(MONSTER_SIZE * zoom * self.size))), (screen_x - MONSTER_SIZE*zoom * self.size/2, screen_y - MONSTER_SIZE*zoom * self.size/2))
+        sprite = self.game.sprite_cache.get_zoomed(('monster', self.monster_type), self.game.monster_sprites[self.monster_type],
+                                                   MONSTER_SIZE * self.size, zoom)
+        screen.blit(sprite, (screen_x - sprite.get_width()/2, screen_y - sprite.get_height()/2))
         
         # Dessiner la barre de vie
         self.draw_health_bar(screen, screen_x, screen_y, zoom)
@@ -438,8 +446,25 @@ class Monster:
             self.draw_name(screen, screen_x, screen_y, zoom)
         
         # Afficher les zones d'effet si activé
-        if show_monster_ranges:
-            self.draw_effect_range(screen, screen_x, screen_y, zoom)
+        if show_monster_ranges and overlay is not None:
+            self.draw_effect_range(overlay, screen_x, screen_y, zoom)
+
+    def add_to_batch(self, batch, zoom, show_names=False, alpha=1.0):
+        """Ajoute le contour, le sprite, la barre de vie et le nom du monstre à la liste de dessin `batch`"""
+        x, y = self.get_render_position(alpha)
+        batch.add_polygon((*self.color, 128), self.calculate_triangle_points(x, y, 1.0), 2)
+        
+        sprite = self.game.sprite_cache.get_zoomed(('monster', self.monster_type), self.game.monster_sprites[self.monster_type],
+                                                   MONSTER_SIZE * self.size, zoom)
+        batch.add_centered(sprite, x, y)
+        
+        health_height = 3 * zoom
+        batch.add_health_bar(x, y, self.current_health / self.max_health, MONSTER_SIZE * zoom, health_height,
+                             -MONSTER_SIZE * zoom - health_height - 2)
+        
+        if show_names:
+            name_surface = self.game.text.render(MONSTER_NAMES[self.monster_type], int(20 * zoom), self.color)
+            batch.add_sprite(name_surface, x, y, -name_surface.get_width()/2, -MONSTER_SIZE * zoom - 20 * zoom)
 
     def calculate_triangle_points(self, screen_x, screen_y, zoom):
         """Calcule les points du triangle représentant le monstre"""
@@ -477,33 +502,40 @@ class Monster:
 
     def draw_name(self, screen, screen_x, screen_y, zoom):
         """Affiche le nom du monstre"""
-        font = pygame.font.Font(None, int(20 * zoom))
-        name_surface = font.render(MONSTER_NAMES[self.monster_type], True, self.color)
+        name_surface = self.game.text.render(MONSTER_NAMES[self.monster_type], int(20 * zoom), self.color)
         name_x = screen_x - name_surface.get_width()/2
         name_y = screen_y - MONSTER_SIZE * zoom - 20 * zoom
         screen.blit(name_surface, (name_x, name_y))
 
-    def draw_effect_range(self, screen, screen_x, screen_y, zoom):
+    def draw_effect_range(self, overlay, screen_x, screen_y, zoom):
         """Dessine la zone d'effet du monstre si applicable"""
         if hasattr(self, 'effect_range'):
-            range_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            radius = int(self.effect_range * zoom)
-            pygame.draw.circle(range_surface, self.effect_color,
-                             (int(screen_x), int(screen_y)), radius)
-            screen.blit(range_surface, (0, 0))
+            overlay.circle(self.effect_color, (screen_x, screen_y), int(self.effect_range * zoom))
+
+    def get_render_position(self, alpha=1.0):
+        """Position interpolée entre le pas précédent (alpha=0) et le pas courant (alpha=1)"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
-    def world_to_screen(self, camera_x, camera_y, zoom):
+    def world_to_screen(self, camera_x, camera_y, zoom, alpha=1.0):
         """Convertit les coordonnées du monde en coordonnées écran"""
-        screen_x = (self.x - camera_x) * zoom + WINDOW_WIDTH/2
-        screen_y = (self.y - camera_y) * zoom + WINDOW_HEIGHT/2
+        x, y = self.get_render_position(alpha)
+        screen_x = (x - camera_x) * zoom + WINDOW_WIDTH/2
+        screen_y = (y - camera_y) * zoom + WINDOW_HEIGHT/2
         return screen_x, screen_y 
 
-    def is_visible(self, village_x, village_y, towers):
-        """Vérifie si le monstre est visible depuis le village ou une tour"""
+    def is_visible(self, village_x, village_y, towers, tower_grid=None):
+        """Vérifie si le monstre est visible depuis le village ou une tour
+        
+        Avec un index spatial des tours, seules les tours des cellules voisines sont testées.
+        """
         # Vérifier la distance par rapport au village
         dist_to_village = math.sqrt((self.x - village_x)**2 + (self.y - village_y)**2)
         if dist_to_village <= MAX_VISIBILITY_RANGE:
             return True
+        
+        if tower_grid is not None:
+            towers = tower_grid.query_candidates(self.x, self.y, tower_grid.max_radius)
             
         # Vérifier la distance par rapport aux tours
         for tower in towers:
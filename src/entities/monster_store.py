@@ -0,0 +1,381 @@
+import math
+import random
+
+import numpy as np
+
+from ..constants import (
+    LIGHT_RADIUS, LIGHT_MAX_POWER, MAX_FLEE_TIME, TOWER_SIZE, VILLAGE_SIZE,
+    FLEE_DISTANCE_MIN, FLEE_DISTANCE_MAX, WORLD_SIZE
+)
+from .monster import Monster
+
+# Valeurs spéciales de `target_index`
+NO_TARGET = -2
+VILLAGE_TARGET = -1
+
+
+def _array_property(name):
+    """Attribut de monstre stocké dans un tableau du `MonsterStore`"""
+    def getter(self):
+        return getattr(self._store, name)[self._index]
+
+    def setter(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(getter, setter)
+
+
+def _optional_array_property(name):
+    """Comme `_array_property`, avec NaN pour représenter None"""
+    def getter(self):
+        value = getattr(self._store, name)[self._index]
+        return None if math.isnan(value) else value
+
+    def setter(self, value):
+        getattr(self._store, name)[self._index] = np.nan if value is None else value
+
+    return property(getter, setter)
+
+
+class BatchedMonster(Monster):
+    """Vue légère sur une ligne du `MonsterStore`.
+
+    Expose la même interface que `Monster` (dessin, ciblage des tours,
+    projectiles) mais l'état dynamique vit dans les tableaux du store.
+    """
+
+    x = _array_property('x')
+    y = _array_property('y')
+    prev_x = _array_property('prev_x')
+    prev_y = _array_property('prev_y')
+    direction = _array_property('direction')
+    rotation_speed = _array_property('rotation_speed')
+    speed = _array_property('speed')
+    current_health = _array_property('health')
+    shield = _array_property('shield')
+    current_damage = _array_property('damage')
+    attack_speed = _array_property('attack_speed')
+    light_fear = _array_property('light_fear')
+    is_dead = _array_property('dead')
+    is_fleeing = _array_property('fleeing')
+    flee_time = _array_property('flee_time')
+    flee_target_x = _optional_array_property('flee_target_x')
+    flee_target_y = _optional_array_property('flee_target_y')
+
+    def __init__(self, store, index, monster_type, x, y, game, initial_direction=0):
+        self._store = store
+        self._index = index
+        super().__init__(monster_type, x, y, game, initial_direction)
+
+    @property
+    def current_target(self):
+        target_index = self._store.target_index[self._index]
+        return self._store.towers[target_index] if target_index >= 0 else None
+
+    @current_target.setter
+    def current_target(self, tower):
+        if tower is None:
+            if self._store.target_index[self._index] >= 0:
+                self._store.target_index[self._index] = NO_TARGET
+        else:
+            self._store.target_index[self._index] = self._store.tower_index(tower)
+
+    @property
+    def current_target_type(self):
+        target_index = self._store.target_index[self._index]
+        if target_index == VILLAGE_TARGET:
+            return 'village'
+        return 'tower' if target_index >= 0 else None
+
+    @current_target_type.setter
+    def current_target_type(self, target_type):
+        if target_type == 'village':
+            self._store.target_index[self._index] = VILLAGE_TARGET
+        elif target_type is None:
+            self._store.target_index[self._index] = NO_TARGET
+
+
+class MonsterStore:
+    """Stockage des monstres en structure de tableaux NumPy contigus.
+
+    Un seul appel à `update` fait avancer tous les monstres : orientation
+    bornée par `rotation_speed`, terrain, fuite et peur de la lumière.
+    """
+
+    FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'direction', 'rotation_speed', 'speed',
+                    'health', 'shield', 'damage', 'attack_speed', 'light_fear', 'flee_time',
+                    'flee_target_x', 'flee_target_y', 'target_village_chance')
+    BOOL_FIELDS = ('dead', 'fleeing')
+
+    def __init__(self, game, capacity=256):
+        self.game = game
+        self.count = 0
+        self.capacity = capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in self.BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool))
+        self.target_index = np.full(capacity, NO_TARGET, dtype=np.int32)
+        self.monsters = []  # Vues, dans le même ordre que les lignes des tableaux
+        self.towers = []  # Tours référencées par `target_index`
+        # Générateur dérivé de `random` pour que `random.seed` rende la simulation reproductible
+        self.rng = np.random.default_rng(random.getrandbits(32))
+
+    def _grow(self):
+        """Double la capacité des tableaux"""
+        new_capacity = self.capacity * 2
+        for name in self.FLOAT_FIELDS + self.BOOL_FIELDS + ('target_index',):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.target_index[self.capacity:] = NO_TARGET
+        self.capacity = new_capacity
+
+    def spawn(self, monster_type, x, y, initial_direction=0):
+        """Ajoute un monstre et renvoie sa vue"""
+        if self.count == self.capacity:
+            self._grow()
+        index = self.count
+        self.count += 1
+        self.target_index[index] = NO_TARGET
+        self.flee_target_x[index] = np.nan
+        self.flee_target_y[index] = np.nan
+        monster = BatchedMonster(self, index, monster_type, x, y, self.game, initial_direction)
+        self.target_village_chance[index] = monster.target_village_chance
+        self.monsters.append(monster)
+        return monster
+
+    def save_previous_positions(self):
+        """Copie les positions courantes pour l'interpolation du rendu"""
+        self.prev_x[:self.count] = self.x[:self.count]
+        self.prev_y[:self.count] = self.y[:self.count]
+
+    def remove_dead(self):
+        """Compacte les tableaux en retirant les monstres morts, renvoie les vues retirées"""
+        n = self.count
+        dead = self.dead[:n]
+        if not dead.any():
+            return []
+        alive = np.flatnonzero(~dead)
+        removed = [self.monsters[i] for i in np.flatnonzero(dead).tolist()]
+        for name in self.FLOAT_FIELDS + self.BOOL_FIELDS + ('target_index',):
+            array = getattr(self, name)
+            array[:len(alive)] = array[alive]
+        self.count = len(alive)
+        # `monsters` est modifiée sur place : d'autres objets en gardent une référence
+        self.monsters[:] = [self.monsters[i] for i in alive.tolist()]
+        for index, monster in enumerate(self.monsters):
+            monster._index = index
+        return removed
+
+    def clear(self):
+        self.count = 0
+        self.monsters.clear()
+        self.towers = []
+
+    def tower_index(self, tower):
+        """Index d'une tour dans la liste de référence, ajoutée si nécessaire"""
+        for index, known in enumerate(self.towers):
+            if known is tower:
+                return index
+        self.towers.append(tower)
+        return len(self.towers) - 1
+
+    def sync_towers(self, towers):
+        """Ré-indexe les cibles si la liste des tours a changé.
+
+        Les monstres dont la tour a disparu perdent leur cible, comme
+        `current_target not in towers` dans `Monster.update_normal_behavior`.
+        """
+        if len(towers) == len(self.towers) and all(a is b for a, b in zip(towers, self.towers)):
+            return
+        new_positions = {id(tower): index for index, tower in enumerate(towers)}
+        remap = np.array([new_positions.get(id(tower), NO_TARGET) for tower in self.towers] + [0],
+                         dtype=np.int32)
+        targets = self.target_index[:self.count]
+        has_tower = targets >= 0
+        targets[has_tower] = remap[targets[has_tower]]
+        self.towers = list(towers)
+
+    def _tower_positions(self):
+        tower_x = np.array([tower.x for tower in self.towers], dtype=np.float64)
+        tower_y = np.array([tower.y for tower in self.towers], dtype=np.float64)
+        return tower_x, tower_y
+
+    def _target_positions(self, indices, village_x, village_y, tower_x, tower_y):
+        targets = self.target_index[indices]
+        on_tower = targets >= 0
+        safe = np.where(on_tower, targets, 0)
+        if len(self.towers):
+            target_x = np.where(on_tower, tower_x[safe], village_x)
+            target_y = np.where(on_tower, tower_y[safe], village_y)
+        else:
+            target_x = np.full(len(indices), float(village_x))
+            target_y = np.full(len(indices), float(village_y))
+        return target_x, target_y, on_tower
+
+    def _choose_targets(self, indices, tower_x, tower_y):
+        """Version vectorisée de `Monster.choose_new_target`"""
+        if len(indices) == 0:
+            return
+        go_village = self.rng.random(len(indices)) < self.target_village_chance[indices]
+        if len(self.towers) == 0:
+            self.target_index[indices] = VILLAGE_TARGET
+            return
+        dist_sq = ((tower_x[None, :] - self.x[indices, None]) ** 2 +
+                   (tower_y[None, :] - self.y[indices, None]) ** 2)
+        closest = np.argmin(dist_sq, axis=1).astype(np.int32)
+        self.target_index[indices] = np.where(go_village, VILLAGE_TARGET, closest)
+
+    def _start_fleeing(self, indices, light_position, tower_x, tower_y):
+        """Version vectorisée de `Monster.start_fleeing`"""
+        if len(indices) == 0:
+            return
+        x = self.x[indices]
+        y = self.y[indices]
+        targets = self.target_index[indices]
+        # Fuir à l'opposé de la tour ciblée, sinon à l'opposé de la lumière
+        on_tower = targets >= 0
+        safe = np.where(on_tower, targets, 0)
+        if len(self.towers):
+            from_x = np.where(on_tower, tower_x[safe], light_position[0])
+            from_y = np.where(on_tower, tower_y[safe], light_position[1])
+        else:
+            from_x = np.full(len(indices), float(light_position[0]))
+            from_y = np.full(len(indices), float(light_position[1]))
+        dx = x - from_x
+        dy = y - from_y
+        distance = np.sqrt(dx * dx + dy * dy)
+        flee_distance = self.rng.uniform(FLEE_DISTANCE_MIN, FLEE_DISTANCE_MAX, len(indices))
+        random_angle = self.rng.uniform(0, 2 * math.pi, len(indices))
+        on_spot = distance <= 0
+        safe_distance = np.where(on_spot, 1.0, distance)
+        dx = np.where(on_spot, np.cos(random_angle), dx / safe_distance) * flee_distance
+        dy = np.where(on_spot, np.sin(random_angle), dy / safe_distance) * flee_distance
+
+        self.flee_target_x[indices] = np.clip(x + dx, 0, WORLD_SIZE)
+        self.flee_target_y[indices] = np.clip(y + dy, 0, WORLD_SIZE)
+        self.flee_time[indices] = MAX_FLEE_TIME * self.light_fear[indices] / 100.0
+        self.fleeing[indices] = True
+        self.target_index[indices] = NO_TARGET
+
+    def _move(self, indices, dx, dy, delta_time, flee_multiplier):
+        """Version vectorisée de `Monster.move_towards_target`"""
+        if len(indices) == 0:
+            return
+        direction = self.direction[indices]
+        target_direction = np.arctan2(dy, dx)
+        angle_diff = (target_direction - direction + math.pi) % (2 * math.pi) - math.pi
+        max_rotation = self.rotation_speed[indices] * delta_time
+        direction = np.where(np.abs(angle_diff) > max_rotation,
+                             direction + np.where(angle_diff > 0, max_rotation, -max_rotation),
+                             target_direction)
+        self.direction[indices] = direction
+
+        terrain_multiplier = self.game.get_terrain_speed_multipliers(self.x[indices], self.y[indices])
+        move_speed = self.speed[indices] * flee_multiplier * terrain_multiplier * delta_time
+        self.x[indices] += np.cos(direction) * move_speed
+        self.y[indices] += np.sin(direction) * move_speed
+
+    def update(self, towers, village_x, village_y, delta_time,
+               light_position=None, light_active=False, light_power=0):
+        """Met à jour tous les monstres, équivalent à `Monster.update` pour chacun"""
+        n = self.count
+        if n == 0:
+            return
+        self.sync_towers(towers)
+        tower_x, tower_y = self._tower_positions()
+
+        # Monstres déjà en fuite
+        fleeing = self.fleeing[:n].copy()
+        flee_indices = np.flatnonzero(fleeing)
+        self.flee_time[flee_indices] -= delta_time
+        ended = flee_indices[self.flee_time[flee_indices] <= 0]
+        self.fleeing[ended] = False
+        self.flee_target_x[ended] = np.nan
+        self.flee_target_y[ended] = np.nan
+        self.target_index[ended] = NO_TARGET
+
+        running = flee_indices[self.flee_time[flee_indices] > 0]
+        flee_dx = self.flee_target_x[running] - self.x[running]
+        flee_dy = self.flee_target_y[running] - self.y[running]
+        far = np.sqrt(flee_dx * flee_dx + flee_dy * flee_dy) > 5
+        self._move(running[far], flee_dx[far], flee_dy[far], delta_time, flee_multiplier=2)
+
+        # Peur de la lumière
+        normal = ~fleeing
+        if light_active and light_position and light_power > 0:
+            candidates = np.flatnonzero(normal)
+            dist_to_light = np.sqrt((light_position[0] - self.x[candidates]) ** 2 +
+                                    (light_position[1] - self.y[candidates]) ** 2)
+            light_intensity = (1.0 - dist_to_light / LIGHT_RADIUS) * (light_power / LIGHT_MAX_POWER)
+            light_sensitivity = self.light_fear[candidates] / 100.0
+            flee_probability = light_intensity * light_sensitivity
+            scared = (dist_to_light < LIGHT_RADIUS) & (
+                (flee_probability > 0.2) | ((light_sensitivity > 0.5) & (flee_probability > 0.1)))
+            scared_indices = candidates[scared]
+            self._start_fleeing(scared_indices, light_position, tower_x, tower_y)
+            normal[scared_indices] = False
+
+        # Comportement normal : une cible village ou absente est re-choisie, comme `not self.current_target`
+        normal_indices = np.flatnonzero(normal)
+        self._choose_targets(normal_indices[self.target_index[normal_indices] < 0], tower_x, tower_y)
+
+        target_x, target_y, on_tower = self._target_positions(
+            normal_indices, village_x, village_y, tower_x, tower_y)
+        dx = target_x - self.x[normal_indices]
+        dy = target_y - self.y[normal_indices]
+        distance = np.sqrt(dx * dx + dy * dy)
+        far = distance > 5
+        self._move(normal_indices[far], dx[far], dy[far], delta_time, flee_multiplier=1)
+
+        # Attaque des tours au contact (distance avant déplacement, comme `handle_attack`)
+        attacking = normal_indices[on_tower & (distance < TOWER_SIZE)]
+        self._damage_towers(attacking, delta_time)
+
+    def _damage_towers(self, attacking, delta_time):
+        """Applique les dégâts des monstres `attacking` à leur tour ciblée.
+
+        Renvoie les index des tours détruites ; leurs attaquants perdent leur cible.
+        """
+        destroyed = []
+        if len(attacking) == 0:
+            return destroyed
+        targets = self.target_index[attacking]
+        damage = self.damage[attacking] * delta_time * self.attack_speed[attacking]
+        per_tower = np.bincount(targets, weights=damage, minlength=len(self.towers))
+        for tower_index in np.flatnonzero(per_tower).tolist():
+            if self.towers[tower_index].take_damage(per_tower[tower_index]):
+                destroyed.append(tower_index)
+        if destroyed:
+            lost = attacking[np.isin(targets, destroyed)]
+            self.target_index[lost] = NO_TARGET
+        return destroyed
+
+    def resolve_attacks(self, village_x, village_y, delta_time):
+        """Attaques après déplacement, équivalent à la boucle de `Simulation.step`.
+
+        Returns:
+            (tours détruites, dégâts infligés au village)
+        """
+        n = self.count
+        if n == 0:
+            return [], 0.0
+        targets = self.target_index[:n]
+        tower_x, tower_y = self._tower_positions()
+
+        on_tower = np.flatnonzero(targets >= 0)
+        destroyed = []
+        if len(on_tower):
+            tower_targets = targets[on_tower]
+            dist_sq = ((tower_x[tower_targets] - self.x[on_tower]) ** 2 +
+                       (tower_y[tower_targets] - self.y[on_tower]) ** 2)
+            destroyed = [self.towers[index] for index in
+                         self._damage_towers(on_tower[dist_sq < TOWER_SIZE ** 2], delta_time)]
+
+        on_village = np.flatnonzero(targets == VILLAGE_TARGET)
+        dist_sq = (village_x - self.x[on_village]) ** 2 + (village_y - self.y[on_village]) ** 2
+        attackers = on_village[dist_sq < VILLAGE_SIZE ** 2]
+        village_damage = float(np.sum(self.damage[attackers] * delta_time * self.attack_speed[attackers]))
+        return destroyed, village_damage
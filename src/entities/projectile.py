@@ -6,6 +6,8 @@ class Projectile:
     def __init__(self, start_x, start_y, target, damage, color, speed=PROJECTILE_SPEED):
         self.x = start_x
         self.y = start_y
+        self.prev_x = start_x  # Position au pas précédent, pour l'interpolation du rendu
+        self.prev_y = start_y
         self.target = target
         self.damage = damage
         self.color = color
@@ -32,10 +34,16 @@ class Projectile:
             return True
         return False
 
-    def draw(self, screen, camera_x, camera_y, zoom):
-        """Dessine le projectile"""
-        screen_x = (self.x - camera_x) * zoom + WINDOW_WIDTH/2
-        screen_y = (self.y - camera_y) * zoom + WINDOW_HEIGHT/2
+    def get_render_position(self, alpha=1.0):
+        """Position interpolée entre le pas précédent (alpha=0) et le pas courant (alpha=1)"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def draw(self, screen, camera_x, camera_y, zoom, alpha=1.0):
+        """Dessine le projectile, interpolé entre les deux derniers pas selon `alpha`"""
+        x, y = self.get_render_position(alpha)
+        screen_x = (x - camera_x) * zoom + WINDOW_WIDTH/2
+        screen_y = (y - camera_y) * zoom + WINDOW_HEIGHT/2
         
         pygame.draw.circle(screen, self.color, 
                          (int(screen_x), int(screen_y)), 
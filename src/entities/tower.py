@@ -48,8 +48,15 @@ class Tower:
             self.is_dead = True
         return self.current_health <= 0
 
-    def find_target(self, monsters):
-        """Trouve une cible parmi les monstres à portée"""
+    def find_target(self, monsters, grid=None, order=None):
+        """Trouve une cible parmi les monstres à portée
+        
+        Si un index spatial est fourni, seules les cellules voisines sont parcourues
+        (voir `candidates`).
+        """
+        if grid is not None:
+            monsters = self.candidates(grid, order)
+        
         if self.target and self.target in monsters:  # Garder la cible actuelle si toujours valide
             dist = math.sqrt((self.target.x - self.x)**2 + (self.target.y - self.y)**2)
             if dist <= self.vision_range:
@@ -68,12 +75,15 @@ class Tower:
         self.target = closest_monster
         return closest_monster
 
-    def find_targets(self, monsters):
+    def find_targets(self, monsters, grid=None, order=None):
         """Trouve plusieurs cibles pour la tour jaune"""
         if self.tower_type != TowerType.WEAK:
-            target = self.find_target(monsters)
+            target = self.find_target(monsters, grid, order)
             return [target] if target else []
 
+        if grid is not None:
+            monsters = self.candidates(grid, order)
+
         targets = []
         for monster in monsters:
             dist = math.sqrt((monster.x - self.x)**2 + (monster.y - self.y)**2)
@@ -81,6 +91,20 @@ class Tower:
                 targets.append(monster)
         return targets
 
+    def candidates(self, grid, order):
+        """Monstres à portée de vision trouvés par l'index spatial.
+
+        La grille les renvoie dans l'ordre de ses cellules ; ils sont remis
+        dans l'ordre de la liste des monstres (`order` : id -> position), pour
+        que le choix des cibles soit le même qu'en parcourant toute la liste.
+        """
+        range_sq = self.vision_range * self.vision_range
+        in_range = [monster for monster in grid.query_candidates(self.x, self.y, self.vision_range)
+                    if (monster.x - self.x)**2 + (monster.y - self.y)**2 <= range_sq]
+        if order is not None and len(in_range) > 1:
+            in_range.sort(key=lambda monster: order[id(monster)])
+        return in_range
+
     def attack(self, monsters, delta_time):
         # Réinitialiser l'état de tir
         self.is_firing = False
@@ -117,8 +141,8 @@ class Tower:
             elif projectile.target.is_dead:  # Si la cible est morte avant l'impact
                 self.projectiles.remove(projectile)
 
-    def draw(self, screen, camera_x, camera_y, zoom, show_ranges=False):
-        """Dessine la tour et ses effets"""
+    def draw(self, screen, camera_x, camera_y, zoom, show_ranges=False, overlay=None):
+        """Dessine la tour et ses effets (portées dans le calque `overlay`)"""
         screen_x, screen_y = self.world_to_screen(camera_x, camera_y, zoom)
         
         # Déterminer la couleur de la tour
@@ -126,20 +150,16 @@ class Tower:
                GREEN if self.tower_type == TowerType.MEDIUM else YELLOW
         
         # Dessiner les zones d'attaque si activé
-        if show_ranges:
-            range_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            
-            # Dessiner le cercle de vision
+        if show_ranges and overlay is not None:
             vision_radius = int(self.vision_range * zoom)
-            pygame.draw.circle(range_surface, (*color, RANGE_ALPHA//2),
-                             (int(screen_x), int(screen_y)), vision_radius)
-            
-            # Dessiner le cercle d'attaque
             attack_radius = int(self.attack_range * zoom)
-            pygame.draw.circle(range_surface, (*color, RANGE_ALPHA),
-                             (int(screen_x), int(screen_y)), attack_radius)
             
-            screen.blit(range_surface, (0, 0))
+            # Dessiner l'anneau de vision autour du cercle d'attaque
+            overlay.circle((*color, RANGE_ALPHA//2), (screen_x, screen_y), vision_radius,
+                           max(0, vision_radius - attack_radius))
+            
+            # Dessiner le cercle d'attaque
+            overlay.circle((*color, RANGE_ALPHA), (screen_x, screen_y), attack_radius)
         
         # Dessiner la tour
         pygame.draw.circle(screen, color, 
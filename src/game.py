@@ -1,30 +1,31 @@
-# Anciens imports dans main.py
-from enum import Enum, auto
-import json
-import os
-import math
-import random
-from dataclasses import dataclass
-from typing import List, Dict
-import time
-
-# Nouveaux imports dans src/game.py
 import pygame
 import sys
 import json
 import os
 import math
-import random
 import time
-from typing import List, Dict
 
 from src.constants import *
 from src.enums import GameMode, TowerType, MonsterType
-from src.entities import Tower, Monster, Explosion
-from src.managers import WaveManager, Wave
-from src.score_management import ScoreManager
+from src.entities import Tower
+from src.managers import AssetManager, LazyAssets, AudioManager
+from src.rendering import (SpriteCache, TiledLayer, LightingBuffer, OverlayLayer, TextRenderer, RetainedPanel,
+                           SpriteBatch, SpriteAtlas, terrain_heatmap)
+from src.score_management import create_score_manager, SCORE_BOARDS
+from src.simulation import Simulation
+from src.map_cache import BACKGROUND_PATH, load_terrain, load_background_levels, load_sprite_atlas
+from src.terrain import SPEED_MASK_PATH
+from src.audio_cache import load_pcm, load_sound as load_cached_sound
+from src.snapshot import Autosaver
+
+class Game(Simulation):
+    # Titre du panneau pour chaque classement de SCORE_BOARDS
+    LEADERBOARD_TITLES = {
+        "all": "Meilleurs Scores",
+        "day": "Meilleurs Scores du jour",
+        "week": "Meilleurs Scores de la semaine",
+    }
 
-class Game:
     def __init__(self):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -45,28 +46,40 @@ class Game:
         self.music_enabled = True
         self.music_volume = 0.1  # Volume plus bas que les effets sonores
         self.voices_enabled = True  # Option pour activer/désactiver les voix
-        
+
+        # Ressources décodées sur un pool de threads pendant l'écran de chargement
+        self.start_time = time.perf_counter()
+        self.assets = AssetManager()
+        self.text = TextRenderer()
+        terrain = self.assets.load('terrain', load_terrain, SPEED_MASK_PATH, TERRAIN_GRID_RESOLUTION)
+        background = self.assets.load('background', load_background_levels, BACKGROUND_PATH, BACKGROUND_TILE_SIZE, False,
+                                      finalize=lambda levels: [level.convert() for level in levels])
+        # Tours, village et monstres regroupés dans une seule image (atlas), relue depuis le cache de carte
+        atlas = self.assets.load('atlas', load_sprite_atlas, self.sprite_sources(), ATLAS_SPRITE_MAX_SIZE, False,
+                                 finalize=SpriteAtlas.converted)
+
         # Chargement des sons
         self.load_sounds()
+
+        # Effets sonores fusionnés par image, sur des canaux réservés ; voix lues par morceaux
+        self.audio = AudioManager(self.sounds)
         
-        # Jouer la voix d'introduction
+        # Jouer la voix d'introduction (dès qu'elle est décodée)
         self.play_voice('intro_voice.mp3')
+
+        self.show_loading_screen([terrain, background, atlas, *self.sounds.handles.values()])
         
-        self.game_mode = GameMode.EDIT
-        self.towers = []
-        self.projectiles = []
+        # État de la simulation (tours, monstres, village, lumière, terrain)
+        super().__init__(terrain=terrain.result(), batched_monsters=BATCHED_MONSTERS)
         
         # Initialisation du gestionnaire de scores
-        self.score_manager = ScoreManager()
-        self.current_score = 0
-        self.final_score = 0  # Nouveau: stockage du score final
+        self.score_manager = create_score_manager()
         self.player_name = "Joueur"
         self.show_leaderboard = False
-        self.game_time = 0.0
-        
-        # Position du village (centre de la carte)
-        self.village_x = WORLD_SIZE // 2
-        self.village_y = WORLD_SIZE // 2
+        self.leaderboard_page = 0  # Page du classement affichée (0 = meilleurs scores)
+        self.leaderboard_board = 0  # Classement affiché (index dans SCORE_BOARDS)
+        self.leaderboard_entries = None  # Page affichée, relue après un changement (voir `get_leaderboard_entries`)
+        self.map_name = DEFAULT_MAP_NAME  # Carte jouée : les classements sont propres à chaque carte
         
         # Initialiser la caméra centrée sur le village
         self.camera_x = self.village_x
@@ -109,57 +122,59 @@ class Game:
         )
         
         self.show_ranges = False
-        self.wave_manager = None
-        self.game_start_time = 0
-        self.monsters = []
         self.show_debug = False
         self.show_speed_debug = False  # Nouveau flag pour le debug de vitesse
-        self.time_acceleration_index = 0
         self.time_accelerated = False
-        self.village_health = VILLAGE_MAX_HEALTH
         self.game_over = False
+        self.is_high_score = False
+        self.entering_name = False
         self.show_names = False
         self.show_monster_ranges = False
-        self.explosions = []  # Liste des explosions en cours
-        self.light_power = LIGHT_MAX_POWER
-        self.light_active = False
-        self.light_position = None
-        self.light_recharge_delay = LIGHT_RECHARGE_DELAY  # Utiliser la constante
-        self.light_recharge_timer = 0.0  # Compte le temps écoulé depuis que la lumière a été déchargée
-        self.light_in_cooldown = False    # Indique si la lumière est en période de délai
         self.show_help = False  # Nouvel attribut pour afficher l'aide
         self.show_grid = False  # Nouvel attribut pour afficher/masquer la grille
 
-        self.background = pygame.image.load('src/assets/background.png').convert()
+        # Fond et ses mips, lus depuis le cache de carte (précalculés au premier lancement)
+        background_levels = background.result()
+        self.background = background_levels[0]
+        self.background_layer = TiledLayer(levels=background_levels)
+        self.terrain_heatmap_layer = None  # Carte des vitesses du debug, créée à la première utilisation
+        self.terrain_heatmap_source = None
 
-        self.tower_sprites = {}
-        self.tower_sprites[TowerType.WEAK] = pygame.image.load('src/assets/tower_weak.png').convert_alpha()
-        self.tower_sprites[TowerType.MEDIUM] = pygame.image.load('src/assets/tower_medium.png').convert_alpha()
-        self.tower_sprites[TowerType.POWERFUL] = pygame.image.load('src/assets/tower_powerful.png').convert_alpha()
+        self.sprite_atlas = atlas.result()
+        self.tower_sprites = {tower_type: self.sprite_atlas.get(f"tower_{tower_type.name.lower()}")
+                              for tower_type in TowerType}
 
         # Village
-        self.village_sprite = pygame.image.load('src/assets/village.png').convert_alpha()
+        self.village_sprite = self.sprite_atlas.get('village')
+
+        # Sprites des monstres
+        self.monster_sprites = self.load_monster_sprites()
+
+        # Sprites redimensionnés par niveau de zoom
+        self.sprite_cache = SpriteCache()
+        self.lighting = LightingBuffer()
+        self.overlay = OverlayLayer()
+        self.sprite_batch = SpriteBatch()
+        
+        # Présentation par rectangles modifiés (modes EDIT et GAME_OVER)
+        self.scene_key = None
+        self.scene_surface = None
+        self.dirty_rects = []
+
+        # Panneaux d'interface recomposés seulement quand leurs entrées changent
+        self.help_panel = RetainedPanel(self.build_help_panel)
+        self.leaderboard_panel = RetainedPanel(self.build_leaderboard_panel)
+        self.tower_panel = RetainedPanel(self.build_tower_panel)
+        self.game_over_panel = RetainedPanel(self.build_game_over_panel)
+
+        # Sauvegarde automatique et points de reprise au début de chaque vague
+        self.autosaver = Autosaver()
+        self.next_autosave_time = 0.0
+        self.wave_snapshots = {}
 
-        # Chargement et préparation de l'image de terrain
-        try:
-            self.speed_mask = pygame.image.load("src/assets/speedmask.png").convert()
-            # Mise à l'échelle si nécessaire pour correspondre à WORLD_SIZE
-            if self.speed_mask.get_width() != WORLD_SIZE or self.speed_mask.get_height() != WORLD_SIZE:
-                self.speed_mask = pygame.transform.scale(self.speed_mask, (WORLD_SIZE, WORLD_SIZE))
-        except FileNotFoundError:
-            print("Warning: speedmask.png not found in assets folder. Using default speedmask.")
-            self.speed_mask = pygame.Surface((WORLD_SIZE, WORLD_SIZE))
-            self.speed_mask.fill((255, 255, 255))  # Terrain blanc par défaut
-        
-        # Création d'un array numpy pour accès rapide aux pixels
-        self.terrain_array = pygame.surfarray.array2d(self.speed_mask)
-        
         # Charger la sauvegarde si elle existe
         self.load_map()
         
-        # Initialisation des sprites des monstres
-        self.monster_sprites = self.load_monster_sprites()
-        
         # S'assurer que les dimensions actuelles sont correctes
         self.current_width, self.current_height = self.screen.get_size()
         self.update_ui_positions()
@@ -170,6 +185,27 @@ class Game:
         screen_y = (y - self.camera_y) * self.zoom + self.center_y
         return screen_x, screen_y
 
+    def get_terrain_heatmap_layer(self):
+        """Couche de la carte des vitesses, reconstruite seulement si le terrain a changé"""
+        if self.terrain_heatmap_source is not self.terrain:
+            self.terrain_heatmap_layer = TiledLayer(terrain_heatmap(self.terrain))
+            self.terrain_heatmap_source = self.terrain
+        return self.terrain_heatmap_layer
+
+    def get_view_bounds(self, margin=0.0):
+        """Rectangle du monde visible à l'écran (gauche, haut, droite, bas), élargi de `margin` unités du monde"""
+        left = self.camera_x - self.center_x / self.zoom - margin
+        top = self.camera_y - self.center_y / self.zoom - margin
+        right = self.camera_x + (self.current_width - self.center_x) / self.zoom + margin
+        bottom = self.camera_y + (self.current_height - self.center_y) / self.zoom + margin
+        return left, top, right, bottom
+
+    @staticmethod
+    def is_in_view(bounds, x, y, radius=0.0):
+        """Vérifie si un disque de rayon `radius` centré sur (x, y) recoupe le rectangle `bounds`"""
+        left, top, right, bottom = bounds
+        return left - radius <= x <= right + radius and top - radius <= y <= bottom + radius
+
     def screen_to_world(self, screen_x, screen_y):
         """Convertit les coordonnées écran en coordonnées du monde"""
         world_x = (screen_x - self.center_x) / self.zoom + self.camera_x
@@ -206,10 +242,10 @@ class Game:
 
     def start_game(self):
         """Démarre le mode jeu"""
-        self.game_mode = GameMode.PLAY
-        self.wave_manager = WaveManager(self.village_x, self.village_y, self)
-        self.game_start_time = time.time()
-        self.monsters = []
+        self.start_simulation()
+        self.wave_snapshots = {}
+        self.next_autosave_time = 0.0
+        self.autosaver.reset()
         
         # Arrêter les voix en cours
         self.stop_voice()
@@ -250,26 +286,16 @@ class Game:
             with open(SAVE_FILE, 'r') as f:
                 save_data = json.load(f)
                 
-            # Réinitialiser les tours
-            self.towers = []
-            
             # Recréer les tours depuis la sauvegarde
-            for tower_data in save_data['towers']:
-                tower_type = TowerType(tower_data['type'])
-                self.towers.append(Tower(tower_type, tower_data['x'], tower_data['y']))
-                
+            for tower in self.load_layout(save_data):
                 # Mettre à jour le compteur de tours disponibles
                 for tower_info in self.available_towers:
-                    if tower_info['type'] == tower_type:
+                    if tower_info['type'] == tower.tower_type:
                         tower_info['count'] -= 1
                         
         except Exception as e:
             print(f"Erreur lors du chargement: {e}")
 
-    def create_explosion(self, x, y, max_radius, color):
-        """Crée une nouvelle explosion"""
-        self.explosions.append(Explosion(x, y, max_radius, EXPLOSION_DURATION, color))
-
     def handle_input(self):
         self.mouse_x, self.mouse_y = pygame.mouse.get_pos()
         
@@ -384,8 +410,7 @@ class Game:
                         if self.temp_player_name.strip():
                             self.player_name = self.temp_player_name.strip()
                             if self.is_high_score:
-                                waves_completed = self.wave_manager.current_wave if self.wave_manager else 0
-                                self.score_manager.add_score(self.player_name, self.final_score, self.game_time, waves_completed)
+                                self.save_score()
                         self.entering_name = False
                     elif event.key == pygame.K_BACKSPACE:
                         self.temp_player_name = self.temp_player_name[:-1]
@@ -421,6 +446,10 @@ class Game:
                     self.voices_enabled = not self.voices_enabled
                     if not self.voices_enabled:
                         self.stop_voice()
+                elif event.key == pygame.K_F9 and self.game_mode == GameMode.PLAY:
+                    self.retry_wave()
+                elif event.key == pygame.K_F10:
+                    self.load_autosave()
                 elif event.key == pygame.K_F11:
                     self.toggle_fullscreen()
                     WINDOW_WIDTH = pygame.display.get_surface().get_width()
@@ -431,6 +460,23 @@ class Game:
 
                 elif event.key == pygame.K_l:  # Touche L pour afficher/masquer le leaderboard
                     self.show_leaderboard = not self.show_leaderboard
+                    self.leaderboard_page = 0
+                    self.leaderboard_entries = None
+                elif event.key == pygame.K_TAB and self.show_leaderboard:
+                    # Classement suivant : tout l'historique, jour, semaine
+                    self.leaderboard_board = (self.leaderboard_board + 1) % len(SCORE_BOARDS)
+                    self.leaderboard_page = 0
+                    self.leaderboard_entries = None
+                elif event.key == pygame.K_PAGEDOWN and self.show_leaderboard:
+                    # Page suivante, seulement s'il reste des scores à afficher
+                    board = SCORE_BOARDS[self.leaderboard_board]
+                    if (self.leaderboard_page + 1) * LEADERBOARD_SIZE < self.score_manager.count_board(board, self.map_name):
+                        self.leaderboard_page += 1
+                        self.leaderboard_entries = None
+                elif event.key == pygame.K_PAGEUP and self.show_leaderboard:
+                    if self.leaderboard_page > 0:
+                        self.leaderboard_page -= 1
+                        self.leaderboard_entries = None
                 elif event.key == pygame.K_SPACE and self.game_mode == GameMode.GAME_OVER and not self.entering_name:
                     self.reset_game()
                     self.show_leaderboard = False
@@ -447,17 +493,8 @@ class Game:
         mouse_buttons = pygame.mouse.get_pressed()
         if mouse_buttons[2] and self.game_mode == GameMode.PLAY:
             mouse_world_pos = self.screen_to_world(self.mouse_x, self.mouse_y)
-            dist_to_village = math.sqrt((mouse_world_pos[0] - self.village_x)**2 + 
-                                      (mouse_world_pos[1] - self.village_y)**2)
-            
-            # Vérifier aussi la distance aux tours
-            is_in_valid_zone = dist_to_village <= LIGHT_MAX_RANGE
-            for tower in self.towers:
-                dist_to_tower = math.sqrt((mouse_world_pos[0] - tower.x)**2 + 
-                                        (mouse_world_pos[1] - tower.y)**2)
-                if dist_to_tower <= tower.vision_range:
-                    is_in_valid_zone = True
-                    break
+            # Près du village ou dans la vision d'une tour
+            is_in_valid_zone = self.visibility.in_light_zone(*mouse_world_pos)
             
             # Ne pas activer la lumière si la puissance est épuisée ou en délai de recharge
             if is_in_valid_zone and self.light_power > 0 and not self.light_in_cooldown:
@@ -485,147 +522,107 @@ class Game:
         
         return True
 
-    def update(self):
-        """Mise à jour de la logique du jeu"""
-        if self.game_mode == GameMode.PLAY:
-            current_time = time.time() - self.game_start_time
-            self.game_time = current_time
-            
-            # Calculer le delta_time en fonction de l'accélération
-            base_delta = 1 / FPS
-            delta_time = base_delta * TIME_ACCELERATIONS[self.time_acceleration_index]
-            
-            # Spawn des nouveaux monstres
-            new_monster = self.wave_manager.update(current_time)
-            if new_monster:
-                self.monsters.append(new_monster)
-            
-            # Mise à jour des tours et de leurs projectiles
-            for tower in self.towers:
-                targets = tower.find_targets(self.monsters)
-                tower.attack(targets, delta_time)
-                tower.update_projectiles(delta_time)
-                # Jouer le son quand la tour tire
-                if tower.is_firing:
-                    self.play_sound('tower_fire')
-                    # Ajouter des points pour chaque tir de tour
-                    self.current_score += 1
-            
-            # Mise à jour des monstres et nettoyage des morts
-            dead_monsters = [monster for monster in self.monsters if monster.is_dead]
-            self.monsters = [monster for monster in self.monsters if not monster.is_dead]
-            
-            # Jouer le son pour chaque monstre mort
-            for dead_monster in dead_monsters:
-                self.play_sound('monster_death')
-                # Ajouter des points pour chaque monstre tué en fonction de sa difficulté
-                score_gain = 0
-                if dead_monster.monster_type == MonsterType.SKELETON:
-                    score_gain = 10
-                elif dead_monster.monster_type == MonsterType.WOLF:
-                    score_gain = 15
-                elif dead_monster.monster_type == MonsterType.MORAY:
-                    score_gain = 20
-                elif dead_monster.monster_type == MonsterType.VARAN:
-                    score_gain = 25
-                elif dead_monster.monster_type == MonsterType.FIRE_SKELETON:
-                    score_gain = 25
-                elif dead_monster.monster_type == MonsterType.SMALL_SPIRIT:
-                    score_gain = 30
-                elif dead_monster.monster_type == MonsterType.WITCH:
-                    score_gain = 40
-                elif dead_monster.monster_type == MonsterType.KAMIKAZE:
-                    score_gain = 35
-                elif dead_monster.monster_type == MonsterType.GIANT_WOLF:
-                    score_gain = 50
-                elif dead_monster.monster_type == MonsterType.DRAGON:
-                    score_gain = 100
-                else:
-                    score_gain = 10
-                
-                self.current_score += score_gain
-            
-            for monster in self.monsters:
-                # Ne passer la lumière active aux monstres que si sa puissance est supérieure à 0
-                light_active_for_monster = self.light_active and self.light_power > 0
-                
-                # Ne pas ajuster la puissance de la lumière en fonction du zoom pour les monstres
-                # Le zoom ne devrait affecter que le rendu visuel, pas la logique du jeu
-                monster.update(self.towers, self.village_x, self.village_y, delta_time,
-                             self.light_position, light_active_for_monster, self.light_power)
-                
-                # Vérifier les attaques
-                if monster.current_target_type == 'tower' and monster.current_target:
-                    dist = math.sqrt((monster.current_target.x - monster.x)**2 + 
-                                   (monster.current_target.y - monster.y)**2)
-                    
-                    if dist < TOWER_SIZE:  # Si le monstre est assez proche de la tour
-                        if monster.current_target.take_damage(
-                            monster.current_damage * delta_time * monster.attack_speed):
-                            # Si la tour est détruite
-                            self.towers.remove(monster.current_target)
-                            monster.current_target = None
-                            monster.current_target_type = None
-                            self.play_sound('tower_destroyed')  # Jouer le son de destruction
-                            # Perdre des points quand une tour est détruite
-                            self.current_score = max(0, self.current_score - 50)
-                
-                elif monster.current_target_type == 'village':
-                    dist = math.sqrt((self.village_x - monster.x)**2 + 
-                                   (self.village_y - monster.y)**2)
-                    
-                    if dist < VILLAGE_SIZE:  # Si le monstre est assez proche du village
-                        # Infliger des dégâts au village
-                        self.village_health -= monster.current_damage * delta_time * monster.attack_speed
-                        
-                        if self.village_health <= 0:
-                            self.play_sound('game_over')  # Jouer le son de game over
-                            # Gérer le score final et vérifier s'il s'agit d'un high score
-                            self.handle_game_over()
+    def draw(self):
+        """Dessine une image.
 
-            # Mise à jour des explosions
-            self.explosions = [exp for exp in self.explosions if not exp.finished]
-            for explosion in self.explosions:
-                explosion.update(delta_time)
+        En mode EDIT et GAME_OVER, la scène ne change qu'au gré des actions du
+        joueur : elle est gardée en mémoire et seuls les éléments qui suivent
+        la souris ou clignotent sont redessinés, avec `pygame.display.update`
+        limité aux rectangles modifiés. Tout changement de la scène (caméra,
+        tours, panneaux...) provoque un dessin complet.
 
-            # Mise à jour de la puissance de la lumière
-            if self.light_active:
-                self.light_power = max(0, self.light_power - LIGHT_DRAIN_RATE * delta_time)
-                # Désactiver automatiquement la lumière si la puissance atteint zéro
-                if self.light_power <= 0:
-                    self.light_active = False
-                    self.light_position = None
-                    self.light_in_cooldown = True  # Activer le délai de recharge
-                    self.light_recharge_timer = 0.0  # Réinitialiser le timer
-                    self.play_sound('light_off')  # Jouer un son quand la lumière s'éteint automatiquement
-            else:
-                # Gestion du délai de recharge
-                if self.light_in_cooldown:
-                    self.light_recharge_timer += delta_time
-                    if self.light_recharge_timer >= self.light_recharge_delay:
-                        self.light_in_cooldown = False  # Fin du délai de recharge
-                else:
-                    # Recharge normale seulement si on n'est pas en délai
-                    self.light_power = min(LIGHT_MAX_POWER, self.light_power + LIGHT_RECHARGE_RATE * delta_time)
+        Les panneaux (`draw_panels`) restent au-dessus des éléments dynamiques :
+        ils ne font pas partie de la scène gardée et sont redessinés sur les
+        rectangles modifiés.
+        """
+        if self.game_mode not in (GameMode.EDIT, GameMode.GAME_OVER):
+            self.scene_key = None
+            self.draw_scene()
+            self.draw_dynamic()
+            self.draw_panels()
+            pygame.display.flip()
+            return
+        
+        scene_key = self.get_scene_key()
+        if scene_key != self.scene_key or self.scene_surface.get_size() != self.screen.get_size():
+            self.draw_scene()
+            self.scene_surface = self.screen.copy()
+            self.scene_key = scene_key
+            self.dirty_rects = self.draw_dynamic()
+            self.draw_panels()
+            pygame.display.flip()
+            return
+        
+        # Effacer les éléments de l'image précédente puis redessiner ceux de l'image courante
+        for rect in self.dirty_rects:
+            self.screen.blit(self.scene_surface, rect, rect)
+        rects = self.draw_dynamic()
+        updated = self.dirty_rects + rects
+        if updated:
+            self.screen.set_clip(updated[0].unionall(updated[1:]))
+            self.draw_panels()
+            self.screen.set_clip(None)
+        pygame.display.update(updated)
+        self.dirty_rects = rects
 
-    def draw(self):
-        # Remplir l'écran en noir
-        self.screen.fill(BLACK)
+    def get_scene_key(self):
+        """Tout ce dont dépend la scène fixe des modes EDIT et GAME_OVER"""
+        leaderboard = None
+        if self.show_leaderboard:
+            leaderboard = (self.leaderboard_board, self.leaderboard_page,
+                           tuple((entry["player_name"], entry["score"], entry["survived_time"])
+                                 for entry in self.get_leaderboard_entries()))
+        return (self.game_mode, self.screen.get_size(), self.camera_x, self.camera_y, self.zoom,
+                tuple((tower.x, tower.y, tower.tower_type, tower.current_health) for tower in self.towers),
+                id(self.selected_tower), tuple(tower_info['count'] for tower_info in self.available_towers),
+                self.show_ranges, self.show_debug, self.show_speed_debug, self.show_names,
+                self.show_monster_ranges, self.show_grid, self.show_help, leaderboard,
+                self.time_acceleration_index, self.village_health, self.final_score,
+                self.is_high_score, self.entering_name)
 
-        # Calculer la taille et la position du fond en fonction du zoom
-        background_width = int(WORLD_SIZE * self.zoom)
-        background_height = int(WORLD_SIZE * self.zoom)
-        
-        # Calculer la position du fond pour qu'il soit centré sur la caméra
-        background_x, background_y = self.world_to_screen(0, 0)
+    def draw_dynamic(self):
+        """Dessine les éléments qui changent sans modifier la scène et renvoie leurs rectangles"""
+        rects = []
         
-        # Redimensionner et positionner l'image de fond
-        scaled_background = pygame.transform.scale(self.background, (background_width, background_height))
-        self.screen.blit(scaled_background, (background_x, background_y))
+        # Tour en cours de déplacement
+        if self.dragged_tower:
+            # Utiliser le sprite de la tour au lieu d'un cercle
+            scaled_sprite = self.sprite_cache.get_scaled(('tower', self.dragged_tower['type']),
+                                                         self.tower_sprites[self.dragged_tower['type']],
+                                                         (TOWER_SIZE, TOWER_SIZE))
+            rects.append(self.screen.blit(scaled_sprite, 
+                                          (self.mouse_x - TOWER_SIZE//2, 
+                                           self.mouse_y - TOWER_SIZE//2)))
+            
+            if self.mouse_y < self.current_height - TOWER_PANEL_HEIGHT:
+                valid = self.is_position_valid(self.mouse_x, self.mouse_y, 
+                                            self.dragged_tower.get('existing'))
+                # Dessiner un cercle de validation autour de la tour
+                rects.append(pygame.draw.circle(self.screen, WHITE if valid else RED,
+                                                (self.mouse_x, self.mouse_y), TOWER_SIZE//2, 2))
+        
+        # Nom en cours de saisie avec un curseur clignotant
+        if self.game_mode == GameMode.GAME_OVER and self.entering_name:
+            self.name_cursor_time += 1
+            if self.name_cursor_time >= 30:  # Changer l'état du curseur toutes les 30 frames
+                self.name_cursor_visible = not self.name_cursor_visible
+                self.name_cursor_time = 0
+            
+            display_name = self.temp_player_name + ('|' if self.name_cursor_visible else ' ')
+            name_text = self.text.render(display_name, 48, (255, 255, 255))
+            name_text_rect = name_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 110))
+            rects.append(self.screen.blit(name_text, name_text_rect))
         
-        # Créer une surface noire pour les lumières (pas transparente)
-        light_surface = pygame.Surface((WORLD_SIZE, WORLD_SIZE))
-        light_surface.fill((0, 0, 0))  # Surface noire pour le blending additif
+        return rects
+
+    def draw_scene(self):
+        # Remplir l'écran en noir
+        self.screen.fill(BLACK)
+        self.overlay.begin(self.screen.get_size())
+
+        # Fond : seules les tuiles visibles sont redimensionnées
+        self.background_layer.draw(self.screen, self.camera_x, self.camera_y, self.zoom,
+                                   self.center_x, self.center_y)
         
         # Dessiner la grille
         grid_start_x = int(self.camera_x - WINDOW_WIDTH / (2 * self.zoom))
@@ -651,164 +648,140 @@ class Game:
         village_radius = int(VILLAGE_SIZE/2 * self.zoom)
 
         # Dessiner le village (image)
+        village_sprite = self.sprite_cache.get_zoomed('village', self.village_sprite, VILLAGE_SIZE, self.zoom)
         self.screen.blit(
-            pygame.transform.scale(self.village_sprite, (int(VILLAGE_SIZE * self.zoom), int(VILLAGE_SIZE * self.zoom))),
-            (village_screen_x - VILLAGE_SIZE/2*self.zoom, village_screen_y - VILLAGE_SIZE/2*self.zoom)
+            village_sprite,
+            (village_screen_x - village_sprite.get_width()/2, village_screen_y - village_sprite.get_height()/2)
         )
         
+        # Zone du monde à l'écran, élargie pour les sprites, barres de vie et noms
+        view_bounds = self.get_view_bounds(VIEW_CULL_MARGIN)
+        batch = self.sprite_batch
+        
         # Dessiner les tours
         for tower in self.towers:
-            screen_x, screen_y = self.world_to_screen(tower.x, tower.y)
-            color = BLUE if tower.tower_type == TowerType.POWERFUL else \
-                   GREEN if tower.tower_type == TowerType.MEDIUM else YELLOW
+            # Les portées restent visibles même si la tour est hors de l'écran
+            if not self.is_in_view(view_bounds, tower.x, tower.y, tower.vision_range if self.show_ranges else 0):
+                continue
             
             if self.show_ranges:
-                range_surface = pygame.Surface((WORLD_SIZE, WORLD_SIZE), pygame.SRCALPHA)
+                screen_x, screen_y = self.world_to_screen(tower.x, tower.y)
+                color = BLUE if tower.tower_type == TowerType.POWERFUL else \
+                       GREEN if tower.tower_type == TowerType.MEDIUM else YELLOW
                 vision_radius = int(tower.vision_range * self.zoom)
-                pygame.draw.circle(range_surface, (*color, RANGE_ALPHA//2),
-                                 (int(screen_x), int(screen_y)), vision_radius)
                 attack_radius = int(tower.attack_range * self.zoom)
-                pygame.draw.circle(range_surface, (*color, RANGE_ALPHA),
-                                 (int(screen_x), int(screen_y)), attack_radius)
-                self.screen.blit(range_surface, (0, 0))
-            
-            self.screen.blit(pygame.transform.scale(self.tower_sprites[tower.tower_type], (int(TOWER_SIZE * self.zoom), int(TOWER_SIZE * self.zoom))), (screen_x - TOWER_SIZE/2*self.zoom, screen_y - TOWER_SIZE/2*self.zoom))
+                # Anneau de vision autour du disque d'attaque, sans recouvrement
+                self.overlay.circle((*color, RANGE_ALPHA//2), (screen_x, screen_y), vision_radius,
+                                    max(1, vision_radius - attack_radius))
+                self.overlay.circle((*color, RANGE_ALPHA), (screen_x, screen_y), attack_radius)
             
-            health_ratio = tower.current_health / tower.max_health
-            health_width = TOWER_SIZE * self.zoom
-            health_height = 5 * self.zoom
-            health_x = screen_x - health_width/2
-            health_y = screen_y + (TOWER_SIZE/2 + 5) * self.zoom
+            tower_sprite = self.sprite_cache.get_zoomed(('tower', tower.tower_type), self.tower_sprites[tower.tower_type],
+                                                        TOWER_SIZE, self.zoom)
+            batch.add_centered(tower_sprite, tower.x, tower.y)
+            batch.add_health_bar(tower.x, tower.y, tower.current_health / tower.max_health,
+                                 TOWER_SIZE * self.zoom, 5 * self.zoom, (TOWER_SIZE/2 + 5) * self.zoom)
+        
+        # Portées sous les sprites, qui ne sont dessinés qu'au `flush` du lot
+        self.overlay.present(self.screen)
+        
+        if self.selected_tower in self.towers:
+            self.overlay.circle((*WHITE, 255), self.world_to_screen(self.selected_tower.x, self.selected_tower.y),
+                                int(TOWER_SIZE/2 * self.zoom), 2)
+        
+        # Dessiner les monstres : seuls ceux de la zone visible sont testés (brouillard) puis dessinés.
+        # Les lignes de debug relient des points éloignés, le tri est alors désactivé.
+        if self.show_debug:
+            drawn_monsters = self.monsters
+        else:
+            monster_margin = VIEW_CULL_MARGIN
+            if self.show_monster_ranges:
+                monster_margin += max(HEAL_RANGE, SPIRIT_BUFF_RANGE, KAMIKAZE_EXPLOSION_RANGE)
+            drawn_monsters = self.monster_grid.query_rect(*self.get_view_bounds(monster_margin))
+        if drawn_monsters:
+            # Brouillard : une lecture du raster de visibilité pour tous les monstres
+            visible = self.visibility.visible_many([monster.x for monster in drawn_monsters],
+                                                   [monster.y for monster in drawn_monsters])
+            drawn_monsters = [monster for monster, shown in zip(drawn_monsters, visible.tolist()) if shown]
+        for monster in drawn_monsters:
+            monster.add_to_batch(batch, self.zoom, self.show_names, self.render_alpha)
+            render_x, render_y = monster.get_render_position(self.render_alpha)
             
-            pygame.draw.rect(self.screen, (64, 64, 64),
-                            (health_x, health_y, health_width, health_height))
-            pygame.draw.rect(self.screen, (0, 255, 0) if health_ratio > 0.5 else 
-                                         (255, 255, 0) if health_ratio > 0.25 else 
-                                         (255, 0, 0),
-                            (health_x, health_y, health_width * health_ratio, health_height))
+            if self.show_monster_ranges:
+                monster.draw_effect_range(self.overlay, *self.world_to_screen(render_x, render_y), self.zoom)
             
-            if tower == self.selected_tower:
-                pygame.draw.circle(self.screen, WHITE, 
-                                 (int(screen_x), int(screen_y)), 
-                                 int(TOWER_SIZE/2 * self.zoom), 2)
-
-            # Ajouter la lumière de la tour sur la surface de lumière
-            if self.game_mode == GameMode.PLAY:
-                pygame.draw.circle(light_surface, (30, 30, 30),
-                                 (int(screen_x), int(screen_y)),
-                                 int(tower.vision_range * self.zoom))
-        
-        # Dessiner les monstres
-        for monster in self.monsters:
-            if monster.is_visible(self.village_x, self.village_y, self.towers):
-                monster.draw(self.screen, self.camera_x, self.camera_y, self.zoom, 
-                           self.show_names, self.show_monster_ranges)
+            if self.show_debug:
+                monster_screen_x, monster_screen_y = self.world_to_screen(render_x, render_y)
                 
-                if self.show_debug:
-                    debug_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-                    monster_screen_x, monster_screen_y = self.world_to_screen(monster.x, monster.y)
-                    
-                    if monster.is_fleeing and monster.flee_target_x is not None:
-                        target_screen_x, target_screen_y = self.world_to_screen(
-                            monster.flee_target_x,
-                            monster.flee_target_y
-                        )
-                    elif monster.current_target_type == 'tower' and monster.current_target:
-                        target_screen_x, target_screen_y = self.world_to_screen(
-                            monster.current_target.x, 
-                            monster.current_target.y
-                        )
-                    else:
-                        target_screen_x, target_screen_y = self.world_to_screen(
-                            self.village_x, 
-                            self.village_y
-                        )
-                    
-                    pygame.draw.line(
-                        debug_surface,
-                        (*monster.color, DEBUG_LINE_ALPHA),
-                        (monster_screen_x, monster_screen_y),
-                        (target_screen_x, target_screen_y),
-                        max(1, int(2 * self.zoom))
+                if monster.is_fleeing and monster.flee_target_x is not None:
+                    target_screen_x, target_screen_y = self.world_to_screen(
+                        monster.flee_target_x,
+                        monster.flee_target_y
                     )
-                    
-                    circle_color = (255, 255, 0, DEBUG_LINE_ALPHA) if monster.is_fleeing else (*monster.color, DEBUG_LINE_ALPHA)
-                    pygame.draw.circle(
-                        debug_surface,
-                        circle_color,
-                        (int(target_screen_x), int(target_screen_y)),
-                        int(10 * self.zoom),
-                        2
+                elif monster.current_target_type == 'tower' and monster.current_target:
+                    target_screen_x, target_screen_y = self.world_to_screen(
+                        monster.current_target.x, 
+                        monster.current_target.y
+                    )
+                else:
+                    target_screen_x, target_screen_y = self.world_to_screen(
+                        self.village_x, 
+                        self.village_y
                     )
-
-                    self.screen.blit(debug_surface, (0, 0))
                 
-                if self.show_speed_debug and monster.is_visible(self.village_x, self.village_y, self.towers):
-                    screen_x, screen_y = self.world_to_screen(monster.x, monster.y)
-                    multiplier = self.get_terrain_speed_multiplier(monster.x, monster.y)
-                    current_speed = monster.speed * multiplier
-                    debug_text = f"Speed: {current_speed:.1f} ({multiplier:.2f}x)"
-                    font = pygame.font.Font(None, 20)
-                    text_surface = font.render(debug_text, True, (255, 255, 0))
-                    self.screen.blit(text_surface, (screen_x + 20, screen_y - 20))
-        
+                self.overlay.line(
+                    (*monster.color, DEBUG_LINE_ALPHA),
+                    (monster_screen_x, monster_screen_y),
+                    (target_screen_x, target_screen_y),
+                    max(1, int(2 * self.zoom))
+                )
+                
+                circle_color = (255, 255, 0, DEBUG_LINE_ALPHA) if monster.is_fleeing else (*monster.color, DEBUG_LINE_ALPHA)
+                self.overlay.circle(
+                    circle_color,
+                    (target_screen_x, target_screen_y),
+                    int(10 * self.zoom),
+                    2
+                )
+            
+            if self.show_speed_debug:
+                screen_x, screen_y = self.world_to_screen(render_x, render_y)
+                multiplier = self.get_terrain_speed_multiplier(monster.x, monster.y)
+                current_speed = monster.speed * multiplier
+                self.text.draw_value(self.screen, (screen_x + 20, screen_y - 20), "Speed: ",
+                                     f"{current_speed:.1f} ({multiplier:.2f}x)", 20, (255, 255, 0))
+    
         # Dessiner les projectiles
         for tower in self.towers:
             for projectile in tower.projectiles:
-                projectile.draw(self.screen, self.camera_x, self.camera_y, self.zoom)
+                if not self.is_in_view(view_bounds, projectile.x, projectile.y):
+                    continue
+                batch.add_circle(projectile.color, *projectile.get_render_position(self.render_alpha),
+                                 PROJECTILE_SIZE * self.zoom)
+        
+        # Tous les sprites, barres de vie et projectiles en un seul envoi
+        batch.flush(self.screen, self.camera_x, self.camera_y, self.zoom, self.center_x, self.center_y)
         
         # Dessiner les explosions
         for explosion in self.explosions:
-            explosion.draw(self.screen, self.camera_x, self.camera_y, self.zoom)
+            if not self.is_in_view(view_bounds, explosion.x, explosion.y, explosion.max_radius):
+                continue
+            explosion.draw(self.overlay, self.camera_x, self.camera_y, self.zoom)
+        
+        # Debug, zones d'effet et explosions au-dessus des sprites, éclairés par les lumières
+        self.overlay.present(self.screen)
         
         # Gestion des lumières en mode jeu
         if self.game_mode == GameMode.PLAY:
-            # Lumière autour du village
-            village_screen_x, village_screen_y = self.world_to_screen(self.village_x, self.village_y)
-            village_light_radius = int(LIGHT_MAX_RANGE * self.zoom)
-            pygame.draw.circle(light_surface, (30, 30, 30),
-                             (int(village_screen_x), int(village_screen_y)),
-                              village_light_radius)
-            
-            # Lumière active (curseur)
-            if self.light_active and self.light_position and self.light_power > 0:
-                light_screen_pos = self.world_to_screen(self.light_position[0], self.light_position[1])
-                intensity = int(60 * (self.light_power / LIGHT_MAX_POWER))  # Augmenter l'intensité
-                # S'assurer que le rayon de la lumière est correctement ajusté par le zoom
-                light_radius = int(LIGHT_RADIUS * self.zoom)
-                # Dessiner un cercle plus lumineux avec une intensité accrue
-                pygame.draw.circle(light_surface, (intensity, intensity, intensity),
-                                 (int(light_screen_pos[0]), int(light_screen_pos[1])),
-                                 light_radius)
-                # Ajouter un second cercle plus petit et plus intense pour un effet de halo
-                inner_radius = int(light_radius * 0.6)
-                inner_intensity = min(255, int(intensity * 1.5))
-                pygame.draw.circle(light_surface, (inner_intensity, inner_intensity, inner_intensity),
-                                 (int(light_screen_pos[0]), int(light_screen_pos[1])),
-                                 inner_radius)
-            
-            # Appliquer la surface de lumière avec le blending additif
+            # Lumières des tours, du village et du joueur (tampon recomposé seulement si besoin)
+            light_surface = self.lighting.compose(self)
             self.screen.blit(light_surface, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
             
             # Indicateur de lumière autour du curseur
             mouse_world_pos = self.screen_to_world(self.mouse_x, self.mouse_y)
-            is_in_valid_zone = False
-            
-            dist_to_village = math.sqrt((mouse_world_pos[0] - self.village_x)**2 + 
-                                      (mouse_world_pos[1] - self.village_y)**2)
-            if dist_to_village <= LIGHT_MAX_RANGE:
-                is_in_valid_zone = True
-            
-            for tower in self.towers:
-                dist_to_tower = math.sqrt((mouse_world_pos[0] - tower.x)**2 + 
-                                        (mouse_world_pos[1] - tower.y)**2)
-                if dist_to_tower <= tower.vision_range:
-                    is_in_valid_zone = True
-                    break
+            is_in_valid_zone = self.visibility.in_light_zone(*mouse_world_pos)
             
             # N'afficher l'indicateur de lumière que si la zone est valide ET que la puissance est > 0
             if is_in_valid_zone and self.light_power > 0:
-                cursor_light = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
                 # Ajuster la taille de l'indicateur en fonction du zoom pour correspondre à la vraie zone d'effet
                 cursor_light_radius = int(LIGHT_RADIUS * self.zoom)
                 
@@ -817,31 +790,28 @@ class Game:
                 
                 # Cercle extérieur pulsant
                 alpha_outer = int(30 * pulse)
-                pygame.draw.circle(cursor_light, (255, 255, 200, alpha_outer),
-                                 (self.mouse_x, self.mouse_y),
-                                 cursor_light_radius)
+                self.overlay.circle((255, 255, 200, alpha_outer),
+                                    (self.mouse_x, self.mouse_y),
+                                    cursor_light_radius, cache=False)
                 
                 # Bordure plus visible avec pulsation
                 border_width = max(1, int(3 * self.zoom * pulse))
                 alpha_border = int(150 * pulse)
-                pygame.draw.circle(cursor_light, (255, 255, 200, alpha_border),
-                                 (self.mouse_x, self.mouse_y),
-                                 cursor_light_radius, border_width)
+                self.overlay.circle((255, 255, 200, alpha_border),
+                                    (self.mouse_x, self.mouse_y),
+                                    cursor_light_radius, border_width, cache=False)
                 
                 # Cercle intérieur pour indiquer l'intensité et la concentration
                 inner_radius = int(cursor_light_radius * 0.3 * (self.light_power / LIGHT_MAX_POWER))
-                pygame.draw.circle(cursor_light, (255, 255, 150, 40),
-                                 (self.mouse_x, self.mouse_y),
-                                 inner_radius)
-                
-                # Appliquer la surface
-                self.screen.blit(cursor_light, (0, 0))
+                self.overlay.circle((255, 255, 150, 40),
+                                    (self.mouse_x, self.mouse_y),
+                                    inner_radius)
+                self.overlay.present(self.screen)
                 
                 # Afficher texte d'aide seulement si non cooldown
                 if not self.light_in_cooldown:
-                    font = pygame.font.Font(None, 20)
                     help_text = "Clic droit pour activer la lumière"
-                    text_surface = font.render(help_text, True, (255, 255, 200))
+                    text_surface = self.text.render(help_text, 20, (255, 255, 200))
                     self.screen.blit(text_surface, (self.mouse_x + 20, self.mouse_y + 20))
             
             # Barre de puissance de la lumière (toujours affichée mais rouge si vide)
@@ -865,10 +835,8 @@ class Game:
                                 (bar_x, bar_y, bar_width * cooldown_ratio, bar_height))
                 
                 # Afficher un texte de cooldown
-                font = pygame.font.Font(None, 20)
-                cooldown_text = f"Délai: {self.light_recharge_delay - self.light_recharge_timer:.1f}s"
-                text_surface = font.render(cooldown_text, True, (255, 128, 0))
-                self.screen.blit(text_surface, (self.mouse_x + 20, self.mouse_y + 20))
+                self.text.draw_value(self.screen, (self.mouse_x + 20, self.mouse_y + 20), "Délai: ",
+                                     f"{self.light_recharge_delay - self.light_recharge_timer:.1f}s", 20, (255, 128, 0))
             else:
                 # Couleur normale ou rouge si épuisée
                 bar_color = (100, 200, 255) if self.light_power > 0 else (255, 0, 0)
@@ -877,66 +845,17 @@ class Game:
                 
                 # Afficher le texte d'aide pour activer la lumière seulement si la puissance > 0 et non en cooldown
                 if is_in_valid_zone and self.light_power > 0:
-                    font = pygame.font.Font(None, 20)
                     help_text = "Clic droit pour activer la lumière"
-                    text_surface = font.render(help_text, True, (255, 255, 200))
+                    text_surface = self.text.render(help_text, 20, (255, 255, 200))
                     self.screen.blit(text_surface, (self.mouse_x + 20, self.mouse_y + 20))
         
         # Interface utilisateur
         if self.game_mode == GameMode.EDIT:
-            pygame.draw.rect(self.screen, GRAY, 
-                           (0, self.current_height - TOWER_PANEL_HEIGHT, 
-                            self.current_width, TOWER_PANEL_HEIGHT))
-            
-            panel_x = 10
-            for tower_info in self.available_towers:
-                if tower_info['count'] > 0:
-                    # Utiliser le sprite de la tour au lieu d'un cercle
-                    scaled_sprite = pygame.transform.scale(self.tower_sprites[tower_info['type']], 
-                                                        (TOWER_SIZE, TOWER_SIZE))
-                    self.screen.blit(scaled_sprite, 
-                                   (panel_x, 
-                                    self.current_height - TOWER_PANEL_HEIGHT + (TOWER_PANEL_HEIGHT - TOWER_SIZE) // 2))
-                    count_text = str(tower_info['count'])
-                    text_surface = pygame.font.Font(None, 24).render(count_text, True, WHITE)
-                    self.screen.blit(text_surface, 
-                                   (panel_x + TOWER_SIZE//2 - 5, 
-                                    self.current_height - TOWER_PANEL_HEIGHT + TOWER_SIZE + 5))
-                panel_x += TOWER_SIZE + 10
-            
-            button_color = GREEN if self.all_towers_placed() else GRAY
-            pygame.draw.rect(self.screen, button_color, self.go_button_rect)
-            
-            button_text = "GO!" if self.game_mode == GameMode.EDIT else "EDIT"
-            font = pygame.font.Font(None, 36)
-            text_color = WHITE if self.all_towers_placed() else (128, 128, 128)
-            text_surface = font.render(button_text, True, text_color)
-            text_rect = text_surface.get_rect(center=self.go_button_rect.center)
-            self.screen.blit(text_surface, text_rect)
-            
-            # Dessiner le bouton RESET
-            pygame.draw.rect(self.screen, RED, self.reset_button_rect)
-            reset_text = "RESET"
-            reset_surface = font.render(reset_text, True, WHITE)
-            reset_rect = reset_surface.get_rect(center=self.reset_button_rect.center)
-            self.screen.blit(reset_surface, reset_rect)
-        
-        # Tour en cours de déplacement
-        if self.dragged_tower:
-            # Utiliser le sprite de la tour au lieu d'un cercle
-            scaled_sprite = pygame.transform.scale(self.tower_sprites[self.dragged_tower['type']], 
-                                                (TOWER_SIZE, TOWER_SIZE))
-            self.screen.blit(scaled_sprite, 
-                           (self.mouse_x - TOWER_SIZE//2, 
-                            self.mouse_y - TOWER_SIZE//2))
-            
-            if self.mouse_y < self.current_height - TOWER_PANEL_HEIGHT:
-                valid = self.is_position_valid(self.mouse_x, self.mouse_y, 
-                                            self.dragged_tower.get('existing'))
-                # Dessiner un cercle de validation autour de la tour
-                pygame.draw.circle(self.screen, WHITE if valid else RED,
-                                 (self.mouse_x, self.mouse_y), TOWER_SIZE//2, 2)
-        
+            panel_surface = self.tower_panel.get(
+                self.current_width, self.current_height,
+                tuple((tower_info['type'], tower_info['count']) for tower_info in self.available_towers))
+            self.screen.blit(panel_surface, (0, self.current_height - TOWER_PANEL_HEIGHT))
+
         # Appeler la méthode draw_ui pour afficher le score et autres informations UI
         self.draw_ui()
         
@@ -954,89 +873,18 @@ class Game:
                                      (255, 0, 0),
                             (health_x, health_y, health_width * health_ratio, health_height))
         
-        # Game Over
+        # Game Over (le nom en cours de saisie est dessiné à part, voir `draw_dynamic`)
         if self.game_mode == GameMode.GAME_OVER:
-            # Fond semi-transparent pour le game over
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(180)  # Ajuster l'opacité
-            self.screen.blit(overlay, (0, 0))
-            
-            font_big = pygame.font.Font(None, 100)  # Police plus grande
-            game_over_text = font_big.render("GAME OVER", True, (255, 0, 0))
-            # Ajouter un contour blanc pour plus de visibilité
-            game_over_outline = font_big.render("GAME OVER", True, (255, 255, 255))
-            
-            text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 100))
-            # Dessiner le contour légèrement décalé
-            self.screen.blit(game_over_outline, (text_rect.x + 2, text_rect.y + 2))
-            self.screen.blit(game_over_text, text_rect)
-            
-            font_score = pygame.font.Font(None, 74)
-            score_text = font_score.render(f"Score: {self.final_score}", True, (255, 200, 0))
-            score_rect = score_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 30))
-            self.screen.blit(score_text, score_rect)
-            
-            font = pygame.font.Font(None, 48)  # Police plus grande pour les instructions
-            if self.is_high_score:
-                highscore_text = font.render("Nouveau High Score!", True, (0, 255, 0))
-                highscore_rect = highscore_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 30))
-                self.screen.blit(highscore_text, highscore_rect)
-            
-            if self.entering_name:
-                # Mise à jour du curseur clignotant
-                self.name_cursor_time += 1
-                if self.name_cursor_time >= 30:  # Changer l'état du curseur toutes les 30 frames
-                    self.name_cursor_visible = not self.name_cursor_visible
-                    self.name_cursor_time = 0
-                
-                name_prompt = font.render("Entrez votre nom:", True, (255, 255, 255))
-                name_rect = name_prompt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 70))
-                self.screen.blit(name_prompt, name_rect)
-                
-                # Afficher le nom en cours de saisie avec un curseur clignotant
-                display_name = self.temp_player_name + ('|' if self.name_cursor_visible else ' ')
-                name_text = font.render(display_name, True, (255, 255, 255))
-                name_text_rect = name_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 110))
-                self.screen.blit(name_text, name_text_rect)
-                
-                # Instructions pour la saisie
-                instruction_font = pygame.font.Font(None, 36)
-                instruction_text = "Appuyez sur ENTRÉE ou ESPACE pour valider"
-                instruction_surface = instruction_font.render(instruction_text, True, (200, 200, 200))
-                instruction_rect = instruction_surface.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 150))
-                self.screen.blit(instruction_surface, instruction_rect)
-            else:
-                restart_text = font.render("Appuyez sur ESPACE pour recommencer", True, (255, 255, 255))
-                restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 70))
-                self.screen.blit(restart_text, restart_rect)
-                
-                leaderboard_text = font.render("Appuyez sur L pour voir le leaderboard", True, (255, 255, 255))
-                leaderboard_rect = leaderboard_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 110))
-                self.screen.blit(leaderboard_text, leaderboard_rect)
-        
+            game_over_surface = self.game_over_panel.get(self.final_score, self.is_high_score, self.entering_name)
+            self.screen.blit(game_over_surface, (0, 0))
+
+    def draw_panels(self):
+        """Dessine les calques affichés au-dessus de tout le reste (debug du terrain, leaderboard, aide)"""
         # Afficher l'image du terrain en mode debug
         if self.show_speed_debug:
-            # Créer une surface pour l'overlay du terrain
-            terrain_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            
-            # Dessiner la portion visible du terrain
-            visible_rect = pygame.Rect(
-                int(self.camera_x - WINDOW_WIDTH/(2*self.zoom)),
-                int(self.camera_y - WINDOW_HEIGHT/(2*self.zoom)),
-                int(WINDOW_WIDTH/self.zoom),
-                int(WINDOW_HEIGHT/self.zoom)
-            )
-            
-            for x in range(visible_rect.left, visible_rect.right, 10):
-                for y in range(visible_rect.top, visible_rect.bottom, 10):
-                    multiplier = self.get_terrain_speed_multiplier(x, y)
-                    color_value = int(255 * multiplier)
-                    screen_x, screen_y = self.world_to_screen(x, y)
-                    pygame.draw.circle(terrain_surface, (color_value, color_value, color_value, 64),
-                                    (int(screen_x), int(screen_y)), 5)
-            
-            self.screen.blit(terrain_surface, (0, 0))
+            # Texture des multiplicateurs rendue une fois, affichée par tuiles comme le fond
+            self.get_terrain_heatmap_layer().draw(self.screen, self.camera_x, self.camera_y, self.zoom,
+                                                  self.center_x, self.center_y)
         
         # Afficher le leaderboard si nécessaire
         if self.show_leaderboard:
@@ -1044,105 +892,67 @@ class Game:
         
         # Affichage de l'aide (après tout le reste pour qu'elle soit au-dessus)
         if self.show_help:
-            help_surface = pygame.Surface((self.current_width - 100, self.current_height - 100), pygame.SRCALPHA)
-            help_surface.fill((0, 0, 0, 220))  # Fond semi-transparent
-            
-            help_texts = [
-                "Aide du jeu - Commandes clavier",
-                "",
-                "H : Afficher/masquer cette aide",
-                "R : Afficher/masquer les portées des tours",
-                "D : Afficher/masquer les informations de debug",
-                "S : Afficher/masquer le debug de vitesse/terrain",
-                "N : Afficher/masquer les noms des entités",
-                "M : Afficher/masquer les zones d'effet des monstres",
-                "G : Afficher/masquer la grille",
-                "T : Changer l'accélération du temps",
-                "P : Couper/activer la musique",
-                "V : Couper/activer les voix",
-                "L : Afficher le leaderboard",
-                "F11 : Basculer en mode plein écran",
-                "",
-                "Commandes souris:",
-                "Clic gauche : Placer/déplacer les tours (mode EDIT)",
-                "Clic droit : Supprimer une tour sélectionnée (mode EDIT) / Activer la lumière (mode PLAY)",
-                "Clic milieu/molette : Déplacer la carte",
-                "Molette haut/bas : Zoomer/dézoomer"
-            ]
-            
-            font = pygame.font.Font(None, 28)
-            title_font = pygame.font.Font(None, 36)
-            
-            y_offset = 20
-            
-            # Titre
-            title_text = title_font.render(help_texts[0], True, (255, 255, 200))
-            title_rect = title_text.get_rect(center=(help_surface.get_width() // 2, y_offset + 10))
-            help_surface.blit(title_text, title_rect)
-            y_offset += 50
-            
-            # Corps de l'aide
-            for i in range(1, len(help_texts)):
-                if help_texts[i] == "":
-                    y_offset += 20
-                    continue
-                    
-                text_surface = font.render(help_texts[i], True, (220, 220, 220))
-                help_surface.blit(text_surface, (30, y_offset))
-                y_offset += 30
-            
-            # Instructions pour fermer
-            close_text = font.render("Appuyez sur H pour fermer", True, (255, 200, 200))
-            close_rect = close_text.get_rect(center=(help_surface.get_width() // 2, help_surface.get_height() - 30))
-            help_surface.blit(close_text, close_rect)
-            
-            # Dessiner le panneau d'aide centré
+            help_surface = self.help_panel.get(self.current_width, self.current_height)
             help_rect = help_surface.get_rect(center=(self.current_width // 2, self.current_height // 2))
             self.screen.blit(help_surface, help_rect)
-            
-            # Bordure
-            pygame.draw.rect(self.screen, (200, 200, 200), help_rect, 2)
-        
-        pygame.display.flip()
+
+    def show_loading_screen(self, handles):
+        """Affiche la progression tant que les ressources indispensables ne sont pas chargées"""
+        bar_width = 400
+        bar_height = 20
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.assets.shutdown()
+                    pygame.quit()
+                    sys.exit()
+
+            progress = self.assets.progress(handles)
+            width, height = self.screen.get_size()
+            bar_rect = pygame.Rect((width - bar_width) // 2, height // 2, bar_width, bar_height)
+            self.screen.fill(BLACK)
+            title = self.text.render("Chargement...", 36, WHITE)
+            self.screen.blit(title, title.get_rect(midbottom=(width // 2, bar_rect.top - 10)))
+            pygame.draw.rect(self.screen, GRAY, bar_rect, 2)
+            pygame.draw.rect(self.screen, GREEN, (bar_rect.x, bar_rect.y, int(bar_width * progress), bar_height))
+            pygame.display.flip()
+            self.audio.update()
+
+            if progress >= 1.0:
+                return
+            self.clock.tick(FPS)
+
+    def report_startup(self):
+        """Temps jusqu'à la première image, et détail par ressource si PRINT_ASSET_TIMINGS"""
+        self.time_to_first_frame = time.perf_counter() - self.start_time
+        if PRINT_ASSET_TIMINGS:
+            self.assets.report()
+            print(f"Première image affichée après {self.time_to_first_frame * 1000:.1f} ms")
 
     def run(self):
         running = True
+        self.clock.tick(FPS)
+        self.draw()
+        self.report_startup()
         while running:
             running = self.handle_input()
-            self.update()
+            # Actions différées sur les ressources qui viennent de finir de charger
+            self.assets.poll()
+            self.audio.update()
+            # Durée réelle de la dernière image : la simulation avance par pas fixes
+            frame_time = self.clock.get_time() / 1000.0
+            self.update(frame_time)
+            self.autosave()
             self.draw()
+            self.audio.flush(self.sound_volume)
             self.clock.tick(FPS)
         
+        self.score_manager.close()
+        self.autosaver.shutdown()
+        self.assets.shutdown()
         pygame.quit()
         sys.exit()
 
-    def get_terrain_speed_multiplier(self, x, y):
-        """Calcule le multiplicateur de vitesse basé sur la valeur du pixel du terrain.
-        
-        Args:
-            x (float): Position X dans le monde
-            y (float): Position Y dans le monde
-            
-        Returns:
-            float: Multiplicateur de vitesse entre 0.5 (noir) et 1.0 (blanc)
-        """
-        # Conversion des coordonnées monde en coordonnées image
-        terrain_x = int(x * self.speed_mask.get_width() / WORLD_SIZE)
-        terrain_y = int(y * self.speed_mask.get_height() / WORLD_SIZE)
-        
-        # Vérification des limites
-        terrain_x = max(0, min(terrain_x, self.speed_mask.get_width() - 1))
-        terrain_y = max(0, min(terrain_y, self.speed_mask.get_height() - 1))
-        
-        # Récupération de la valeur du pixel (0-255)
-        try:
-            pixel_value = self.terrain_array[terrain_x, terrain_y] & 0xFF
-        except IndexError:
-            return 1.0  # Valeur par défaut en cas d'erreur
-        
-        # Conversion en multiplicateur (0.5 pour noir, 1.0 pour blanc)
-        return 0.5 + (pixel_value / 255.0) * 0.5
-
     def load_sounds(self):
         """Charge tous les effets sonores du jeu"""
         # Vérifier que les dossiers de sons existent, sinon les créer
@@ -1155,16 +965,20 @@ class Game:
                 os.makedirs(directory)
                 print(f"Dossier créé: {directory}")
         
-        self.sounds = {
-            'tower_fire': self.load_sound('tower_attack.wav'),
-            'monster_death': self.load_sound('monster_death.wav'),
-            'tower_destroyed': self.load_sound('tower_destroyed.wav'),
-            'light_on': self.load_sound('light_on.wav'),
-            'light_off': self.load_sound('light_off.wav'),
-            'game_over': self.load_sound('game_over.wav')
+        sound_files = {
+            'tower_fire': 'tower_attack.wav',
+            'monster_death': 'monster_death.wav',
+            'tower_destroyed': 'tower_destroyed.wav',
+            'light_on': 'light_on.wav',
+            'light_off': 'light_off.wav',
+            'game_over': 'game_over.wav'
         }
+        self.sounds = LazyAssets({
+            name: self.assets.load(f"sound:{filename}", self.load_sound, filename)
+            for name, filename in sound_files.items()
+        })
         
-        # Chargement des fichiers vocaux
+        # Fichiers vocaux : PCM en cache, décodés seulement à leur première lecture
         self.voice_sounds = {}
         voice_files = [
             'intro_voice.mp3'
@@ -1172,7 +986,7 @@ class Game:
         ]
         
         for voice_file in voice_files:
-            self.voice_sounds[voice_file] = self.load_voice(voice_file)
+            self.voice_sounds[voice_file] = self.assets.lazy(f"voice:{voice_file}", self.load_voice, voice_file)
         
         # Volume des effets sonores (entre 0.0 et 1.0)
         self.sound_volume = 0.5
@@ -1190,8 +1004,8 @@ class Game:
                 dummy_sound = pygame.mixer.Sound(buffer=bytearray([0, 0, 0, 0]))
                 return dummy_sound
                 
-            sound = pygame.mixer.Sound(sound_path)
-            return sound
+            # Effet court : gardé en mémoire, décodé depuis le cache audio
+            return load_cached_sound(sound_path)
         except Exception as e:
             print(f"Impossible de charger le son: {filename}. Erreur: {e}")
             # Créer un son vide en cas d'erreur
@@ -1203,42 +1017,32 @@ class Game:
                 return None
             
     def load_voice(self, filename):
-        """Charge un fichier vocal avec gestion d'erreur"""
+        """Échantillons d'un fichier vocal (memory-map du cache audio), ou None s'il est absent"""
         try:
             voice_path = os.path.join('src', 'assets', 'voices', filename)
             
             # Vérifier si le fichier existe
             if not os.path.exists(voice_path):
-                print(f"Fichier vocal manquant: {filename}. Création d'un son vide...")
+                print(f"Fichier vocal manquant: {filename}")
                 # Vérifier si le dossier existe, sinon le créer
                 voice_dir = os.path.join('src', 'assets', 'voices')
                 if not os.path.exists(voice_dir):
                     os.makedirs(voice_dir)
                     print(f"Dossier créé: {voice_dir}")
+                return None
                 
-                # Créer un son vide
-                dummy_sound = pygame.mixer.Sound(buffer=bytearray([0, 0, 0, 0]))
-                return dummy_sound
-                
-            voice = pygame.mixer.Sound(voice_path)
-            return voice
+            return load_pcm(voice_path)
         except Exception as e:
             print(f"Impossible de charger le fichier vocal: {filename}. Erreur: {e}")
-            # Créer un son vide en cas d'erreur
-            try:
-                dummy_sound = pygame.mixer.Sound(buffer=bytearray([0, 0, 0, 0]))
-                return dummy_sound
-            except:
-                print("Impossible de créer un son vocal de remplacement.")
-                return None
+            return None
 
-    def play_sound(self, sound_name):
-        """Joue un son s'il est disponible et que le son est activé"""
-        if self.sound_enabled and sound_name in self.sounds and self.sounds[sound_name]:
-            # Vérifier si le son est déjà en cours de lecture
-            if self.sounds[sound_name].get_num_channels() == 0:
-                self.sounds[sound_name].set_volume(self.sound_volume)
-                self.sounds[sound_name].play()
+    def play_sound(self, sound_name, x=None, y=None):
+        """Met un son en file pour l'image en cours, s'il est activé (joué par `AudioManager.flush`)"""
+        if not self.sound_enabled:
+            return
+        # Les événements positionnés sont atténués selon leur distance à la caméra
+        distance = None if x is None else math.hypot(x - self.camera_x, y - self.camera_y)
+        self.audio.queue(sound_name, distance)
 
     def play_background_music(self, filename):
         """Charge et joue la musique de fond en boucle"""
@@ -1258,22 +1062,12 @@ class Game:
         if not self.sound_enabled or not self.voices_enabled:
             return
             
-        # Vérifier si le son vocal est préchargé
-        if filename in self.voice_sounds and self.voice_sounds[filename]:
-            # Vérifier si le son est déjà en cours de lecture
-            if self.voice_sounds[filename].get_num_channels() == 0:
-                self.voice_sounds[filename].set_volume(self.sound_volume)
-                self.voice_sounds[filename].play()
-            return
-            
-        # Sinon, essayer de charger et jouer à la volée (fallback)
-        try:
-            voice_path = os.path.join('src', 'assets', 'voices', filename)
-            voice = pygame.mixer.Sound(voice_path)
-            voice.set_volume(self.sound_volume)
-            voice.play()
-        except Exception as e:
-            print(f"Impossible de charger ou jouer le fichier vocal: {filename}. Erreur: {e}")
+        # Voix non déclarée dans load_sounds : chargée à la volée
+        if filename not in self.voice_sounds:
+            self.voice_sounds[filename] = self.assets.lazy(f"voice:{filename}", self.load_voice, filename)
+
+        # Mise en file du canal des voix : lecture dès que le fichier est décodé, sans bloquer l'image
+        self.audio.voice.play(filename, self.voice_sounds[filename], self.sound_volume)
     
     def stop_background_music(self):
         """Arrête la musique de fond en cours"""
@@ -1281,14 +1075,14 @@ class Game:
 
     def stop_voice(self):
         """Arrête toutes les voix en cours de lecture"""
-        # Arrêter toutes les voix préchargées
-        for voice_name, voice in self.voice_sounds.items():
-            if voice and voice.get_num_channels() > 0:
-                voice.stop()
+        self.audio.voice.stop()
+
+    def sprite_sources(self):
+        """Fichiers des sprites regroupés dans l'atlas, par nom"""
+        sources = {f"tower_{tower_type.name.lower()}": f"src/assets/tower_{tower_type.name.lower()}.png"
+                   for tower_type in TowerType}
+        sources['village'] = 'src/assets/village.png'
 
-    def load_monster_sprites(self):
-        """Charge les sprites pour chaque type de monstre"""
-        sprites = {}
         sprite_dir = os.path.join('src', 'assets', 'monsters')
         
         # Vérifier si le dossier existe
@@ -1296,47 +1090,58 @@ class Game:
             os.makedirs(sprite_dir)
             print(f"Dossier créé: {sprite_dir}")
             print("Veuillez y ajouter des sprites pour les monstres.")
-        
-        # Charger les sprites pour chaque type de monstre
+
+        # Les monstres sans image auront un sprite par défaut (voir load_monster_sprites)
         for monster_type in MonsterType:
             sprite_path = os.path.join(sprite_dir, f"{monster_type.name.lower()}.png")
-            try:
-                sprite = pygame.image.load(sprite_path).convert_alpha()
-                sprites[monster_type] = sprite
-            except:
-                # Créer un sprite par défaut pour ce type de monstre
-                print(f"Sprite non trouvé pour {monster_type.name}, utilisation d'un sprite par défaut")
-                default_sprite = pygame.Surface((MONSTER_SIZE, MONSTER_SIZE), pygame.SRCALPHA)
-                
-                # Dessiner une forme simple comme sprite par défaut (cercle coloré)
-                if monster_type == MonsterType.SKELETON:
-                    color = (200, 200, 200)  # Gris clair pour les squelettes
-                elif monster_type == MonsterType.WOLF:
-                    color = (100, 100, 150)  # Bleu-gris pour les loups
-                elif monster_type == MonsterType.MORAY:
-                    color = (0, 100, 100)    # Cyan foncé pour les murènes
-                elif monster_type == MonsterType.SMALL_SPIRIT:
-                    color = (200, 200, 255)  # Bleu clair pour les fantômes
-                elif monster_type == MonsterType.FIRE_SKELETON:
-                    color = (255, 100, 0)    # Orange pour les squelettes de feu
-                elif monster_type == MonsterType.WITCH:
-                    color = (128, 0, 128)    # Violet pour les sorcières
-                elif monster_type == MonsterType.KAMIKAZE:
-                    color = (255, 0, 0)      # Rouge pour les kamikazes
-                elif monster_type == MonsterType.GIANT_WOLF:
-                    color = (50, 50, 150)    # Bleu foncé pour les loups géants
-                elif monster_type == MonsterType.DRAGON:
-                    color = (150, 0, 0)      # Rouge foncé pour les dragons
-                else:
-                    color = (100, 100, 100)  # Gris par défaut
-                    
-                pygame.draw.circle(default_sprite, color, 
-                                (MONSTER_SIZE//2, MONSTER_SIZE//2), 
-                                MONSTER_SIZE//2)
-                sprites[monster_type] = default_sprite
-        
+            if os.path.exists(sprite_path):
+                sources[f"monster_{monster_type.name.lower()}"] = sprite_path
+        return sources
+
+    def load_monster_sprites(self):
+        """Sprites de chaque type de monstre, pris dans l'atlas"""
+        sprites = {}
+        for monster_type in MonsterType:
+            name = f"monster_{monster_type.name.lower()}"
+            if name in self.sprite_atlas:
+                sprites[monster_type] = self.sprite_atlas.get(name)
+            else:
+                sprites[monster_type] = self.default_monster_sprite(monster_type)
         return sprites
 
+    def default_monster_sprite(self, monster_type):
+        """Sprite de remplacement pour un type de monstre sans image"""
+        # Créer un sprite par défaut pour ce type de monstre
+        print(f"Sprite non trouvé pour {monster_type.name}, utilisation d'un sprite par défaut")
+        default_sprite = pygame.Surface((MONSTER_SIZE, MONSTER_SIZE), pygame.SRCALPHA)
+        
+        # Dessiner une forme simple comme sprite par défaut (cercle coloré)
+        if monster_type == MonsterType.SKELETON:
+            color = (200, 200, 200)  # Gris clair pour les squelettes
+        elif monster_type == MonsterType.WOLF:
+            color = (100, 100, 150)  # Bleu-gris pour les loups
+        elif monster_type == MonsterType.MORAY:
+            color = (0, 100, 100)    # Cyan foncé pour les murènes
+        elif monster_type == MonsterType.SMALL_SPIRIT:
+            color = (200, 200, 255)  # Bleu clair pour les fantômes
+        elif monster_type == MonsterType.FIRE_SKELETON:
+            color = (255, 100, 0)    # Orange pour les squelettes de feu
+        elif monster_type == MonsterType.WITCH:
+            color = (128, 0, 128)    # Violet pour les sorcières
+        elif monster_type == MonsterType.KAMIKAZE:
+            color = (255, 0, 0)      # Rouge pour les kamikazes
+        elif monster_type == MonsterType.GIANT_WOLF:
+            color = (50, 50, 150)    # Bleu foncé pour les loups géants
+        elif monster_type == MonsterType.DRAGON:
+            color = (150, 0, 0)      # Rouge foncé pour les dragons
+        else:
+            color = (100, 100, 100)  # Gris par défaut
+            
+        pygame.draw.circle(default_sprite, color, 
+                        (MONSTER_SIZE//2, MONSTER_SIZE//2), 
+                        MONSTER_SIZE//2)
+        return default_sprite
+
     def toggle_fullscreen(self):
         """Bascule entre le mode plein écran et le mode fenêtré"""
         self.is_fullscreen = not self.is_fullscreen
@@ -1380,15 +1185,55 @@ class Game:
         self.center_x = self.current_width // 2
         self.center_y = self.current_height // 2
 
+    def snapshot(self, sequence=0):
+        """Instantané de la simulation, avec les tours encore disponibles"""
+        snapshot = super().snapshot(sequence)
+        snapshot.meta['available_towers'] = [tower_info['count'] for tower_info in self.available_towers]
+        return snapshot
+
+    def restore_snapshot(self, snapshot):
+        """Reprend une partie sauvegardée et remet l'interface dans un état cohérent"""
+        super().restore_snapshot(snapshot)
+        for tower_info, count in zip(self.available_towers, snapshot.meta.get('available_towers', [])):
+            tower_info['count'] = count
+        self.selected_tower = None
+        self.dragged_tower = None
+        self.entering_name = False
+        self.scene_key = None
+        if self.game_mode == GameMode.PLAY and self.music_enabled:
+            self.play_background_music('background_music.mp3')
+
+    def autosave(self):
+        """Point de reprise au début de chaque vague et sauvegarde périodique en mode PLAY"""
+        if self.game_mode != GameMode.PLAY or self.wave_manager is None:
+            return
+        wave = self.wave_manager.current_wave
+        if wave not in self.wave_snapshots:
+            self.wave_snapshots[wave] = self.snapshot()
+        if self.sim_time >= self.next_autosave_time:
+            self.autosaver.save(self.snapshot())
+            self.next_autosave_time = self.sim_time + AUTOSAVE_INTERVAL
+
+    def retry_wave(self):
+        """Revient au point de reprise de la vague en cours"""
+        if not self.wave_snapshots:
+            return
+        self.restore_snapshot(self.wave_snapshots[max(self.wave_snapshots)])
+        self.next_autosave_time = self.sim_time
+
+    def load_autosave(self):
+        """Reprend la dernière partie sauvegardée automatiquement (après un plantage par exemple)"""
+        snapshot = self.autosaver.load_latest()
+        if snapshot is None:
+            print("Aucune sauvegarde automatique à reprendre")
+            return
+        self.restore_snapshot(snapshot)
+        self.wave_snapshots = {}
+        self.next_autosave_time = self.sim_time + AUTOSAVE_INTERVAL
+
     def reset_game(self):
         """Réinitialise le jeu pour une nouvelle partie"""
-        self.game_mode = GameMode.EDIT
-        self.village_health = VILLAGE_MAX_HEALTH
-        self.towers = []
-        self.monsters = []
-        self.explosions = []
-        self.current_score = 0
-        self.game_time = 0.0
+        self.reset_simulation()
         
         # Réinitialiser les tours disponibles
         self.available_towers = [
@@ -1397,12 +1242,6 @@ class Game:
             {'type': TowerType.WEAK, 'count': 3, 'color': YELLOW}       # 3 tours faibles
         ]
         
-        # Réinitialiser la puissance de la lumière
-        self.light_power = LIGHT_MAX_POWER
-        self.light_active = False
-        self.light_position = None
-        self.light_in_cooldown = False
-        
         # Arrêter les sons en cours
         self.stop_voice()
         self.stop_background_music()
@@ -1414,16 +1253,8 @@ class Game:
 
     def handle_game_over(self):
         """Gère la fin de partie et l'enregistrement des scores"""
-        # Désactiver la lumière
-        self.light_active = False
-        self.light_position = None
-        
-        # Changer le mode de jeu
-        self.game_mode = GameMode.GAME_OVER
-        
-        # Vérifier si le score est un high score
-        waves_completed = self.wave_manager.current_wave if self.wave_manager else 0
-        self.final_score = self.current_score  # Sauvegarder le score final
+        # Désactiver la lumière, passer en GAME_OVER et sauvegarder le score final
+        super().handle_game_over()
         
         # Initialiser les variables pour la saisie du nom
         self.entering_name = True
@@ -1436,78 +1267,97 @@ class Game:
         else:
             self.is_high_score = False
             self.entering_name = False  # Pas besoin de saisir le nom si ce n'est pas un high score
+            # Gardé dans l'historique complet, sous le dernier nom saisi
+            self.save_score()
+
+    def save_score(self):
+        """Enregistre le score final pour la carte jouée"""
+        waves_completed = self.wave_manager.current_wave if self.wave_manager else 0
+        self.score_manager.add_score(self.player_name, self.final_score, self.game_time, waves_completed,
+                                     self.map_name)
+        self.leaderboard_entries = None
 
     def draw_ui(self):
         """Dessine l'interface utilisateur"""
-        font = pygame.font.Font(None, 36)
-        
         # Affichage du mode et de l'accélération
         mode_text = "Mode: " + self.game_mode.name
-        text_surface = font.render(mode_text, True, WHITE)
+        text_surface = self.text.render(mode_text, 36, WHITE)
         self.screen.blit(text_surface, (10, 10))
         
         if self.time_accelerated:
             speed_text = f"x{TIME_ACCELERATIONS[self.time_acceleration_index]}"
-            text_surface = font.render(speed_text, True, (255, 255, 0))
+            text_surface = self.text.render(speed_text, 36, (255, 255, 0))
             self.screen.blit(text_surface, (self.current_width - 60, 10))
         
         # Affichage du score et du temps en mode jeu
         if self.game_mode == GameMode.PLAY:
             minutes = int(self.game_time // 60)
             seconds = int(self.game_time % 60)
-            time_str = f"Temps: {minutes:02d}:{seconds:02d}"
-            score_str = f"Score: {self.current_score}"
             
             if self.wave_manager is not None:
-                wave_str = f"Vague: {self.wave_manager.current_wave + 1}"  # +1 pour affichage plus intuitif
+                wave_str = f"{self.wave_manager.current_wave + 1}"  # +1 pour affichage plus intuitif
             else:
-                wave_str = "Vague: --"
-                
-            time_surface = font.render(time_str, True, WHITE)
-            score_surface = font.render(score_str, True, WHITE)
-            wave_surface = font.render(wave_str, True, WHITE)
+                wave_str = "--"
             
-            self.screen.blit(time_surface, (10, 50))
-            self.screen.blit(score_surface, (10, 90))
-            self.screen.blit(wave_surface, (10, 130))
+            # Libellés rendus une fois, valeurs composées depuis l'atlas de chiffres
+            self.text.draw_value(self.screen, (10, 50), "Temps: ", f"{minutes:02d}:{seconds:02d}", 36, WHITE)
+            self.text.draw_value(self.screen, (10, 90), "Score: ", f"{self.current_score}", 36, WHITE)
+            self.text.draw_value(self.screen, (10, 130), "Vague: ", wave_str, 36, WHITE)
         
         # Affichage du leaderboard si nécessaire
         if self.show_leaderboard:
             self.draw_leaderboard()
 
+    def get_leaderboard_entries(self):
+        """Scores de la page affichée, relus seulement après un nouveau score ou un changement de page"""
+        if self.leaderboard_entries is None:
+            self.leaderboard_entries = self.score_manager.get_board_page(
+                SCORE_BOARDS[self.leaderboard_board], self.leaderboard_page, LEADERBOARD_SIZE, self.map_name)
+        return self.leaderboard_entries
+
     def draw_leaderboard(self):
         """Affiche le tableau des meilleurs scores"""
-        leaderboard_surface = pygame.Surface((self.current_width - 200, self.current_height - 200), pygame.SRCALPHA)
-        leaderboard_surface.fill((0, 0, 0, 220))  # Fond semi-transparent
+        leaderboard = self.get_leaderboard_entries()
+        entries = tuple((entry["player_name"], entry["score"], entry["survived_time"], entry["waves_completed"])
+                        for entry in leaderboard)
+        # Le score actuel n'est mis en évidence qu'en fin de partie
+        highlight = (self.player_name, self.final_score, self.game_time) if self.game_over else None
+        first_rank = self.leaderboard_page * LEADERBOARD_SIZE + 1
+        title = self.LEADERBOARD_TITLES[SCORE_BOARDS[self.leaderboard_board]]
+        leaderboard_surface = self.leaderboard_panel.get(self.current_width, self.current_height, entries, highlight,
+                                                         first_rank, title)
         
-        title_font = pygame.font.Font(None, 48)
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
+        # Dessiner le panneau du leaderboard centré
+        leaderboard_rect = leaderboard_surface.get_rect(center=(self.current_width // 2, self.current_height // 2))
+        self.screen.blit(leaderboard_surface, leaderboard_rect)
+
+    def build_leaderboard_panel(self, width, height, entries, highlight, first_rank=1, title="Meilleurs Scores"):
+        """Compose le panneau du leaderboard (bordure comprise)"""
+        leaderboard_surface = pygame.Surface((width - 200, height - 200), pygame.SRCALPHA)
+        leaderboard_surface.fill((0, 0, 0, 220))  # Fond semi-transparent
         
-        title_text = "Meilleurs Scores"
-        title_surface = title_font.render(title_text, True, (255, 255, 200))
+        title_surface = self.text.render(title, 48, (255, 255, 200))
         title_rect = title_surface.get_rect(center=(leaderboard_surface.get_width() // 2, 40))
         leaderboard_surface.blit(title_surface, title_rect)
         
-        leaderboard = self.score_manager.get_leaderboard()
         y_offset = 100
         
         # En-têtes
         headers = ["Rang", "Joueur", "Score", "Temps", "Vagues"]
         x_positions = [50, 120, 300, 400, 500]
         
-        for i, entry in enumerate(leaderboard):
-            rank_surface = font.render(f"{i+1}", True, (220, 220, 220))
-            name_surface = font.render(entry["player_name"], True, (220, 220, 220))
-            score_surface = font.render(f"{entry['score']}", True, (220, 220, 220))
+        for i, (player_name, score, survived_time, waves_completed) in enumerate(entries):
+            rank_surface = self.text.render(f"{first_rank + i}", 36, (220, 220, 220))
+            name_surface = self.text.render(player_name, 36, (220, 220, 220))
+            score_surface = self.text.render(f"{score}", 36, (220, 220, 220))
             
-            time_str = self.score_manager.format_time(entry["survived_time"])
-            time_surface = font.render(time_str, True, (220, 220, 220))
+            time_str = self.score_manager.format_time(survived_time)
+            time_surface = self.text.render(time_str, 36, (220, 220, 220))
             
-            waves_surface = font.render(f"{entry['waves_completed']}", True, (220, 220, 220))
+            waves_surface = self.text.render(f"{waves_completed}", 36, (220, 220, 220))
             
             # Mettre en évidence le score actuel
-            if self.game_over and entry["player_name"] == self.player_name and entry["score"] == self.final_score and entry["survived_time"] == self.game_time:
+            if highlight == (player_name, score, survived_time):
                 pygame.draw.rect(leaderboard_surface, (100, 100, 150, 100), 
                                (30, y_offset - 5, leaderboard_surface.get_width() - 60, 40))
             
@@ -1518,22 +1368,142 @@ class Game:
             leaderboard_surface.blit(waves_surface, (x_positions[4], y_offset))
             
             y_offset += 40
-            
-            # Limiter l'affichage à 10 scores
-            if i >= 9:
-                break
         
-        # Instructions pour fermer
-        instruction_text = "Appuyez sur ESPACE pour recommencer"
-        instruction_surface = small_font.render(instruction_text, True, (255, 200, 200))
+        # Instructions pour fermer et changer de page
+        instruction_text = "ESPACE : recommencer - Page préc./suiv. : parcourir - Tab : jour / semaine / tout"
+        instruction_surface = self.text.render(instruction_text, 24, (255, 200, 200))
         instruction_rect = instruction_surface.get_rect(center=(leaderboard_surface.get_width() // 2, leaderboard_surface.get_height() - 40))
         leaderboard_surface.blit(instruction_surface, instruction_rect)
         
-        # Dessiner le panneau du leaderboard centré
-        leaderboard_rect = leaderboard_surface.get_rect(center=(self.current_width // 2, self.current_height // 2))
-        self.screen.blit(leaderboard_surface, leaderboard_rect)
+        # Bordure
+        pygame.draw.rect(leaderboard_surface, (200, 200, 200), leaderboard_surface.get_rect(), 2)
+        return leaderboard_surface
+
+    def build_help_panel(self, width, height):
+        """Compose le panneau d'aide (bordure comprise)"""
+        help_surface = pygame.Surface((width - 100, height - 100), pygame.SRCALPHA)
+        help_surface.fill((0, 0, 0, 220))  # Fond semi-transparent
+        
+        help_texts = [
+            "Aide du jeu - Commandes clavier",
+            "",
+            "H : Afficher/masquer cette aide",
+            "R : Afficher/masquer les portées des tours",
+            "D : Afficher/masquer les informations de debug",
+            "S : Afficher/masquer le debug de vitesse/terrain",
+            "N : Afficher/masquer les noms des entités",
+            "M : Afficher/masquer les zones d'effet des monstres",
+            "G : Afficher/masquer la grille",
+            "T : Changer l'accélération du temps",
+            "P : Couper/activer la musique",
+            "V : Couper/activer les voix",
+            "L : Afficher le leaderboard (Tab : classement du jour, de la semaine ou complet)",
+            "F9 : Recommencer la vague en cours",
+            "F10 : Reprendre la dernière sauvegarde automatique",
+            "F11 : Basculer en mode plein écran",
+            "",
+            "Commandes souris:",
+            "Clic gauche : Placer/déplacer les tours (mode EDIT)",
+            "Clic droit : Supprimer une tour sélectionnée (mode EDIT) / Activer la lumière (mode PLAY)",
+            "Clic milieu/molette : Déplacer la carte",
+            "Molette haut/bas : Zoomer/dézoomer"
+        ]
+        
+        y_offset = 20
+        
+        # Titre
+        title_text = self.text.render(help_texts[0], 36, (255, 255, 200))
+        title_rect = title_text.get_rect(center=(help_surface.get_width() // 2, y_offset + 10))
+        help_surface.blit(title_text, title_rect)
+        y_offset += 50
+        
+        # Corps de l'aide
+        for i in range(1, len(help_texts)):
+            if help_texts[i] == "":
+                y_offset += 20
+                continue
+                
+            text_surface = self.text.render(help_texts[i], 28, (220, 220, 220))
+            help_surface.blit(text_surface, (30, y_offset))
+            y_offset += 30
+        
+        # Instructions pour fermer
+        close_text = self.text.render("Appuyez sur H pour fermer", 28, (255, 200, 200))
+        close_rect = close_text.get_rect(center=(help_surface.get_width() // 2, help_surface.get_height() - 30))
+        help_surface.blit(close_text, close_rect)
         
         # Bordure
-        pygame.draw.rect(self.screen, (200, 200, 200), leaderboard_rect, 2)
+        pygame.draw.rect(help_surface, (200, 200, 200), help_surface.get_rect(), 2)
+        return help_surface
+
+    def build_tower_panel(self, width, height, tower_counts):
+        """Compose le panneau des tours du mode EDIT, boutons GO et RESET compris"""
+        panel_top = height - TOWER_PANEL_HEIGHT
+        panel_surface = pygame.Surface((width, TOWER_PANEL_HEIGHT))
+        panel_surface.fill(GRAY)
+        
+        panel_x = 10
+        for tower_type, count in tower_counts:
+            if count > 0:
+                # Utiliser le sprite de la tour au lieu d'un cercle
+                scaled_sprite = self.sprite_cache.get_scaled(('tower', tower_type), self.tower_sprites[tower_type],
+                                                             (TOWER_SIZE, TOWER_SIZE))
+                panel_surface.blit(scaled_sprite, (panel_x, (TOWER_PANEL_HEIGHT - TOWER_SIZE) // 2))
+                text_surface = self.text.render(str(count), 24, WHITE)
+                panel_surface.blit(text_surface, (panel_x + TOWER_SIZE//2 - 5, TOWER_SIZE + 5))
+            panel_x += TOWER_SIZE + 10
+        
+        all_placed = all(count == 0 for _, count in tower_counts)
+        go_rect = self.go_button_rect.move(0, -panel_top)
+        button_color = GREEN if all_placed else GRAY
+        pygame.draw.rect(panel_surface, button_color, go_rect)
+        
+        text_color = WHITE if all_placed else (128, 128, 128)
+        text_surface = self.text.render("GO!", 36, text_color)
+        panel_surface.blit(text_surface, text_surface.get_rect(center=go_rect.center))
+        
+        # Dessiner le bouton RESET
+        reset_rect = self.reset_button_rect.move(0, -panel_top)
+        pygame.draw.rect(panel_surface, RED, reset_rect)
+        reset_surface = self.text.render("RESET", 36, WHITE)
+        panel_surface.blit(reset_surface, reset_surface.get_rect(center=reset_rect.center))
+        return panel_surface
+
+    def build_game_over_panel(self, final_score, is_high_score, entering_name):
+        """Compose l'écran de fin de partie sur un fond semi-transparent"""
+        panel = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        
+        game_over_text = self.text.render("GAME OVER", 100, (255, 0, 0))
+        # Ajouter un contour blanc pour plus de visibilité
+        game_over_outline = self.text.render("GAME OVER", 100, (255, 255, 255))
+        
+        text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 100))
+        # Dessiner le contour légèrement décalé
+        panel.blit(game_over_outline, (text_rect.x + 2, text_rect.y + 2))
+        panel.blit(game_over_text, text_rect)
+        
+        score_text = self.text.render(f"Score: {final_score}", 74, (255, 200, 0))
+        panel.blit(score_text, score_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 - 30)))
+        
+        if is_high_score:
+            highscore_text = self.text.render("Nouveau High Score!", 48, (0, 255, 0))
+            panel.blit(highscore_text, highscore_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 30)))
+        
+        if entering_name:
+            name_prompt = self.text.render("Entrez votre nom:", 48, (255, 255, 255))
+            panel.blit(name_prompt, name_prompt.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 70)))
+            
+            # Instructions pour la saisie
+            instruction_text = "Appuyez sur ENTRÉE ou ESPACE pour valider"
+            instruction_surface = self.text.render(instruction_text, 36, (200, 200, 200))
+            panel.blit(instruction_surface, instruction_surface.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 150)))
+        else:
+            restart_text = self.text.render("Appuyez sur ESPACE pour recommencer", 48, (255, 255, 255))
+            panel.blit(restart_text, restart_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 70)))
+            
+            leaderboard_text = self.text.render("Appuyez sur L pour voir le leaderboard", 48, (255, 255, 255))
+            panel.blit(leaderboard_text, leaderboard_text.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT/2 + 110)))
+        return panel
 
 
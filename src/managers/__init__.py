@@ -1,3 +1,5 @@
-from .wave_manager import WaveManager, Wave
+from .wave_manager import WaveManager, Wave, ScheduledSpawn
+from .asset_manager import AssetManager, AssetHandle, LazyAssets
+from .audio_manager import AudioManager, SoundLimit, VoicePlayer
 
-__all__ = ['WaveManager', 'Wave'] 
\ No newline at end of file
+__all__ = ['WaveManager', 'Wave', 'ScheduledSpawn', 'AssetManager', 'AssetHandle', 'LazyAssets', 'AudioManager', 'SoundLimit', 'VoicePlayer'] 
\ No newline at end of file
@@ -0,0 +1,132 @@
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.constants import ASSET_LOADER_WORKERS
+
+
+class AssetHandle:
+    """Ressource chargée en arrière-plan, à la manière d'un `Future`.
+
+    Le décodage (`loader`) tourne sur un thread du pool ; l'étape `finalize`
+    éventuelle (ex: `convert_alpha`) est faite sur le thread principal au
+    premier appel de `result`. Une ressource paresseuse n'est soumise au pool
+    qu'à sa première utilisation.
+    """
+
+    def __init__(self, manager: 'AssetManager', name: str, loader: Callable, args: tuple,
+                 finalize: Optional[Callable] = None):
+        self.manager = manager
+        self.name = name
+        self.loader = loader
+        self.args = args
+        self.finalize = finalize
+        self.future = None
+        self.value = None
+        self.resolved = False
+
+    def start(self) -> 'AssetHandle':
+        """Soumet le chargement au pool s'il ne l'est pas encore"""
+        if self.future is None:
+            self.future = self.manager.executor.submit(self.manager.timed, self.name, self.loader, *self.args)
+        return self
+
+    def done(self) -> bool:
+        return self.resolved or (self.future is not None and self.future.done())
+
+    def result(self) -> Any:
+        """Valeur de la ressource ; attend la fin du chargement si nécessaire"""
+        if not self.resolved:
+            value = self.start().future.result()
+            if self.finalize is not None:
+                start = time.perf_counter()
+                value = self.finalize(value)
+                self.manager.timings[self.name] += time.perf_counter() - start
+            self.value = value
+            self.resolved = True
+            self.loader = self.args = self.finalize = None
+        return self.value
+
+
+class LazyAssets(Mapping):
+    """Dictionnaire de poignées dont les valeurs sont résolues à la lecture"""
+
+    def __init__(self, handles: Dict[Any, AssetHandle]):
+        self.handles = handles
+
+    def __getitem__(self, key):
+        return self.handles[key].result()
+
+    def __iter__(self):
+        return iter(self.handles)
+
+    def __len__(self):
+        return len(self.handles)
+
+
+class AssetManager:
+    """Chargement des ressources sur un pool de threads, avec mesure des temps.
+
+    `load` démarre le décodage immédiatement, `lazy` seulement à la première
+    utilisation. `when_ready` diffère une action jusqu'à la fin d'un
+    chargement ; les actions sont exécutées par `poll`, sur le thread
+    principal, une fois par image.
+    """
+
+    def __init__(self, workers: int = ASSET_LOADER_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.timings: Dict[str, float] = {}  # Durée de chargement par ressource (secondes)
+        self.pending: List[tuple] = []  # (poignée, action) en attente de la fin du chargement
+
+    def timed(self, name: str, loader: Callable, *args) -> Any:
+        start = time.perf_counter()
+        try:
+            return loader(*args)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def load(self, name: str, loader: Callable, *args, finalize: Optional[Callable] = None) -> AssetHandle:
+        """Ressource chargée dès maintenant en arrière-plan"""
+        return AssetHandle(self, name, loader, args, finalize).start()
+
+    def lazy(self, name: str, loader: Callable, *args, finalize: Optional[Callable] = None) -> AssetHandle:
+        """Ressource chargée à sa première utilisation"""
+        return AssetHandle(self, name, loader, args, finalize)
+
+    def progress(self, handles: List[AssetHandle]) -> float:
+        """Fraction des poignées dont le chargement est terminé (0.0 à 1.0)"""
+        if not handles:
+            return 1.0
+        return sum(1 for handle in handles if handle.done()) / len(handles)
+
+    def when_ready(self, handle: AssetHandle, action: Callable[[Any], None]):
+        """Appelle `action(valeur)` dès que la ressource est chargée, sans bloquer l'image"""
+        if handle.done():
+            action(handle.result())
+            return
+        handle.start()
+        self.pending.append((handle, action))
+
+    def cancel(self, handle: AssetHandle):
+        """Oublie les actions en attente sur une ressource"""
+        self.pending = [(pending, action) for pending, action in self.pending if pending is not handle]
+
+    def poll(self):
+        """Exécute les actions dont la ressource vient de finir de charger"""
+        if not self.pending:
+            return
+        ready = [(handle, action) for handle, action in self.pending if handle.done()]
+        if not ready:
+            return
+        self.pending = [(handle, action) for handle, action in self.pending if not handle.done()]
+        for handle, action in ready:
+            action(handle.result())
+
+    def report(self):
+        """Affiche les temps de chargement, du plus long au plus court"""
+        for name, seconds in sorted(self.timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"Chargement {name}: {seconds * 1000:.1f} ms")
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
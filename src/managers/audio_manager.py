@@ -0,0 +1,178 @@
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pygame
+
+from ..constants import (
+    AUDIO_RESERVED_CHANNELS, AUDIO_FREE_CHANNELS, SOUND_FALLOFF_DISTANCE, SOUND_MIN_DISTANCE_VOLUME, SOUND_LIMITS,
+    VOICE_CHUNK_SECONDS
+)
+
+
+@dataclass
+class SoundLimit:
+    max_voices: int = 1   # Lectures simultanées maximales de ce son
+    cooldown: float = 0.0  # Délai minimal entre deux lectures (secondes)
+
+
+@dataclass
+class QueuedSound:
+    count: int = 0
+    distance: float = math.inf  # Distance à la caméra de l'événement le plus proche
+
+
+class VoicePlayer:
+    """Voix et dialogues lus par morceaux sur un canal dédié.
+
+    Chaque réplique est un tableau PCM (en général en memory-map depuis le
+    cache audio) ; seuls le morceau en cours et le suivant, mis en file du
+    canal, existent sous forme de `Sound`. Les répliques en attente sont des
+    poignées de chargement : la suivante se décode en arrière-plan pendant
+    que la précédente est lue, et s'enchaîne sans blanc.
+    """
+
+    def __init__(self, channel: pygame.mixer.Channel, chunk_seconds: float = VOICE_CHUNK_SECONDS):
+        self.channel = channel
+        frequency = pygame.mixer.get_init()[0]
+        self.chunk_samples = max(1, int(frequency * chunk_seconds))
+        self.lines = deque()  # (nom, poignée de chargement du PCM, volume)
+        self.current_name = None
+        self.current = None  # PCM de la réplique en cours d'envoi au canal
+        self.position = 0
+
+    def play(self, name: str, handle, volume: float):
+        """Ajoute une réplique à la file, sauf si elle est déjà en cours ou en attente"""
+        if name == self.current_name or any(line[0] == name for line in self.lines):
+            return
+        self.lines.append((name, handle.start(), volume))
+
+    def is_playing(self) -> bool:
+        return self.current is not None or bool(self.lines) or self.channel.get_busy()
+
+    def update(self):
+        """Garde un morceau en lecture et le suivant en file du canal"""
+        while not self.channel.get_busy() or self.channel.get_queue() is None:
+            if self.current is None and not self.start_next_line():
+                if not self.channel.get_busy():
+                    self.current_name = None
+                return
+            chunk = pygame.sndarray.make_sound(
+                np.ascontiguousarray(self.current[self.position:self.position + self.chunk_samples]))
+            self.position += self.chunk_samples
+            if self.position >= len(self.current):
+                self.current = None
+            if self.channel.get_busy():
+                self.channel.queue(chunk)
+            else:
+                self.channel.play(chunk)
+
+    def start_next_line(self) -> bool:
+        """Passe à la réplique suivante si son chargement est terminé"""
+        if not self.lines or not self.lines[0][1].done():
+            return False
+        name, handle, volume = self.lines.popleft()
+        samples = handle.result()
+        if samples is None or len(samples) == 0:
+            return bool(self.lines) and self.start_next_line()
+        self.current_name = name
+        self.current = samples
+        self.position = 0
+        self.channel.set_volume(volume)
+        return True
+
+    def stop(self):
+        self.lines.clear()
+        self.current = None
+        self.current_name = None
+        self.channel.stop()
+
+
+class AudioManager:
+    """Mixeur d'effets sonores à débit limité.
+
+    Les événements sonores d'une image sont mis en file par `queue` puis
+    fusionnés par nom : `flush` joue au plus une instance de chaque son par
+    image, sur un groupe fixe de canaux réservés, en respectant le nombre de
+    lectures simultanées et le délai propres à chaque son. Le volume dépend de
+    la distance à la caméra de l'événement le plus proche. Le coût par image
+    ne dépend que du nombre de sons différents, pas du nombre d'entités.
+    """
+
+    def __init__(self, sounds: Mapping[str, pygame.mixer.Sound], reserved_channels: int = AUDIO_RESERVED_CHANNELS):
+        self.sounds = sounds
+        # Canaux réservés aux effets, puis un canal pour les voix ; les autres restent libres
+        pygame.mixer.set_num_channels(reserved_channels + 1 + AUDIO_FREE_CHANNELS)
+        pygame.mixer.set_reserved(reserved_channels + 1)
+        self.channels = [pygame.mixer.Channel(index) for index in range(reserved_channels)]
+        self.voice = VoicePlayer(pygame.mixer.Channel(reserved_channels))
+        self.limits: Dict[str, SoundLimit] = {name: SoundLimit(*limit) for name, limit in SOUND_LIMITS.items()}
+        self.default_limit = SoundLimit()
+        self.queued: Dict[str, QueuedSound] = {}
+        self.last_played: Dict[str, float] = {}
+
+    def queue(self, sound_name: str, distance: Optional[float] = None):
+        """Ajoute un événement sonore à l'image en cours
+
+        Args:
+            distance: Distance à la caméra (unités du monde) ; None = volume plein
+        """
+        queued = self.queued.get(sound_name)
+        if queued is None:
+            queued = self.queued[sound_name] = QueuedSound()
+        queued.count += 1
+        queued.distance = min(queued.distance, 0.0 if distance is None else distance)
+
+    def flush(self, volume: float, now: Optional[float] = None):
+        """Joue les événements fusionnés de l'image puis vide la file
+
+        Args:
+            volume: Volume général des effets (0.0 à 1.0)
+            now: Instant courant en secondes (horloge de pygame par défaut)
+        """
+        if not self.queued:
+            return
+        if now is None:
+            now = pygame.time.get_ticks() / 1000.0
+
+        for sound_name, queued in self.queued.items():
+            sound = self.sounds.get(sound_name)
+            if not sound:
+                continue
+            limit = self.limits.get(sound_name, self.default_limit)
+            if now - self.last_played.get(sound_name, -math.inf) < limit.cooldown:
+                continue
+
+            free_channel = None
+            playing = 0
+            for channel in self.channels:
+                if not channel.get_busy():
+                    if free_channel is None:
+                        free_channel = channel
+                elif channel.get_sound() is sound:
+                    playing += 1
+            if free_channel is None or playing >= limit.max_voices:
+                continue
+
+            free_channel.play(sound)
+            free_channel.set_volume(volume * self.distance_volume(queued.distance))
+            self.last_played[sound_name] = now
+
+        self.queued.clear()
+
+    @staticmethod
+    def distance_volume(distance: float) -> float:
+        """Atténuation linéaire avec la distance, sans descendre sous SOUND_MIN_DISTANCE_VOLUME"""
+        return max(SOUND_MIN_DISTANCE_VOLUME, 1.0 - distance / SOUND_FALLOFF_DISTANCE)
+
+    def update(self):
+        """Alimente le canal des voix ; à appeler une fois par image"""
+        self.voice.update()
+
+    def stop(self):
+        """Coupe les effets en cours et oublie ceux en attente"""
+        self.queued.clear()
+        for channel in self.channels:
+            channel.stop()
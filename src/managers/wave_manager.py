@@ -1,5 +1,6 @@
 import random
 import math
+from collections import deque
 from dataclasses import dataclass
 from typing import List
 from ..constants import (
@@ -14,17 +15,22 @@ class Wave:
     spawn_distance: float  # Distance de spawn du village
     wave_delay: float     # Délai avant la prochaine vague en secondes
 
+@dataclass
+class ScheduledSpawn:
+    spawn_time: float     # Instant d'apparition en temps de simulation
+    wave_index: int
+    monster_type: MonsterType
+    group_factor: float
+    last_of_wave: bool    # Le spawn termine sa vague
+
 class WaveManager:
     def __init__(self, village_x, village_y, game):
         self.village_x = village_x
         self.village_y = village_y
         self.game = game  # Référence au jeu
         self.current_wave = 0
-        self.wave_started = False
-        self.last_spawn_time = 0
-        self.current_monster_index = 0
-        self.monsters_to_spawn = []
         self.next_wave_time = 0
+        self.spawn_queue = deque()  # Calendrier des spawns, trié par instant d'apparition
         
         # Définition des vagues
         self.waves = [
@@ -68,6 +74,33 @@ class WaveManager:
                 wave_delay=0  # Dernière vague
             )
         ]
+        
+        self.build_schedule()
+
+    def build_schedule(self):
+        """Précalcule le calendrier de tous les spawns en temps de simulation.
+
+        Chaque monstre apparaît `spawn_delay` secondes après le précédent ;
+        une vague commence `wave_delay` secondes après le dernier spawn de la
+        vague précédente.
+        """
+        self.spawn_queue.clear()
+        wave_start = 0.0
+        last_spawn_time = 0.0
+        for wave_index, wave in enumerate(self.waves):
+            entries = [
+                (wave_monster.monster_type, wave_monster.spawn_delay,
+                 Monster.MONSTER_STATS[wave_monster.monster_type]['group_factor'])
+                for wave_monster in wave.monsters
+                for _ in range(wave_monster.count)
+            ]
+            for entry_index, (monster_type, spawn_delay, group_factor) in enumerate(entries):
+                last_spawn_time = max(wave_start, last_spawn_time + spawn_delay)
+                self.spawn_queue.append(ScheduledSpawn(
+                    last_spawn_time, wave_index, monster_type, group_factor,
+                    last_of_wave=entry_index == len(entries) - 1
+                ))
+            wave_start = last_spawn_time + wave.wave_delay
 
     def get_spawn_position(self, distance, group_factor):
         """Calcule une position de spawn en tenant compte du facteur de groupe"""
@@ -88,48 +121,27 @@ class WaveManager:
         return x, y, angle
 
     def update(self, current_time):
-        """Met à jour la gestion des vagues"""
-        if self.current_wave >= len(self.waves):
-            return None  # Plus de vagues
-            
-        if not self.wave_started:
-            if current_time >= self.next_wave_time:
-                self.wave_started = True
-                self.prepare_next_wave()
-            return None
-            
-        if current_time - self.last_spawn_time >= self.monsters_to_spawn[0][1]:
-            monster_type, _, group_factor = self.monsters_to_spawn.pop(0)
+        """Renvoie la liste des monstres dont l'instant de spawn est atteint
+        
+        Args:
+            current_time: Temps de simulation écoulé depuis le début de la partie
+        """
+        spawned = []
+        queue = self.spawn_queue
+        while queue and queue[0].spawn_time <= current_time:
+            spawn = queue.popleft()
             x, y, angle = self.get_spawn_position(
-                self.waves[self.current_wave].spawn_distance,
-                group_factor
+                self.waves[spawn.wave_index].spawn_distance,
+                spawn.group_factor
             )
+            spawned.append(self.generate_monster(spawn.monster_type, x, y))
             
-            self.last_spawn_time = current_time
-            
-            if not self.monsters_to_spawn:  # Fin de la vague
-                self.wave_started = False
-                self.current_wave += 1
-                self.next_wave_time = current_time + self.waves[self.current_wave-1].wave_delay
-                
-            return Monster(monster_type, x, y, self.game)
-            
-        return None
-
-    def prepare_next_wave(self):
-        """Prépare la liste des monstres à spawner pour la prochaine vague"""
-        self.monsters_to_spawn = []
-        wave = self.waves[self.current_wave]
+            if spawn.last_of_wave:  # Fin de la vague
+                self.current_wave = spawn.wave_index + 1
+                self.next_wave_time = spawn.spawn_time + self.waves[spawn.wave_index].wave_delay
         
-        for wave_monster in wave.monsters:
-            for _ in range(wave_monster.count):
-                group_factor = Monster.MONSTER_STATS[wave_monster.monster_type]['group_factor']
-                self.monsters_to_spawn.append((
-                    wave_monster.monster_type,
-                    wave_monster.spawn_delay,
-                    group_factor
-                )) 
+        return spawned
 
     def generate_monster(self, monster_type, x, y):
         """Crée un nouveau monstre"""
-        return Monster(monster_type, x, y, self.game)  # Passer la référence au jeu 
\ No newline at end of file
+        return self.game.create_monster(monster_type, x, y)  # Stockage éventuellement vectorisé 
\ No newline at end of file
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+from src.constants import MAP_CACHE_DIR, BACKGROUND_TILE_SIZE, ATLAS_SPRITE_MAX_SIZE
+from src.terrain import SPEED_MASK_PATH, TerrainGrid
+
+BACKGROUND_PATH = "src/assets/background.png"
+
+
+def source_hash(path: str) -> str:
+    """Empreinte du contenu d'un fichier source, utilisée comme clé du cache"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def cache_dir_for(kind: str, path: str, *params) -> str:
+    """Dossier du cache pour un fichier source et des paramètres de précalcul donnés"""
+    suffix = ''.join(f"-{param}" for param in params)
+    return os.path.join(MAP_CACHE_DIR, f"{kind}-{source_hash(path)}{suffix}")
+
+
+def save_arrays(directory: str, arrays: dict) -> bool:
+    """Écrit des tableaux .npy de façon atomique (fichier temporaire puis renommage)"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        for name, array in arrays.items():
+            final_path = os.path.join(directory, f"{name}.npy")
+            temp_path = final_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(temp_path, final_path)
+        return True
+    except OSError as e:
+        print(f"Impossible d'écrire le cache de carte dans {directory}: {e}")
+        return False
+
+
+def load_terrain(path: str = SPEED_MASK_PATH, resolution: Optional[int] = None) -> TerrainGrid:
+    """Grille de terrain lue depuis le cache (memory-map), précalculée au premier lancement.
+
+    Sans fichier source, retombe sur `TerrainGrid.load` et son terrain par défaut.
+    """
+    if not os.path.exists(path):
+        return TerrainGrid.load(path, resolution)
+
+    directory = cache_dir_for("terrain", path, resolution or "full")
+    try:
+        values = np.load(os.path.join(directory, "values.npy"), mmap_mode='r')
+        multipliers = np.load(os.path.join(directory, "multipliers.npy"), mmap_mode='r')
+        return TerrainGrid(values, multipliers=multipliers)
+    except (OSError, ValueError):
+        return bake_terrain(path, resolution, directory)
+
+
+def bake_terrain(path: str, resolution: Optional[int], directory: str) -> TerrainGrid:
+    """Décode l'image de terrain et écrit valeurs uint8 et multiplicateurs dans le cache"""
+    terrain = TerrainGrid.load(path, resolution)
+    save_arrays(directory, {"values": terrain.values, "multipliers": terrain.multipliers})
+    return terrain
+
+
+def load_background_levels(path: str = BACKGROUND_PATH, tile_size: int = BACKGROUND_TILE_SIZE,
+                           convert: bool = True) -> List[pygame.Surface]:
+    """Pyramide de mips du fond, lue depuis le cache ou précalculée au premier lancement.
+
+    Avec `convert`, nécessite une fenêtre ouverte (les surfaces sont converties
+    au format d'affichage) ; sans, la conversion est laissée à l'appelant,
+    par exemple sur le thread principal après un chargement en arrière-plan.
+    """
+    from src.rendering import TiledLayer
+
+    directory = cache_dir_for("background", path, tile_size)
+    levels = []
+    level = 0
+    while True:
+        level_path = os.path.join(directory, f"mip{level}.npy")
+        if not os.path.exists(level_path):
+            break
+        try:
+            pixels = np.load(level_path, mmap_mode='r')
+        except (OSError, ValueError):
+            levels = []
+            break
+        surface = pygame.surfarray.make_surface(pixels)
+        levels.append(surface.convert() if convert else surface)
+        level += 1
+    if levels and max(levels[-1].get_size()) <= tile_size:
+        return levels
+
+    # Cache absent ou incomplet : décodage et réduction, puis écriture
+    background = pygame.image.load(path)
+    if convert:
+        background = background.convert()
+    levels = TiledLayer.build_mips(background, tile_size)
+    save_arrays(directory, {f"mip{index}": pygame.surfarray.array3d(surface)
+                            for index, surface in enumerate(levels)})
+    return levels
+
+
+def sources_key(sources: Dict[str, str]) -> str:
+    """Empreinte d'un ensemble de fichiers d'après leur taille et leur date, sans les lire"""
+    stats = []
+    for name, path in sorted(sources.items()):
+        stat = os.stat(path)
+        stats.append((name, path, stat.st_size, stat.st_mtime_ns))
+    return hashlib.sha256(json.dumps(stats).encode('utf-8')).hexdigest()[:16]
+
+
+def load_sprite_atlas(sources: Dict[str, str], max_size: int = ATLAS_SPRITE_MAX_SIZE, convert: bool = True):
+    """Atlas des sprites (nom -> fichier image), relu depuis le cache ou construit au premier lancement.
+
+    Avec `convert`, nécessite une fenêtre ouverte ; sans, l'appelant utilise
+    `SpriteAtlas.converted` sur le thread principal.
+    """
+    from src.rendering import SpriteAtlas
+
+    directory = os.path.join(MAP_CACHE_DIR, f"atlas-{sources_key(sources)}-{max_size}")
+    try:
+        atlas = SpriteAtlas.load(directory)
+    except (OSError, ValueError):
+        atlas = None
+    if atlas is None or set(atlas.index) != set(sources):
+        # Cache absent ou incomplet : décodage de chaque image, puis écriture
+        atlas = SpriteAtlas.build(sources, max_size)
+        try:
+            atlas.save(directory)
+        except OSError as e:
+            print(f"Impossible d'écrire l'atlas des sprites dans {directory}: {e}")
+    return atlas.converted() if convert else atlas
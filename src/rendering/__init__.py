@@ -0,0 +1,11 @@
+from .sprite_cache import SpriteCache, quantize_zoom
+from .tiled_layer import TiledLayer
+from .lighting import LightingBuffer
+from .overlay import OverlayLayer
+from .text import TextRenderer, GlyphAtlas
+from .ui_panel import RetainedPanel
+from .sprite_batch import SpriteBatch
+from .heatmap import terrain_heatmap
+from .sprite_atlas import SpriteAtlas
+
+__all__ = ['SpriteCache', 'quantize_zoom', 'TiledLayer', 'LightingBuffer', 'OverlayLayer', 'TextRenderer', 'GlyphAtlas', 'RetainedPanel', 'SpriteBatch', 'terrain_heatmap', 'SpriteAtlas']
@@ -0,0 +1,22 @@
+import numpy as np
+import pygame
+
+from src.constants import TERRAIN_HEATMAP_ALPHA
+
+
+def terrain_heatmap(terrain, alpha: int = TERRAIN_HEATMAP_ALPHA) -> pygame.Surface:
+    """Rend les multiplicateurs de vitesse du terrain en une texture colorée semi-transparente.
+
+    Rouge pour le terrain le plus lent (0.5x), jaune à mi-chemin, vert pour
+    le terrain le plus rapide (1.0x). La texture a la résolution de la grille
+    de terrain (indexée [x, y], comme les surfaces pygame).
+    """
+    speed = np.clip((terrain.multipliers - 0.5) / 0.5, 0.0, 1.0)
+    heatmap = pygame.Surface((terrain.width, terrain.height), pygame.SRCALPHA)
+    colors = pygame.surfarray.pixels3d(heatmap)
+    colors[..., 0] = (255 * np.minimum(1.0, 2.0 * (1.0 - speed))).astype(np.uint8)
+    colors[..., 1] = (255 * np.minimum(1.0, 2.0 * speed)).astype(np.uint8)
+    colors[..., 2] = 0
+    del colors
+    pygame.surfarray.pixels_alpha(heatmap)[...] = alpha
+    return heatmap
@@ -0,0 +1,121 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from src.constants import (LIGHT_MAX_POWER, LIGHT_MAX_RANGE, LIGHT_RADIUS,
+                           LIGHT_STAMP_MAX_SIZE, LIGHT_STAMP_CACHE_SIZE, LIGHT_STAMP_FALLOFF)
+from src.rendering.sprite_cache import quantize_zoom
+
+
+class LightingBuffer:
+    """Tampon de lumière de la taille de l'écran, conservé d'une image à l'autre.
+
+    Les lumières sont des tampons à dégradé radial précalculés (par rayon et
+    par pas de zoom) combinés avec un maximum, ce qui reproduit le
+    recouvrement des anciens disques pleins. Le tampon n'est recomposé que si
+    la caméra, les tours ou la lumière du joueur changent ; sinon l'image
+    précédente est réutilisée telle quelle.
+    """
+
+    def __init__(self):
+        self.buffer = None
+        self.static_buffer = None  # Lumières des tours et du village seules
+        self.static_key = None
+        self.light_key = None  # Lumière du joueur présente dans `buffer`
+        self.dirty = True
+        self.stamps = OrderedDict()
+
+    def get_stamp(self, size, intensity, inner_intensity, inner_ratio):
+        """Tampon carré de `size` pixels : cœur à `inner_intensity`, puis `intensity`, fondu au bord"""
+        key = (size, intensity, inner_intensity, inner_ratio)
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            self.stamps.move_to_end(key)
+            return stamp
+
+        radius = size / 2
+        coords = np.arange(size, dtype=np.float32) + 0.5 - radius
+        distance = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2) / radius
+        core = np.clip((inner_ratio + LIGHT_STAMP_FALLOFF - distance) / LIGHT_STAMP_FALLOFF, 0.0, 1.0)
+        edge = np.clip((1.0 - distance) / LIGHT_STAMP_FALLOFF, 0.0, 1.0)
+        values = ((intensity + (inner_intensity - intensity) * core) * edge).astype(np.uint8)
+        stamp = pygame.surfarray.make_surface(np.repeat(values[:, :, None], 3, axis=2))
+
+        self.stamps[key] = stamp
+        if len(self.stamps) > LIGHT_STAMP_CACHE_SIZE:
+            self.stamps.popitem(last=False)
+        return stamp
+
+    def stamp(self, target, screen_x, screen_y, radius, zoom, intensity,
+              inner_intensity=None, inner_ratio=0.0):
+        """Ajoute une lumière de `radius` unités du monde centrée sur (screen_x, screen_y)"""
+        diameter = 2 * int(radius * quantize_zoom(zoom))
+        if diameter <= 0:
+            return
+        if inner_intensity is None:
+            inner_intensity = intensity
+        size = min(diameter, LIGHT_STAMP_MAX_SIZE)
+        stamp = self.get_stamp(size, intensity, inner_intensity, inner_ratio)
+
+        bounds = pygame.Rect(0, 0, diameter, diameter)
+        bounds.center = (int(screen_x), int(screen_y))
+        visible = bounds.clip(target.get_rect())
+        if visible.width == 0 or visible.height == 0:
+            return
+
+        if size == diameter:
+            area = visible.move(-bounds.x, -bounds.y)
+            target.blit(stamp, visible.topleft, area, special_flags=pygame.BLEND_RGB_MAX)
+            return
+
+        # Grande lumière : seule la partie visible du tampon réduit est agrandie
+        ratio = size / diameter
+        left = int((visible.x - bounds.x) * ratio)
+        top = int((visible.y - bounds.y) * ratio)
+        area = pygame.Rect(left, top,
+                           max(1, min(size - left, int(visible.width * ratio + 1))),
+                           max(1, min(size - top, int(visible.height * ratio + 1))))
+        scaled = pygame.transform.smoothscale(stamp.subsurface(area), visible.size)
+        target.blit(scaled, visible.topleft, special_flags=pygame.BLEND_RGB_MAX)
+
+    def compose(self, game):
+        """Renvoie le tampon de lumière à jour pour l'état courant du jeu"""
+        screen_size = game.screen.get_size()
+        if self.buffer is None or self.buffer.get_size() != screen_size:
+            self.buffer = pygame.Surface(screen_size)
+            self.static_buffer = pygame.Surface(screen_size)
+            self.static_key = None
+
+        static_key = (screen_size, game.camera_x, game.camera_y, game.zoom,
+                      game.village_x, game.village_y,
+                      tuple((tower.x, tower.y, tower.vision_range) for tower in game.towers))
+        if static_key != self.static_key:
+            self.compose_static(game)
+            self.static_key = static_key
+            self.dirty = True
+
+        player_light = None
+        if game.light_active and game.light_position and game.light_power > 0:
+            intensity = int(60 * (game.light_power / LIGHT_MAX_POWER))
+            player_light = (game.light_position, intensity)
+        if not self.dirty and player_light == self.light_key:
+            return self.buffer
+
+        self.buffer.blit(self.static_buffer, (0, 0))
+        if player_light is not None:
+            (light_x, light_y), intensity = player_light
+            screen_x, screen_y = game.world_to_screen(light_x, light_y)
+            self.stamp(self.buffer, screen_x, screen_y, LIGHT_RADIUS, game.zoom,
+                       intensity, min(255, int(intensity * 1.5)), 0.6)
+        self.light_key = player_light
+        self.dirty = False
+        return self.buffer
+
+    def compose_static(self, game):
+        self.static_buffer.fill((0, 0, 0))
+        for tower in game.towers:
+            screen_x, screen_y = game.world_to_screen(tower.x, tower.y)
+            self.stamp(self.static_buffer, screen_x, screen_y, tower.vision_range, game.zoom, 30)
+        village_x, village_y = game.world_to_screen(game.village_x, game.village_y)
+        self.stamp(self.static_buffer, village_x, village_y, LIGHT_MAX_RANGE, game.zoom, 30)
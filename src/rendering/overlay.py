@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+import pygame
+
+from src.constants import OVERLAY_STAMP_MAX_RADIUS, OVERLAY_STAMP_CACHE_SIZE
+
+
+class OverlayLayer:
+    """Calque transparent unique pour les zones de portée, le debug et les effets.
+
+    Le calque garde la taille de l'écran et n'est jamais réalloué : seule la
+    zone salie à l'image précédente est effacée, chaque forme n'écrit que
+    dans son rectangle englobant, et le calque est affiché en un blit par
+    étape de l'image (`present`), pour garder l'ordre de superposition avec
+    les sprites et les lumières. Les cercles se superposent avec un mélange alpha, comme lorsque chaque
+    entité affichait sa propre surface.
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.scratch = None  # Surface de travail pour les grands cercles
+        self.dirty = None  # Rectangle englobant de ce qui a été dessiné
+        self.stamps = OrderedDict()
+
+    def begin(self, screen_size):
+        """Prépare le calque pour une nouvelle image"""
+        if self.surface is None or self.surface.get_size() != screen_size:
+            self.surface = pygame.Surface(screen_size, pygame.SRCALPHA)
+            self.scratch = pygame.Surface(screen_size, pygame.SRCALPHA)
+        elif self.dirty is not None:
+            self.surface.fill((0, 0, 0, 0), self.dirty)
+        self.dirty = None
+
+    def mark(self, rect):
+        rect = rect.clip(self.surface.get_rect())
+        if rect.width and rect.height:
+            self.dirty = rect if self.dirty is None else self.dirty.union(rect)
+
+    def get_circle_stamp(self, color, radius, width):
+        key = (color, radius, width)
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            self.stamps.move_to_end(key)
+            return stamp
+        stamp = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, color, (radius, radius), radius, width)
+        self.stamps[key] = stamp
+        if len(self.stamps) > OVERLAY_STAMP_CACHE_SIZE:
+            self.stamps.popitem(last=False)
+        return stamp
+
+    def circle(self, color, center, radius, width=0, cache=True):
+        """Cercle (plein si width=0) en couleur RGBA
+
+        Args:
+            cache: Garder le cercle prérendu ; à désactiver pour les rayons qui
+                changent à chaque image (explosions)
+        """
+        radius = int(radius)
+        if radius <= 0:
+            return
+        bounds = pygame.Rect(int(center[0]) - radius, int(center[1]) - radius, radius * 2, radius * 2)
+        visible = bounds.clip(self.surface.get_rect())
+        if visible.width == 0 or visible.height == 0:
+            return
+
+        if cache and radius <= OVERLAY_STAMP_MAX_RADIUS:
+            stamp = self.get_circle_stamp(color, radius, width)
+            self.surface.blit(stamp, visible.topleft, visible.move(-bounds.x, -bounds.y))
+        else:
+            # Dessin dans la seule partie visible de la surface de travail, puis mélange
+            self.scratch.fill((0, 0, 0, 0), visible)
+            self.scratch.set_clip(visible)
+            pygame.draw.circle(self.scratch, color, (int(center[0]), int(center[1])), radius, width)
+            self.scratch.set_clip(None)
+            self.surface.blit(self.scratch, visible.topleft, visible)
+        self.mark(visible)
+
+    def line(self, color, start, end, width=1):
+        """Segment en couleur RGBA, mélangé comme les cercles à ce qui est déjà dans le calque"""
+        left = int(min(start[0], end[0])) - width
+        top = int(min(start[1], end[1])) - width
+        bounds = pygame.Rect(left, top, int(max(start[0], end[0])) + width + 1 - left,
+                             int(max(start[1], end[1])) + width + 1 - top)
+        visible = bounds.clip(self.surface.get_rect())
+        if visible.width == 0 or visible.height == 0:
+            return
+        self.scratch.fill((0, 0, 0, 0), visible)
+        self.scratch.set_clip(visible)
+        pygame.draw.line(self.scratch, color, start, end, width)
+        self.scratch.set_clip(None)
+        self.surface.blit(self.scratch, visible.topleft, visible)
+        self.mark(visible)
+
+    def present(self, screen):
+        """Affiche ce qui a été dessiné depuis l'étape précédente, puis vide le calque"""
+        if self.dirty is not None:
+            screen.blit(self.surface, self.dirty.topleft, self.dirty)
+            self.surface.fill((0, 0, 0, 0), self.dirty)
+            self.dirty = None
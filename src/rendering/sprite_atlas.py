@@ -0,0 +1,100 @@
+import json
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+import pygame
+
+from src.constants import ATLAS_SPRITE_MAX_SIZE, ATLAS_MAX_WIDTH
+
+ATLAS_PADDING = 1  # Pixels vides entre deux sprites, pour éviter les débordements au filtrage
+
+
+class SpriteAtlas:
+    """Sprites du jeu regroupés dans une seule image, avec un index nom -> rectangle.
+
+    Chaque sprite est une sous-surface de l'image commune : un seul fichier à
+    lire et une seule surface à convertir au démarrage, et les rectangles de
+    `index` permettent d'adresser n'importe quel sprite depuis cette source.
+    """
+
+    def __init__(self, surface: pygame.Surface, index: Dict[str, Tuple[int, int, int, int]]):
+        self.surface = surface
+        self.index = {name: tuple(rect) for name, rect in index.items()}
+        self.sprites = {name: surface.subsurface(rect) for name, rect in self.index.items()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sprites
+
+    def get(self, name: str) -> pygame.Surface:
+        return self.sprites[name]
+
+    def converted(self) -> 'SpriteAtlas':
+        """Atlas dont l'image est convertie au format d'affichage (nécessite une fenêtre ouverte)"""
+        return SpriteAtlas(self.surface.convert_alpha(), self.index)
+
+    @staticmethod
+    def pack(sizes: Dict[str, Tuple[int, int]], max_width: int = ATLAS_MAX_WIDTH):
+        """Rangement par étagères : sprites triés par hauteur, posés de gauche à droite
+
+        Returns:
+            (positions par nom, largeur, hauteur) de l'atlas
+        """
+        positions = {}
+        x = y = shelf_height = width = 0
+        for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+            if x > 0 and x + w > max_width:
+                y += shelf_height + ATLAS_PADDING
+                x = shelf_height = 0
+            positions[name] = (x, y)
+            x += w + ATLAS_PADDING
+            width = max(width, x - ATLAS_PADDING)
+            shelf_height = max(shelf_height, h)
+        return positions, max(1, width), max(1, y + shelf_height)
+
+    @classmethod
+    def build(cls, sources: Dict[str, str], max_size: int = ATLAS_SPRITE_MAX_SIZE) -> 'SpriteAtlas':
+        """Décode chaque image source, la réduit à `max_size` pixels au plus et les regroupe"""
+        images = {name: cls.fit(pygame.image.load(path), max_size) for name, path in sources.items()}
+        positions, width, height = cls.pack({name: image.get_size() for name, image in images.items()})
+        surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+        index = {}
+        for name, image in images.items():
+            surface.blit(image, positions[name])
+            index[name] = (*positions[name], *image.get_size())
+        return cls(surface, index)
+
+    @staticmethod
+    def fit(image: pygame.Surface, max_size: int) -> pygame.Surface:
+        """Image en 32 bits avec transparence, réduite pour tenir dans un carré de `max_size`"""
+        if image.get_bitsize() != 32 or not image.get_flags() & pygame.SRCALPHA:
+            rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+            rgba.blit(image, (0, 0))
+            image = rgba
+        width, height = image.get_size()
+        scale = max_size / max(width, height)
+        if scale < 1:
+            image = pygame.transform.smoothscale(image, (max(1, round(width * scale)), max(1, round(height * scale))))
+        return image
+
+    def save(self, directory: str):
+        """Écrit l'image (pixels RGBA bruts, .npy) et l'index JSON"""
+        os.makedirs(directory, exist_ok=True)
+        width, height = self.surface.get_size()
+        pixels = np.frombuffer(pygame.image.tobytes(self.surface, 'RGBA'), dtype=np.uint8).reshape(height, width, 4)
+        for filename, write in (("atlas.npy", lambda f: np.save(f, pixels)),
+                                ("index.json", lambda f: f.write(json.dumps(self.index).encode('utf-8')))):
+            final_path = os.path.join(directory, filename)
+            with open(final_path + ".tmp", 'wb') as f:
+                write(f)
+            os.replace(final_path + ".tmp", final_path)
+
+    @classmethod
+    def load(cls, directory: str) -> 'SpriteAtlas':
+        """Relit un atlas écrit par `save` (l'image n'est pas décodée, seulement copiée)"""
+        with open(os.path.join(directory, "index.json"), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        pixels = np.load(os.path.join(directory, "atlas.npy"), mmap_mode='r')
+        height, width = pixels.shape[:2]
+        surface = pygame.image.frombytes(pixels.tobytes(), (width, height), 'RGBA')
+        return cls(surface, index)
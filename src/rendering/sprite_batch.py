@@ -0,0 +1,110 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from src.constants import BATCH_SPRITE_CACHE_SIZE
+
+
+class SpriteBatch:
+    """Liste de dessin d'une image : sprites, barres de vie, projectiles et contours.
+
+    Les commandes sont collectées en coordonnées du monde (avec un décalage
+    éventuel en pixels écran), toutes les positions sont converties en une
+    seule opération NumPy, puis les sprites sont envoyés en un seul appel à
+    `Surface.blits`. Barres de vie et projectiles sont des petits sprites
+    pré-rendus et gardés en cache.
+    """
+
+    def __init__(self):
+        self.cached_sprites = OrderedDict()
+        self.clear()
+
+    def clear(self):
+        self.surfaces = []
+        self.world_x = []
+        self.world_y = []
+        self.offset_x = []
+        self.offset_y = []
+        self.polygons = []  # (couleur, épaisseur, nombre de sommets)
+        self.polygon_points = []
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def add_sprite(self, surface, x, y, offset_x=0.0, offset_y=0.0):
+        """Sprite dont le coin supérieur gauche est en (x, y) monde + (offset_x, offset_y) pixels"""
+        self.surfaces.append(surface)
+        self.world_x.append(x)
+        self.world_y.append(y)
+        self.offset_x.append(offset_x)
+        self.offset_y.append(offset_y)
+
+    def add_centered(self, surface, x, y, offset_x=0.0, offset_y=0.0):
+        """Sprite centré sur (x, y) monde"""
+        self.add_sprite(surface, x, y,
+                        offset_x - surface.get_width() / 2, offset_y - surface.get_height() / 2)
+
+    def add_health_bar(self, x, y, ratio, width, height, offset_y):
+        """Barre de vie de `width` x `height` pixels centrée horizontalement sur (x, y)"""
+        width = max(1, int(width))
+        height = max(1, int(height))
+        filled = int(width * ratio)
+        color = (0, 255, 0) if ratio > 0.5 else (255, 255, 0) if ratio > 0.25 else (255, 0, 0)
+        bar = self.get_cached(('health', width, height, filled, color), self.build_health_bar)
+        self.add_sprite(bar, x, y, -width / 2, offset_y)
+
+    def add_circle(self, color, x, y, radius):
+        """Disque plein de `radius` pixels centré sur (x, y) monde (ex: projectile)"""
+        radius = int(radius)
+        if radius <= 0:
+            return
+        circle = self.get_cached(('circle', tuple(color), radius), self.build_circle)
+        self.add_sprite(circle, x, y, -radius, -radius)
+
+    def add_polygon(self, color, points, width=0):
+        """Contour ou polygone plein dont les sommets sont en coordonnées du monde"""
+        self.polygons.append((color, width, len(points)))
+        self.polygon_points.extend(points)
+
+    def get_cached(self, key, build):
+        surface = self.cached_sprites.get(key)
+        if surface is not None:
+            self.cached_sprites.move_to_end(key)
+            return surface
+        surface = self.cached_sprites[key] = build(*key[1:])
+        if len(self.cached_sprites) > BATCH_SPRITE_CACHE_SIZE:
+            self.cached_sprites.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def build_health_bar(width, height, filled, color):
+        bar = pygame.Surface((width, height))
+        bar.fill((64, 64, 64))
+        if filled > 0:
+            bar.fill(color, (0, 0, filled, height))
+        return bar
+
+    @staticmethod
+    def build_circle(color, radius):
+        circle = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(circle, color, (radius, radius), radius)
+        return circle
+
+    def flush(self, screen, camera_x, camera_y, zoom, center_x, center_y):
+        """Convertit toutes les positions en une fois, dessine la liste puis la vide"""
+        if self.polygons:
+            points = (np.asarray(self.polygon_points, dtype=np.float64) - (camera_x, camera_y)) * zoom + (center_x, center_y)
+            points = points.tolist()
+            start = 0
+            for color, width, count in self.polygons:
+                pygame.draw.polygon(screen, color, points[start:start + count], width)
+                start += count
+
+        if self.surfaces:
+            screen_x = (np.asarray(self.world_x) - camera_x) * zoom + center_x + np.asarray(self.offset_x)
+            screen_y = (np.asarray(self.world_y) - camera_y) * zoom + center_y + np.asarray(self.offset_y)
+            positions = zip(screen_x.astype(np.int64).tolist(), screen_y.astype(np.int64).tolist())
+            screen.blits(list(zip(self.surfaces, positions)), doreturn=False)
+
+        self.clear()
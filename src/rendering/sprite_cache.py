@@ -0,0 +1,68 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+from src.constants import SPRITE_CACHE_BUDGET, ZOOM_STEPS_PER_DOUBLING
+
+
+def quantize_zoom(zoom):
+    """Arrondit le zoom au pas logarithmique le plus proche (ZOOM_STEPS_PER_DOUBLING pas par doublement)"""
+    return 2 ** (round(math.log2(zoom) * ZOOM_STEPS_PER_DOUBLING) / ZOOM_STEPS_PER_DOUBLING)
+
+
+class SpriteCache:
+    """Cache des sprites redimensionnés, indexé par (asset, taille cible).
+
+    Les entrées les moins récemment utilisées sont évincées quand la mémoire
+    occupée dépasse `byte_budget`. Tant que le zoom ne change pas, aucun
+    redimensionnement n'est refait.
+    """
+
+    def __init__(self, byte_budget=SPRITE_CACHE_BUDGET):
+        self.byte_budget = byte_budget
+        self.bytes_used = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_scaled(self, key, surface, size):
+        """Renvoie `surface` redimensionnée à `size` (largeur, hauteur)
+
+        Args:
+            key: Identifiant stable de l'asset source (ex: ('tower', TowerType.WEAK))
+            surface: Surface source, utilisée seulement en cas d'absence dans le cache
+            size: Taille cible en pixels
+        """
+        cache_key = (key, size)
+        scaled = self.entries.get(cache_key)
+        if scaled is not None:
+            self.entries.move_to_end(cache_key)
+            self.hits += 1
+            return scaled
+
+        self.misses += 1
+        scaled = pygame.transform.scale(surface, size)
+        self.entries[cache_key] = scaled
+        self.bytes_used += self._surface_bytes(scaled)
+        self._evict()
+        return scaled
+
+    def get_zoomed(self, key, surface, base_size, zoom):
+        """Sprite carré de `base_size` pixels monde, au zoom quantifié"""
+        size = max(1, int(base_size * quantize_zoom(zoom)))
+        return self.get_scaled(key, surface, (size, size))
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_used = 0
+
+    def _evict(self):
+        """Évince les entrées les plus anciennes jusqu'à repasser sous le budget"""
+        while self.bytes_used > self.byte_budget and len(self.entries) > 1:
+            _, surface = self.entries.popitem(last=False)
+            self.bytes_used -= self._surface_bytes(surface)
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
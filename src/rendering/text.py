@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+import pygame
+
+from src.constants import TEXT_CACHE_SIZE, GLYPH_ATLAS_CHARS
+
+
+class GlyphAtlas:
+    """Caractères pré-rendus d'une police et d'une couleur, pour composer des nombres.
+
+    Les valeurs qui changent à chaque image (score, temps, vague, délais) sont
+    assemblées par simples blits de glyphes, sans appel à `font.render`.
+    """
+
+    def __init__(self, font: pygame.font.Font, color, chars: str = GLYPH_ATLAS_CHARS):
+        self.glyphs = {char: font.render(char, True, color) for char in chars}
+        self.height = font.get_height()
+
+    def supports(self, text: str) -> bool:
+        return all(char in self.glyphs for char in text)
+
+    def width_of(self, text: str) -> int:
+        return sum(self.glyphs[char].get_width() for char in text)
+
+    def draw(self, target: pygame.Surface, text: str, pos) -> pygame.Rect:
+        x, y = int(pos[0]), int(pos[1])
+        for char in text:
+            glyph = self.glyphs[char]
+            target.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return pygame.Rect(int(pos[0]), y, x - int(pos[0]), self.height)
+
+
+class TextRenderer:
+    """Polices par taille, textes rendus en cache (LRU) et atlas de chiffres"""
+
+    def __init__(self, cache_size: int = TEXT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.fonts = {}
+        self.rendered = OrderedDict()
+        self.atlases = {}
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Police par défaut à la taille demandée, créée une seule fois"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, text: str, size: int, color) -> pygame.Surface:
+        """Texte rendu, réutilisé tant que (texte, taille, couleur) ne change pas"""
+        key = (text, size, tuple(color))
+        surface = self.rendered.get(key)
+        if surface is not None:
+            self.rendered.move_to_end(key)
+            return surface
+        surface = self.font(size).render(text, True, color)
+        self.rendered[key] = surface
+        if len(self.rendered) > self.cache_size:
+            self.rendered.popitem(last=False)
+        return surface
+
+    def atlas(self, size: int, color) -> GlyphAtlas:
+        key = (size, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(self.font(size), color)
+        return atlas
+
+    def draw_value(self, target: pygame.Surface, pos, label: str, value: str, size: int, color) -> pygame.Rect:
+        """Affiche un libellé fixe suivi d'une valeur variable composée depuis l'atlas
+
+        Args:
+            pos: Coin supérieur gauche du texte
+            label: Partie fixe (ex: "Score: "), rendue une fois puis mise en cache
+            value: Partie variable (ex: "1250") ; si elle contient des caractères
+                absents de l'atlas, elle est rendue normalement
+        """
+        label_surface = self.render(label, size, color)
+        target.blit(label_surface, pos)
+        value_pos = (pos[0] + label_surface.get_width(), pos[1])
+        atlas = self.atlas(size, color)
+        if atlas.supports(value):
+            value_rect = atlas.draw(target, value, value_pos)
+        else:
+            value_surface = self.render(value, size, color)
+            value_rect = target.blit(value_surface, value_pos)
+        return label_surface.get_rect(topleft=pos).union(value_rect)
@@ -0,0 +1,91 @@
+import math
+from typing import List, Optional
+
+import pygame
+
+from src.constants import WORLD_SIZE, BACKGROUND_TILE_SIZE
+
+
+class TiledLayer:
+    """Image couvrant tout le monde, découpée en tuiles sur plusieurs niveaux de mip.
+
+    La pyramide est construite une seule fois. À chaque image, seules les
+    tuiles qui recoupent la vue de la caméra sont redimensionnées puis
+    affichées, depuis le niveau dont la résolution est la plus proche du zoom :
+    le coût dépend de la taille de l'écran et non plus de celle du monde.
+    """
+
+    def __init__(self, surface: Optional[pygame.Surface] = None, world_size: float = WORLD_SIZE,
+                 tile_size: int = BACKGROUND_TILE_SIZE, levels: Optional[List[pygame.Surface]] = None):
+        """
+        Args:
+            surface: Image source (niveau 0)
+            levels: Pyramide déjà construite (ex: lue depuis le cache de carte) ;
+                `surface` est alors ignorée
+        """
+        self.world_size = world_size
+        self.tile_size = tile_size
+        self.levels: List[pygame.Surface] = levels if levels is not None else self.build_mips(surface, tile_size)
+        # Tuiles de chaque niveau, indexées par (colonne, ligne)
+        self.tiles = [self.split_tiles(level) for level in self.levels]
+
+    @staticmethod
+    def build_mips(surface: pygame.Surface, tile_size: int) -> List[pygame.Surface]:
+        """Niveau 0 = image source, chaque niveau suivant divise la taille par deux"""
+        levels = [surface]
+        while max(levels[-1].get_size()) > tile_size:
+            width, height = levels[-1].get_size()
+            levels.append(pygame.transform.smoothscale(levels[-1], (max(1, width // 2), max(1, height // 2))))
+        return levels
+
+    def split_tiles(self, level: pygame.Surface):
+        width, height = level.get_size()
+        tiles = {}
+        for tile_y, top in enumerate(range(0, height, self.tile_size)):
+            for tile_x, left in enumerate(range(0, width, self.tile_size)):
+                rect = pygame.Rect(left, top, min(self.tile_size, width - left), min(self.tile_size, height - top))
+                tiles[(tile_x, tile_y)] = level.subsurface(rect)
+        return tiles
+
+    def choose_level(self, zoom: float) -> int:
+        """Niveau le plus réduit dont la résolution reste au moins égale à celle de l'écran"""
+        needed = self.world_size * zoom
+        level = 0
+        while level + 1 < len(self.levels) and self.levels[level + 1].get_width() >= needed:
+            level += 1
+        return level
+
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float, zoom: float,
+             center_x: float, center_y: float):
+        """Affiche la partie visible de la couche avec la même projection que `Game.world_to_screen`"""
+        level = self.choose_level(zoom)
+        level_width, level_height = self.levels[level].get_size()
+        pixels_per_world_x = level_width / self.world_size
+        pixels_per_world_y = level_height / self.world_size
+        screen_width, screen_height = screen.get_size()
+
+        # Zone visible, en pixels du niveau choisi
+        view_left = (camera_x - center_x / zoom) * pixels_per_world_x
+        view_top = (camera_y - center_y / zoom) * pixels_per_world_y
+        view_right = (camera_x + (screen_width - center_x) / zoom) * pixels_per_world_x
+        view_bottom = (camera_y + (screen_height - center_y) / zoom) * pixels_per_world_y
+
+        first_x = max(0, int(view_left // self.tile_size))
+        first_y = max(0, int(view_top // self.tile_size))
+        last_x = min(math.ceil(level_width / self.tile_size) - 1, int(view_right // self.tile_size))
+        last_y = min(math.ceil(level_height / self.tile_size) - 1, int(view_bottom // self.tile_size))
+
+        tiles = self.tiles[level]
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                tile = tiles[(tile_x, tile_y)]
+                left = tile_x * self.tile_size
+                top = tile_y * self.tile_size
+                # Bords arrondis individuellement pour que les tuiles voisines se touchent sans jour
+                x0 = round((left / pixels_per_world_x - camera_x) * zoom + center_x)
+                y0 = round((top / pixels_per_world_y - camera_y) * zoom + center_y)
+                x1 = round(((left + tile.get_width()) / pixels_per_world_x - camera_x) * zoom + center_x)
+                y1 = round(((top + tile.get_height()) / pixels_per_world_y - camera_y) * zoom + center_y)
+                if x1 <= x0 or y1 <= y0:
+                    continue
+                screen.blit(pygame.transform.scale(tile, (x1 - x0, y1 - y0)), (x0, y0))
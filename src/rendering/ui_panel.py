@@ -0,0 +1,27 @@
+import pygame
+
+
+class RetainedPanel:
+    """Panneau d'interface dont la surface composée est conservée entre les images.
+
+    `build` reçoit les entrées du panneau (taille de fenêtre, contenu...) et
+    renvoie la surface complète ; elle n'est rappelée que lorsque ces entrées
+    changent, sinon le panneau ne coûte qu'un blit.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.inputs = None
+        self.surface = None
+        self.renders = 0
+
+    def get(self, *inputs) -> pygame.Surface:
+        if self.surface is None or inputs != self.inputs:
+            self.surface = self.build(*inputs)
+            self.inputs = inputs
+            self.renders += 1
+        return self.surface
+
+    def invalidate(self):
+        """Force la recomposition au prochain appel de `get`"""
+        self.surface = None
@@ -1,25 +1,139 @@
 import os
 import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import bisect
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 from src.enums import MonsterType
+from src.constants import (SCORE_LOG_FILE, LEADERBOARD_SIZE, SCORE_COMPACT_INTERVAL, SCORE_BACKEND, SCORE_DB_FILE,
+                           DEFAULT_MAP_NAME)
+
+# Champs présents dans tout enregistrement de score
+SCORE_FIELDS = ("player_name", "score", "survived_time", "waves_completed", "date")
+
+# Classements proposés : tout l'historique, le jour en cours, la semaine en cours (depuis lundi)
+SCORE_BOARDS = ("all", "day", "week")
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def board_since(board: str) -> Optional[datetime]:
+    """Début de la période couverte par un classement (None pour tout l'historique)"""
+    if board == "all":
+        return None
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    if board == "day":
+        return today
+    if board == "week":
+        return today - timedelta(days=today.weekday())
+    raise ValueError(f"Classement inconnu: {board}")
+
+
+def is_score_entry(entry) -> bool:
+    """Vérifie qu'un enregistrement relu est bien un score (dictionnaire complet, score entier)"""
+    return (isinstance(entry, dict) and all(name in entry for name in SCORE_FIELDS)
+            and isinstance(entry["score"], int) and not isinstance(entry["score"], bool))
+
+
+class ScoreLog:
+    """Historique complet des scores, en ajout seul (une ligne JSON par partie).
+
+    Chaque enregistrement est écrit en un seul `write` sur un fichier ouvert
+    en ajout puis synchronisé sur disque (`fsync`) : une coupure ne peut
+    laisser qu'une dernière ligne incomplète (sans fin de ligne), retirée au
+    chargement suivant. Le reste du journal n'est jamais réécrit.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def read(self) -> List[Dict]:
+        """Relit tous les enregistrements valides.
+
+        Une ligne illisible ou qui n'est pas un score est signalée et ignorée ;
+        seule une dernière ligne sans fin de ligne (ajout interrompu) est
+        tronquée, pour que les ajouts suivants commencent sur une ligne neuve.
+        """
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        complete_size = 0
+        with open(self.path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.endswith(b'\n'):
+                    break
+                complete_size += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                if is_score_entry(entry):
+                    entries.append(entry)
+                else:
+                    print(f"Ligne {line_number} du journal des scores illisible, ignorée")
+        if complete_size < os.path.getsize(self.path):
+            print(f"Fin du journal des scores incomplète, tronquée à {complete_size} octets")
+            with open(self.path, 'r+b') as f:
+                f.truncate(complete_size)
+        return entries
+
+    def append(self, entries: List[Dict]) -> bool:
+        """Ajoute des enregistrements et attend qu'ils soient écrits sur disque"""
+        data = b''.join(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n' for entry in entries)
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            return True
+        except OSError as e:
+            print(f"Erreur lors de l'écriture du journal des scores: {e}")
+            return False
+
 
 class ScoreManager:
-    def __init__(self, leaderboard_file: str = 'src/assets/leaderboard.json'):
+    def __init__(self, leaderboard_file: str = 'src/assets/leaderboard.json', log_file: str = SCORE_LOG_FILE):
         """
         Initialise le gestionnaire de scores
         
         Args:
-            leaderboard_file: Chemin vers le fichier de leaderboard
+            leaderboard_file: Chemin vers le fichier de leaderboard (vue JSON du top, réécrite à la compaction)
+            log_file: Chemin vers le journal de tous les scores (source de vérité)
         """
         self.leaderboard_file = leaderboard_file
-        self.leaderboard = self.load_leaderboard()
+        self.log = ScoreLog(log_file)
+        self.load_scores()
         
     def reset(self) -> None:
         """
-        Réinitialise le gestionnaire de scores, rechargeant le leaderboard depuis le fichier
+        Réinitialise le gestionnaire de scores, rechargeant l'historique depuis le journal
+        """
+        self.load_scores()
+
+    def load_scores(self) -> None:
+        """
+        Charge le journal et reconstruit l'index trié des scores
         """
-        self.leaderboard = self.load_leaderboard()
+        entries = self.log.read()
+        if not entries and not os.path.exists(self.log.path):
+            # Premier lancement avec journal : reprendre le leaderboard existant
+            entries = self.load_leaderboard()
+            if entries:
+                self.log.append(entries)
+
+        self.entries: List[Dict] = entries
+        # Clés (-score, numéro d'ordre) triées : score décroissant, puis ordre d'arrivée
+        self.index: List[Tuple[int, int]] = sorted((-entry["score"], seq) for seq, entry in enumerate(entries))
+        self.pending_compaction = 0
+        self.update_leaderboard()
+
+    def update_leaderboard(self) -> None:
+        """Recalcule la vue du top à partir de l'index"""
+        self.leaderboard = [self.entries[seq] for _, seq in self.index[:LEADERBOARD_SIZE]]
         
     def load_leaderboard(self) -> List[Dict]:
         """
@@ -36,14 +150,21 @@ class ScoreManager:
         
         try:
             with open(self.leaderboard_file, 'r') as f:
-                return json.load(f)
+                entries = json.load(f)
         except Exception as e:
             print(f"Erreur lors du chargement du leaderboard: {e}")
             return []
+        if not isinstance(entries, list):
+            print("Leaderboard invalide, ignoré")
+            return []
+        scores = [entry for entry in entries if is_score_entry(entry)]
+        if len(scores) < len(entries):
+            print(f"{len(entries) - len(scores)} entrée(s) invalide(s) du leaderboard ignorée(s)")
+        return scores
     
     def save_leaderboard(self) -> bool:
         """
-        Sauvegarde le leaderboard dans le fichier
+        Sauvegarde le leaderboard dans le fichier (écriture dans un fichier temporaire puis renommage)
         
         Returns:
             True si la sauvegarde a réussi, False sinon
@@ -52,22 +173,36 @@ class ScoreManager:
             # Créer le dossier si nécessaire
             os.makedirs(os.path.dirname(self.leaderboard_file), exist_ok=True)
             
-            with open(self.leaderboard_file, 'w') as f:
+            temp_file = self.leaderboard_file + '.tmp'
+            with open(temp_file, 'w') as f:
                 json.dump(self.leaderboard, f, indent=2)
+            os.replace(temp_file, self.leaderboard_file)
             return True
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du leaderboard: {e}")
             return False
+
+    def compact(self) -> bool:
+        """
+        Réécrit la vue JSON du leaderboard à partir de l'index
+        
+        Returns:
+            True si la sauvegarde a réussi, False sinon
+        """
+        self.pending_compaction = 0
+        return self.save_leaderboard()
     
-    def add_score(self, player_name: str, score: int, survived_time: float, waves_completed: int) -> bool:
+    def add_score(self, player_name: str, score: int, survived_time: float, waves_completed: int,
+                  map_name: str = DEFAULT_MAP_NAME) -> bool:
         """
-        Ajoute un score au leaderboard
+        Ajoute un score à l'historique (un seul ajout au journal)
         
         Args:
             player_name: Nom du joueur
             score: Score obtenu
             survived_time: Temps de survie en secondes
             waves_completed: Nombre de vagues complétées
+            map_name: Carte sur laquelle la partie a été jouée
             
         Returns:
             True si l'ajout a réussi, False sinon
@@ -78,21 +213,33 @@ class ScoreManager:
             "score": score,
             "survived_time": survived_time,
             "waves_completed": waves_completed,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "date": datetime.now().strftime(DATE_FORMAT),
+            "map": map_name
         }
         
-        # Ajouter au leaderboard
-        self.leaderboard.append(score_entry)
-        
-        # Trier le leaderboard par score décroissant
-        self.leaderboard.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Limiter à 10 entrées maximum
-        if len(self.leaderboard) > 10:
-            self.leaderboard = self.leaderboard[:10]
-        
-        # Sauvegarder le leaderboard
-        return self.save_leaderboard()
+        if not self.log.append([score_entry]):
+            return False
+
+        # Insérer dans l'index trié ; le top n'est recalculé que s'il change
+        key = (-score, len(self.entries))
+        self.entries.append(score_entry)
+        position = bisect.bisect_left(self.index, key)
+        self.index.insert(position, key)
+        if position < LEADERBOARD_SIZE:
+            self.update_leaderboard()
+
+        # Vue JSON réécrite périodiquement, pas à chaque partie
+        self.pending_compaction += 1
+        if self.pending_compaction >= SCORE_COMPACT_INTERVAL:
+            self.compact()
+        return True
+
+    def close(self) -> None:
+        """
+        Écrit la vue JSON si des scores ont été ajoutés depuis la dernière compaction
+        """
+        if self.pending_compaction:
+            self.compact()
     
     def get_leaderboard(self) -> List[Dict]:
         """
@@ -102,6 +249,54 @@ class ScoreManager:
             Liste des scores du leaderboard
         """
         return self.leaderboard
+
+    def get_top(self, count: int) -> List[Dict]:
+        """
+        Récupère les `count` meilleurs scores de tout l'historique
+        """
+        return [self.entries[seq] for _, seq in self.index[:count]]
+
+    def get_page(self, page: int, page_size: int = LEADERBOARD_SIZE) -> List[Dict]:
+        """
+        Récupère une page du classement complet (page 0 = meilleurs scores)
+        """
+        start = page * page_size
+        return [self.entries[seq] for _, seq in self.index[start:start + page_size]]
+
+    def count(self) -> int:
+        """
+        Nombre de scores de l'historique
+        """
+        return len(self.index)
+
+    def board_entries(self, board: str, map_name: Optional[str]) -> List[Dict]:
+        """
+        Scores d'un classement, du meilleur au moins bon (parcours de tout l'index)
+        """
+        since = board_since(board)
+        since_text = since.strftime(DATE_FORMAT) if since is not None else None
+        entries = (self.entries[seq] for _, seq in self.index)
+        return [entry for entry in entries
+                if (map_name is None or entry.get("map", DEFAULT_MAP_NAME) == map_name)
+                and (since_text is None or entry["date"] >= since_text)]
+
+    def get_board_page(self, board: str, page: int, page_size: int = LEADERBOARD_SIZE,
+                       map_name: Optional[str] = None) -> List[Dict]:
+        """
+        Récupère une page d'un classement (voir SCORE_BOARDS), éventuellement pour une seule carte
+        """
+        if board == "all" and map_name is None:
+            return self.get_page(page, page_size)
+        start = page * page_size
+        return self.board_entries(board, map_name)[start:start + page_size]
+
+    def count_board(self, board: str, map_name: Optional[str] = None) -> int:
+        """
+        Nombre de scores d'un classement
+        """
+        if board == "all" and map_name is None:
+            return self.count()
+        return len(self.board_entries(board, map_name))
     
     def get_current_player_rank(self, score: int) -> Optional[int]:
         """
@@ -113,25 +308,14 @@ class ScoreManager:
         Returns:
             Rang potentiel (1-based) ou None si le score n'entre pas dans le top 10
         """
-        # Si le leaderboard est vide ou contient moins de 10 entrées, le score est éligible
-        if len(self.leaderboard) < 10:
-            # Trouver sa position
-            rank = 1
-            for entry in self.leaderboard:
-                if score < entry["score"]:
-                    rank += 1
-            return rank
-        
-        # Si le score est meilleur que le dernier du leaderboard
-        if score > self.leaderboard[-1]["score"]:
-            # Trouver sa position
-            rank = 1
-            for entry in self.leaderboard:
-                if score < entry["score"]:
-                    rank += 1
-            return rank
-        
-        return None  # Le score n'est pas éligible pour le leaderboard
+        # Nombre de scores strictement meilleurs, par recherche dichotomique
+        rank = bisect.bisect_left(self.index, (-score,)) + 1
+        if rank > LEADERBOARD_SIZE:
+            return None
+        # Top complet : il faut battre strictement le dernier
+        if len(self.index) >= LEADERBOARD_SIZE and score <= -self.index[LEADERBOARD_SIZE - 1][0]:
+            return None
+        return rank
     
     def is_high_score(self, score: int) -> bool:
         """
@@ -184,4 +368,199 @@ class ScoreManager:
             MonsterType.DRAGON: 100
         }
         # Valeur par défaut si le type n'est pas dans le dictionnaire
-        return score_values.get(monster_type, 10) 
\ No newline at end of file
+        return score_values.get(monster_type, 10)
+
+
+class SqliteScoreManager(ScoreManager):
+    """Scores stockés dans une base SQLite (mode WAL), interrogée à la demande.
+
+    Même interface que `ScoreManager`, sans garder l'historique en mémoire :
+    top, rang d'un score, classements du jour ou de la semaine et pages sont
+    des requêtes sur les index (score, date, carte). Les requêtes sont des
+    textes constants, réutilisés par le cache d'instructions préparées de
+    `sqlite3`. À la création de la base, le journal des scores (ou à défaut
+    leaderboard.json) est importé.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            player_name TEXT NOT NULL,
+            score INTEGER NOT NULL,
+            survived_time REAL NOT NULL,
+            waves_completed INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            map TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+        CREATE INDEX IF NOT EXISTS scores_by_date ON scores (date);
+        CREATE INDEX IF NOT EXISTS scores_by_map ON scores (map, score DESC, id);
+    """
+    COLUMNS = "player_name, score, survived_time, waves_completed, date, map"
+    INSERT = f"INSERT INTO scores ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+    SELECT_PAGE = f"SELECT {COLUMNS} FROM scores ORDER BY score DESC, id LIMIT ? OFFSET ?"
+    COUNT_BETTER = "SELECT COUNT(*) FROM scores WHERE score > ?"
+    SCORE_AT = "SELECT score FROM scores ORDER BY score DESC, id LIMIT 1 OFFSET ?"
+    COUNT_ALL = "SELECT COUNT(*) FROM scores"
+
+    def __init__(self, db_file: str = SCORE_DB_FILE, leaderboard_file: str = 'src/assets/leaderboard.json',
+                 log_file: str = SCORE_LOG_FILE):
+        """
+        Args:
+            db_file: Chemin vers la base SQLite
+            leaderboard_file: Vue JSON du top, réécrite à la compaction (et importée au premier lancement)
+            log_file: Journal des scores importé au premier lancement, s'il existe
+        """
+        self.leaderboard_file = leaderboard_file
+        self.log = ScoreLog(log_file)
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_file)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.executescript(self.SCHEMA)
+        if self.count() == 0:
+            self.import_existing()
+        self.pending_compaction = 0
+        self.update_leaderboard()
+
+    def load_scores(self) -> None:
+        """La base est interrogée à la demande : seul le top est relu"""
+        self.update_leaderboard()
+
+    def import_existing(self) -> None:
+        """Importe le journal des scores, ou à défaut leaderboard.json"""
+        entries = self.log.read() or self.load_leaderboard()
+        if entries:
+            self.add_scores(entries)
+
+    def update_leaderboard(self) -> None:
+        self.leaderboard = self.get_top(LEADERBOARD_SIZE)
+
+    @staticmethod
+    def row_values(entry: Dict) -> tuple:
+        return (entry["player_name"], entry["score"], entry["survived_time"], entry["waves_completed"],
+                entry["date"], entry.get("map", DEFAULT_MAP_NAME))
+
+    def add_scores(self, entries: List[Dict]) -> bool:
+        """
+        Ajoute plusieurs scores en une seule transaction
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(self.INSERT, [self.row_values(entry) for entry in entries])
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'enregistrement des scores: {e}")
+            return False
+        self.update_leaderboard()
+        return True
+
+    def add_score(self, player_name: str, score: int, survived_time: float, waves_completed: int,
+                  map_name: str = DEFAULT_MAP_NAME) -> bool:
+        """
+        Ajoute un score à la base
+        
+        Args:
+            map_name: Carte sur laquelle la partie a été jouée
+        """
+        score_entry = {
+            "player_name": player_name,
+            "score": score,
+            "survived_time": survived_time,
+            "waves_completed": waves_completed,
+            "date": datetime.now().strftime(DATE_FORMAT),
+            "map": map_name
+        }
+        try:
+            with self.connection:
+                self.connection.execute(self.INSERT, self.row_values(score_entry))
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'enregistrement du score: {e}")
+            return False
+
+        # Le top n'est relu que si le nouveau score y entre
+        if len(self.leaderboard) < LEADERBOARD_SIZE or score > self.leaderboard[-1]["score"]:
+            self.update_leaderboard()
+
+        # Vue JSON réécrite périodiquement, pas à chaque partie
+        self.pending_compaction += 1
+        if self.pending_compaction >= SCORE_COMPACT_INTERVAL:
+            self.compact()
+        return True
+
+    def query(self, sql: str, parameters: tuple) -> List[Dict]:
+        return [dict(row) for row in self.connection.execute(sql, parameters)]
+
+    def get_top(self, count: int) -> List[Dict]:
+        """
+        Récupère les `count` meilleurs scores
+        """
+        return self.get_page(0, count)
+
+    def get_page(self, page: int, page_size: int = LEADERBOARD_SIZE) -> List[Dict]:
+        """
+        Récupère une page du classement complet (page 0 = meilleurs scores)
+        """
+        return self.query(self.SELECT_PAGE, (page_size, page * page_size))
+
+    @staticmethod
+    def board_filter(board: str, map_name: Optional[str]) -> Tuple[str, tuple]:
+        """Clause FROM/WHERE d'un classement et ses paramètres"""
+        since = board_since(board)
+        clauses = []
+        parameters = ()
+        if since is not None:
+            clauses.append("date >= ?")
+            parameters += (since.strftime(DATE_FORMAT),)
+        if map_name is not None:
+            clauses.append("map = ?")
+            parameters += (map_name,)
+        # Une période ne couvre qu'une petite partie de l'historique : parcours par date puis tri
+        source = "scores INDEXED BY scores_by_date" if since is not None else "scores"
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return source + where, parameters
+
+    def get_board_page(self, board: str, page: int, page_size: int = LEADERBOARD_SIZE,
+                       map_name: Optional[str] = None) -> List[Dict]:
+        source, parameters = self.board_filter(board, map_name)
+        return self.query(f"SELECT {self.COLUMNS} FROM {source} ORDER BY score DESC, id LIMIT ? OFFSET ?",
+                          parameters + (page_size, page * page_size))
+
+    def count_board(self, board: str, map_name: Optional[str] = None) -> int:
+        source, parameters = self.board_filter(board, map_name)
+        return self.connection.execute(f"SELECT COUNT(*) FROM {source}", parameters).fetchone()[0]
+
+    def count(self) -> int:
+        return self.connection.execute(self.COUNT_ALL).fetchone()[0]
+
+    def get_current_player_rank(self, score: int) -> Optional[int]:
+        """
+        Détermine le rang potentiel d'un score dans le leaderboard
+        
+        Returns:
+            Rang potentiel (1-based) ou None si le score n'entre pas dans le top 10
+        """
+        rank = self.connection.execute(self.COUNT_BETTER, (score,)).fetchone()[0] + 1
+        if rank > LEADERBOARD_SIZE:
+            return None
+        # Top complet : il faut battre strictement le dernier
+        last = self.connection.execute(self.SCORE_AT, (LEADERBOARD_SIZE - 1,)).fetchone()
+        if last is not None and score <= last[0]:
+            return None
+        return rank
+
+    def close(self) -> None:
+        super().close()
+        self.connection.close()
+
+
+def create_score_manager() -> ScoreManager:
+    """
+    Gestionnaire de scores selon SCORE_BACKEND ("log" ou "sqlite")
+    """
+    if SCORE_BACKEND == "sqlite":
+        return SqliteScoreManager()
+    return ScoreManager()
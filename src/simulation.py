@@ -0,0 +1,443 @@
+import json
+import math
+import random
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+from src.constants import *
+from src.enums import GameMode, TowerType, MonsterType
+from src.entities import Tower, Monster, Explosion, MonsterStore
+from src.managers import WaveManager
+from src.spatial_grid import SpatialHashGrid
+from src.terrain import TerrainGrid
+from src.map_cache import load_terrain
+from src.snapshot import Snapshot, capture, restore
+from src.visibility import VisibilityGrid
+
+# Points gagnés par type de monstre tué
+MONSTER_SCORE_VALUES = {
+    MonsterType.SKELETON: 10,
+    MonsterType.WOLF: 15,
+    MonsterType.MORAY: 20,
+    MonsterType.VARAN: 25,
+    MonsterType.FIRE_SKELETON: 25,
+    MonsterType.SMALL_SPIRIT: 30,
+    MonsterType.WITCH: 40,
+    MonsterType.KAMIKAZE: 35,
+    MonsterType.GIANT_WOLF: 50,
+    MonsterType.DRAGON: 100,
+}
+
+
+@dataclass
+class SimulationStats:
+    """Résultat d'une simulation sans affichage"""
+    score: int
+    village_health: float
+    waves_cleared: int
+    ticks_run: int
+    game_over: bool
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class Simulation:
+    """Cœur de la simulation : état du monde et logique de jeu.
+
+    Ne dépend ni de la fenêtre, ni du mixer audio, ni de l'horloge murale.
+    `Game` en hérite et ajoute l'affichage, les entrées et le son.
+    """
+
+    def __init__(self, terrain: Optional[TerrainGrid] = None, batched_monsters: bool = False):
+        self.game_mode = GameMode.EDIT
+        self.towers = []
+        self.projectiles = []
+        self.monsters = []
+        self.explosions = []  # Liste des explosions en cours
+        self.wave_manager = None
+        # Stockage vectorisé des monstres (structure de tableaux NumPy), optionnel
+        self.monster_store = MonsterStore(self) if batched_monsters else None
+
+        # Index spatiaux mis à jour une fois par pas, après le déplacement des monstres
+        self.monster_grid = SpatialHashGrid(SPATIAL_GRID_CELL_SIZE)
+        self.tower_grid = SpatialHashGrid(SPATIAL_GRID_CELL_SIZE)
+        self.visibility = VisibilityGrid()  # Zones visibles et zone de la lumière, selon les tours
+
+        self.current_score = 0
+        self.final_score = 0
+        self.game_time = 0.0
+        self.sim_time = 0.0  # Temps simulé écoulé depuis le début de la partie
+        self.ticks_run = 0
+        # Pas fixe : le temps réel (accéléré) s'accumule et est consommé par pas de 1/tick_rate
+        self.tick_rate = SIM_TICK_RATE
+        self.time_accumulator = 0.0
+        self.render_alpha = 1.0  # Position de rendu entre les deux derniers états (0 = précédent, 1 = courant)
+
+        # Position du village (centre de la carte)
+        self.village_x = WORLD_SIZE // 2
+        self.village_y = WORLD_SIZE // 2
+        self.village_health = VILLAGE_MAX_HEALTH
+
+        self.time_acceleration_index = 0
+        self.light_power = LIGHT_MAX_POWER
+        self.light_active = False
+        self.light_position = None
+        self.light_recharge_delay = LIGHT_RECHARGE_DELAY
+        self.light_recharge_timer = 0.0  # Compte le temps écoulé depuis que la lumière a été déchargée
+        self.light_in_cooldown = False    # Indique si la lumière est en période de délai
+
+        # Multiplicateurs de vitesse du terrain (partageables entre plusieurs simulations)
+        self.terrain = terrain if terrain is not None else load_terrain(resolution=TERRAIN_GRID_RESOLUTION)
+
+    def load_layout(self, save_data: Dict) -> List[Tower]:
+        """Place les tours décrites au format de `map_save.json`"""
+        self.towers = []
+        for tower_data in save_data['towers']:
+            tower_type = TowerType(tower_data['type'])
+            self.towers.append(Tower(tower_type, tower_data['x'], tower_data['y']))
+        return self.towers
+
+    def start_simulation(self):
+        """Démarre les vagues de monstres"""
+        self.game_mode = GameMode.PLAY
+        self.wave_manager = WaveManager(self.village_x, self.village_y, self)
+        self.clear_monsters()
+        self.sim_time = 0.0
+        self.ticks_run = 0
+        self.time_accumulator = 0.0
+        self.render_alpha = 1.0
+        self.update_spatial_grids()
+
+    def reset_simulation(self):
+        """Réinitialise l'état de la partie"""
+        self.game_mode = GameMode.EDIT
+        self.village_health = VILLAGE_MAX_HEALTH
+        self.towers = []
+        self.clear_monsters()
+        self.explosions = []
+        self.current_score = 0
+        self.game_time = 0.0
+        self.sim_time = 0.0
+        self.ticks_run = 0
+        self.time_accumulator = 0.0
+        self.render_alpha = 1.0
+
+        self.light_power = LIGHT_MAX_POWER
+        self.light_active = False
+        self.light_position = None
+        self.light_in_cooldown = False
+        self.update_spatial_grids()
+
+    def clear_monsters(self):
+        """Retire tous les monstres"""
+        if self.monster_store is not None:
+            self.monster_store.clear()
+            self.monsters = self.monster_store.monsters
+        else:
+            self.monsters = []
+
+    def create_monster(self, monster_type, x, y):
+        """Crée un monstre, dans le stockage vectorisé si celui-ci est actif"""
+        if self.monster_store is not None:
+            return self.monster_store.spawn(monster_type, x, y)
+        return Monster(monster_type, x, y, self)
+
+    def update_spatial_grids(self):
+        """Reconstruit les index spatiaux des monstres et des tours.
+
+        Les rasters de visibilité ne sont recalculés que si une tour a été
+        posée, déplacée ou détruite.
+        """
+        store = self.monster_store
+        if store is not None:
+            self.monster_grid.rebuild_from_arrays(store.monsters, store.x[:store.count], store.y[:store.count])
+        else:
+            self.monster_grid.rebuild(self.monsters)
+        self.tower_grid.rebuild(self.towers, radius_of=lambda tower: tower.vision_range)
+        self.visibility.update(self.village_x, self.village_y, self.towers)
+
+    def snapshot(self, sequence: int = 0) -> Snapshot:
+        """Capture l'état complet de la partie (voir `src.snapshot`)"""
+        return capture(self, sequence)
+
+    def restore_snapshot(self, snapshot: Snapshot):
+        """Reprend la partie exactement à l'état d'un instantané.
+
+        Une même simulation peut ainsi être rejouée plusieurs fois depuis un
+        point donné, par exemple pour comparer des variantes.
+        """
+        restore(self, snapshot)
+
+    def get_elapsed_time(self) -> float:
+        """Temps de simulation écoulé, utilisé pour le déclenchement des vagues.
+
+        Une partie en pause, accélérée ou sans affichage suit donc le même calendrier.
+        """
+        return self.sim_time
+
+    def create_explosion(self, x, y, max_radius, color):
+        """Crée une nouvelle explosion"""
+        self.explosions.append(Explosion(x, y, max_radius, EXPLOSION_DURATION, color))
+
+    def play_sound(self, sound_name, x=None, y=None):
+        """Point d'extension pour le son, sans effet dans la simulation
+
+        Args:
+            x, y: Position de l'événement dans le monde, si elle a un sens
+        """
+        pass
+
+    def handle_game_over(self):
+        """Termine la partie"""
+        self.light_active = False
+        self.light_position = None
+        self.game_mode = GameMode.GAME_OVER
+        self.final_score = self.current_score
+
+    def update(self, frame_time=None):
+        """Mise à jour de la logique du jeu.
+
+        Le temps écoulé depuis la dernière image, multiplié par l'accélération,
+        est consommé par pas fixes de `1 / tick_rate` secondes. L'accélération
+        ajoute donc des pas par image au lieu d'agrandir chaque pas.
+
+        Args:
+            frame_time: Durée réelle de l'image en secondes (par défaut 1/FPS)
+        """
+        if self.game_mode != GameMode.PLAY:
+            self.time_accumulator = 0.0
+            self.render_alpha = 1.0
+            return
+
+        if frame_time is None:
+            frame_time = 1 / FPS
+        tick_duration = 1.0 / self.tick_rate
+        self.time_accumulator += min(frame_time, MAX_FRAME_TIME) * TIME_ACCELERATIONS[self.time_acceleration_index]
+
+        substeps = 0
+        while self.time_accumulator >= tick_duration and substeps < MAX_SUBSTEPS_PER_FRAME:
+            self.step(tick_duration)
+            self.time_accumulator -= tick_duration
+            substeps += 1
+            if self.game_mode != GameMode.PLAY:
+                self.time_accumulator = 0.0
+                break
+
+        # Au-delà du plafond, le retard est abandonné plutôt que rattrapé
+        if substeps == MAX_SUBSTEPS_PER_FRAME:
+            self.time_accumulator = min(self.time_accumulator, tick_duration)
+        self.render_alpha = min(1.0, self.time_accumulator / tick_duration)
+
+    def save_previous_positions(self):
+        """Mémorise les positions avant un pas, pour l'interpolation du rendu"""
+        if self.monster_store is not None:
+            self.monster_store.save_previous_positions()
+        else:
+            for monster in self.monsters:
+                monster.prev_x = monster.x
+                monster.prev_y = monster.y
+        for tower in self.towers:
+            for projectile in tower.projectiles:
+                projectile.prev_x = projectile.x
+                projectile.prev_y = projectile.y
+
+    def step(self, delta_time):
+        """Avance la simulation d'un pas de `delta_time` secondes"""
+        self.save_previous_positions()
+        self.sim_time += delta_time
+        self.ticks_run += 1
+        current_time = self.get_elapsed_time()
+        self.game_time = current_time
+
+        # Spawn des nouveaux monstres
+        for new_monster in self.wave_manager.update(current_time):
+            if self.monster_store is None:
+                self.monsters.append(new_monster)
+            self.monster_grid.insert(new_monster)
+
+        # Mise à jour des tours et de leurs projectiles
+        # Position de chaque monstre dans la liste : les tours choisissent leurs cibles dans cet ordre
+        monster_order = {id(monster): index for index, monster in enumerate(self.monsters)}
+        for tower in self.towers:
+            targets = tower.find_targets(self.monsters, self.monster_grid, monster_order)
+            tower.attack(targets, delta_time)
+            tower.update_projectiles(delta_time)
+            # Jouer le son quand la tour tire
+            if tower.is_firing:
+                self.play_sound('tower_fire', tower.x, tower.y)
+                # Ajouter des points pour chaque tir de tour
+                self.current_score += 1
+
+        # Mise à jour des monstres et nettoyage des morts
+        if self.monster_store is not None:
+            dead_monsters = self.monster_store.remove_dead()
+        else:
+            dead_monsters = [monster for monster in self.monsters if monster.is_dead]
+            self.monsters = [monster for monster in self.monsters if not monster.is_dead]
+
+        # Jouer le son pour chaque monstre mort
+        for dead_monster in dead_monsters:
+            self.play_sound('monster_death', dead_monster.x, dead_monster.y)
+            # Ajouter des points pour chaque monstre tué en fonction de sa difficulté
+            self.current_score += MONSTER_SCORE_VALUES.get(dead_monster.monster_type, 10)
+
+        if self.monster_store is not None:
+            self.update_batched_monsters(delta_time)
+        else:
+            self.update_monsters(delta_time)
+
+        self.update_spatial_grids()
+
+        # Mise à jour des explosions
+        self.explosions = [exp for exp in self.explosions if not exp.finished]
+        for explosion in self.explosions:
+            explosion.update(delta_time)
+
+        self.update_light(delta_time)
+
+    def update_monsters(self, delta_time):
+        """Déplacement et attaques des monstres, un objet à la fois"""
+        for monster in self.monsters:
+            # Ne passer la lumière active aux monstres que si sa puissance est supérieure à 0
+            light_active_for_monster = self.light_active and self.light_power > 0
+
+            monster.update(self.towers, self.village_x, self.village_y, delta_time,
+                           self.light_position, light_active_for_monster, self.light_power)
+
+            # Vérifier les attaques
+            if monster.current_target_type == 'tower' and monster.current_target:
+                dist = math.sqrt((monster.current_target.x - monster.x)**2 +
+                                 (monster.current_target.y - monster.y)**2)
+
+                if dist < TOWER_SIZE:  # Si le monstre est assez proche de la tour
+                    if monster.current_target.take_damage(
+                        monster.current_damage * delta_time * monster.attack_speed):
+                        # Si la tour est détruite
+                        destroyed_tower = monster.current_target
+                        self.towers.remove(destroyed_tower)
+                        monster.current_target = None
+                        monster.current_target_type = None
+                        self.play_sound('tower_destroyed', destroyed_tower.x, destroyed_tower.y)  # Jouer le son de destruction
+                        # Perdre des points quand une tour est détruite
+                        self.current_score = max(0, self.current_score - 50)
+
+            elif monster.current_target_type == 'village':
+                dist = math.sqrt((self.village_x - monster.x)**2 +
+                                 (self.village_y - monster.y)**2)
+
+                if dist < VILLAGE_SIZE:  # Si le monstre est assez proche du village
+                    # Infliger des dégâts au village
+                    self.village_health -= monster.current_damage * delta_time * monster.attack_speed
+
+                    if self.village_health <= 0 and self.game_mode == GameMode.PLAY:
+                        self.play_sound('game_over')  # Jouer le son de game over
+                        # Gérer le score final et vérifier s'il s'agit d'un high score
+                        self.handle_game_over()
+
+    def update_batched_monsters(self, delta_time):
+        """Déplacement et attaques de tous les monstres en une passe vectorisée"""
+        light_active_for_monster = self.light_active and self.light_power > 0
+        self.monster_store.update(self.towers, self.village_x, self.village_y, delta_time,
+                                  self.light_position, light_active_for_monster, self.light_power)
+
+        destroyed_towers, village_damage = self.monster_store.resolve_attacks(
+            self.village_x, self.village_y, delta_time)
+        for tower in destroyed_towers:
+            self.towers.remove(tower)
+            self.play_sound('tower_destroyed', tower.x, tower.y)  # Jouer le son de destruction
+            # Perdre des points quand une tour est détruite
+            self.current_score = max(0, self.current_score - 50)
+
+        if village_damage > 0:
+            self.village_health -= village_damage
+            if self.village_health <= 0 and self.game_mode == GameMode.PLAY:
+                self.play_sound('game_over')  # Jouer le son de game over
+                self.handle_game_over()
+
+    def update_light(self, delta_time):
+        """Mise à jour de la puissance de la lumière"""
+        if self.light_active:
+            self.light_power = max(0, self.light_power - LIGHT_DRAIN_RATE * delta_time)
+            # Désactiver automatiquement la lumière si la puissance atteint zéro
+            if self.light_power <= 0:
+                self.light_active = False
+                self.light_position = None
+                self.light_in_cooldown = True  # Activer le délai de recharge
+                self.light_recharge_timer = 0.0  # Réinitialiser le timer
+                self.play_sound('light_off')  # Jouer un son quand la lumière s'éteint automatiquement
+        else:
+            # Gestion du délai de recharge
+            if self.light_in_cooldown:
+                self.light_recharge_timer += delta_time
+                if self.light_recharge_timer >= self.light_recharge_delay:
+                    self.light_in_cooldown = False  # Fin du délai de recharge
+            else:
+                # Recharge normale seulement si on n'est pas en délai
+                self.light_power = min(LIGHT_MAX_POWER, self.light_power + LIGHT_RECHARGE_RATE * delta_time)
+
+    def is_finished(self) -> bool:
+        """Vrai si la partie est perdue ou si toutes les vagues sont passées et nettoyées"""
+        if self.game_mode == GameMode.GAME_OVER:
+            return True
+        return (self.wave_manager is not None
+                and self.wave_manager.current_wave >= len(self.wave_manager.waves)
+                and not self.monsters)
+
+    def get_stats(self) -> SimulationStats:
+        """Statistiques de la partie en cours"""
+        return SimulationStats(
+            score=self.current_score,
+            village_health=max(0.0, self.village_health),
+            waves_cleared=self.wave_manager.current_wave if self.wave_manager else 0,
+            ticks_run=self.ticks_run,
+            game_over=self.game_mode == GameMode.GAME_OVER,
+        )
+
+    def run(self, ticks: int, tick_rate: float = FPS, stop_when_finished: bool = True) -> SimulationStats:
+        """Avance la simulation de `ticks` pas fixes, aussi vite que possible"""
+        if self.game_mode != GameMode.PLAY:
+            self.start_simulation()
+
+        delta_time = 1.0 / tick_rate
+        for _ in range(ticks):
+            if stop_when_finished and self.is_finished():
+                break
+            self.step(delta_time)
+
+        return self.get_stats()
+
+    def get_terrain_speed_multipliers(self, xs, ys):
+        """Version vectorisée de `get_terrain_speed_multiplier` pour des tableaux de positions"""
+        return self.terrain.sample_many(xs, ys)
+
+    def get_terrain_speed_multiplier(self, x, y):
+        """Calcule le multiplicateur de vitesse basé sur la valeur du pixel du terrain.
+
+        Args:
+            x (float): Position X dans le monde
+            y (float): Position Y dans le monde
+
+        Returns:
+            float: Multiplicateur de vitesse entre 0.5 (noir) et 1.0 (blanc)
+        """
+        return self.terrain.sample(x, y)
+
+
+def run_headless(layout_paths: List[str], ticks: int, tick_rate: float = FPS,
+                 seed: Optional[int] = None, batched_monsters: bool = False) -> List[SimulationStats]:
+    """Évalue une ou plusieurs dispositions de tours sans affichage.
+
+    Le terrain est chargé une seule fois et partagé entre les simulations.
+    """
+    terrain = load_terrain(resolution=TERRAIN_GRID_RESOLUTION)
+    results = []
+    for index, layout_path in enumerate(layout_paths):
+        if seed is not None:
+            random.seed(seed + index)
+        with open(layout_path, 'r') as f:
+            save_data = json.load(f)
+        simulation = Simulation(terrain=terrain, batched_monsters=batched_monsters)
+        simulation.load_layout(save_data)
+        results.append(simulation.run(ticks, tick_rate))
+    return results
@@ -0,0 +1,395 @@
+import json
+import math
+import os
+import random
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.constants import AUTOSAVE_DIR, AUTOSAVE_KEYFRAME_INTERVAL
+from src.enums import GameMode, TowerType, MonsterType
+from src.entities import Tower, Explosion
+from src.entities.projectile import Projectile
+from src.managers import WaveManager
+from src.managers.wave_manager import ScheduledSpawn
+
+SNAPSHOT_MAGIC = b"GFSNAP"
+SNAPSHOT_VERSION = 2  # 2 : XOR limité aux lignes communes avec la base quand les tailles diffèrent
+FULL = 0
+DELTA = 1
+# Magie, version, type (complet / delta), numéro, numéro de la base du delta, taille des métadonnées
+HEADER = struct.Struct("<6sHBIII")
+SECTION_HEADER = struct.Struct("<BIBI")  # Longueur du nom, nombre de lignes, encodage, taille compressée
+
+# Valeurs spéciales des index de cible
+NO_TARGET = -2
+VILLAGE_TARGET = -1
+
+# Attributs flottants des monstres (None est représenté par NaN)
+MONSTER_FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'direction', 'target_direction', 'rotation_speed', 'speed',
+                        'current_health', 'max_health', 'shield', 'current_damage', 'max_damage', 'attack_speed',
+                        'light_fear', 'flee_time', 'flee_target_x', 'flee_target_y', 'target_village_chance',
+                        'attack_cooldown')
+
+SECTION_DTYPES = {
+    'towers': np.dtype([('type', 'u1'), ('x', '<f8'), ('y', '<f8'), ('health', '<f8'), ('attack_cooldown', '<f8'),
+                        ('dead', '?'), ('firing', '?'), ('target', '<i4')]),
+    'monsters': np.dtype([('type', 'u1')] + [(name, '<f8') for name in MONSTER_FLOAT_FIELDS] +
+                         [('dead', '?'), ('fleeing', '?'), ('knows_village', '?'), ('target', '<i4')]),
+    'projectiles': np.dtype([('tower', '<i4'), ('target', '<i4'), ('x', '<f8'), ('y', '<f8'), ('prev_x', '<f8'),
+                             ('prev_y', '<f8'), ('dx', '<f8'), ('dy', '<f8'), ('damage', '<f8'), ('speed', '<f8'),
+                             ('color', 'u1', (3,)), ('reached', '?')]),
+    'explosions': np.dtype([('x', '<f8'), ('y', '<f8'), ('max_radius', '<f8'), ('duration', '<f8'), ('time', '<f8'),
+                            ('color', 'u1', (3,)), ('finished', '?')]),
+    'spawns': np.dtype([('spawn_time', '<f8'), ('wave_index', '<i4'), ('type', 'u1'), ('group_factor', '<f8'),
+                        ('last_of_wave', '?')]),
+    'random': np.dtype('<u4'),
+}
+
+TOWER_TYPES = list(TowerType)
+MONSTER_TYPES = list(MonsterType)
+
+# Scalaires de la simulation enregistrés dans les métadonnées
+SIMULATION_FIELDS = ('sim_time', 'game_time', 'ticks_run', 'time_accumulator', 'render_alpha', 'village_health',
+                     'current_score', 'final_score', 'time_acceleration_index', 'light_power', 'light_active',
+                     'light_recharge_timer', 'light_in_cooldown')
+
+
+@dataclass
+class Snapshot:
+    """État complet d'une simulation : scalaires (`meta`) et tableaux structurés par entité"""
+    meta: Dict = field(default_factory=dict)
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict)
+    sequence: int = 0
+
+
+def capture(simulation, sequence: int = 0) -> Snapshot:
+    """Copie l'état de `simulation` dans des tableaux compacts.
+
+    Les références entre entités (cibles des tours, des monstres et des
+    projectiles) deviennent des index dans les tableaux.
+    """
+    towers = simulation.towers
+    monsters = simulation.monsters
+    tower_index = {id(tower): index for index, tower in enumerate(towers)}
+    monster_index = {id(monster): index for index, monster in enumerate(monsters)}
+
+    tower_rows = np.zeros(len(towers), dtype=SECTION_DTYPES['towers'])
+    projectile_records = []
+    for index, tower in enumerate(towers):
+        target = monster_index.get(id(tower.target), NO_TARGET) if tower.target is not None else NO_TARGET
+        tower_rows[index] = (TOWER_TYPES.index(tower.tower_type), tower.x, tower.y, tower.current_health,
+                             tower.attack_cooldown, tower.is_dead, tower.is_firing, target)
+        for projectile in tower.projectiles:
+            # Projectile dont la cible a déjà été retirée : il disparaîtrait au pas suivant sans effet
+            target = monster_index.get(id(projectile.target))
+            if target is None:
+                continue
+            projectile_records.append((index, target, projectile.x, projectile.y, projectile.prev_x,
+                                       projectile.prev_y, projectile.dx, projectile.dy, projectile.damage,
+                                       projectile.speed, projectile.color[:3], projectile.reached))
+
+    monster_records = []
+    for monster in monsters:
+        if monster.current_target_type == 'village':
+            target = VILLAGE_TARGET
+        elif monster.current_target_type == 'tower' and monster.current_target is not None:
+            target = tower_index.get(id(monster.current_target), NO_TARGET)
+        else:
+            target = NO_TARGET
+        values = [getattr(monster, name) for name in MONSTER_FLOAT_FIELDS]
+        monster_records.append((MONSTER_TYPES.index(monster.monster_type),
+                                *[math.nan if value is None else value for value in values],
+                                monster.is_dead, monster.is_fleeing, hasattr(monster, 'village_x'), target))
+
+    explosion_rows = np.array([(explosion.x, explosion.y, explosion.max_radius, explosion.duration, explosion.time,
+                                explosion.color[:3], explosion.finished) for explosion in simulation.explosions],
+                              dtype=SECTION_DTYPES['explosions'])
+
+    meta = {name: getattr(simulation, name) for name in SIMULATION_FIELDS}
+    meta['game_mode'] = simulation.game_mode.value
+    meta['light_position'] = list(simulation.light_position) if simulation.light_position else None
+    meta['batched'] = simulation.monster_store is not None
+    if simulation.monster_store is not None:
+        meta['monster_rng'] = simulation.monster_store.rng.bit_generator.state
+
+    spawn_rows = np.zeros(0, dtype=SECTION_DTYPES['spawns'])
+    wave_manager = simulation.wave_manager
+    if wave_manager is not None:
+        meta['wave'] = {'current_wave': wave_manager.current_wave, 'next_wave_time': wave_manager.next_wave_time}
+        spawn_rows = np.array([(spawn.spawn_time, spawn.wave_index, MONSTER_TYPES.index(spawn.monster_type),
+                                spawn.group_factor, spawn.last_of_wave) for spawn in wave_manager.spawn_queue],
+                              dtype=SECTION_DTYPES['spawns'])
+
+    # État du générateur `random` : la suite de la partie est identique après restauration
+    random_version, random_words, gauss_next = random.getstate()
+    meta['random'] = [random_version, gauss_next]
+
+    arrays = {
+        'towers': tower_rows,
+        'monsters': np.array(monster_records, dtype=SECTION_DTYPES['monsters']),
+        'projectiles': np.array(projectile_records, dtype=SECTION_DTYPES['projectiles']),
+        'explosions': explosion_rows,
+        'spawns': spawn_rows,
+        'random': np.array(random_words, dtype=SECTION_DTYPES['random']),
+    }
+    return Snapshot(meta, arrays, sequence)
+
+
+def restore(simulation, snapshot: Snapshot):
+    """Remet `simulation` dans l'état capturé par `capture`"""
+    meta = snapshot.meta
+    arrays = snapshot.arrays
+    if meta['batched'] != (simulation.monster_store is not None):
+        raise ValueError("Instantané et simulation n'utilisent pas le même stockage des monstres")
+
+    for name in SIMULATION_FIELDS:
+        setattr(simulation, name, meta[name])
+    simulation.game_mode = GameMode(meta['game_mode'])
+    simulation.light_position = tuple(meta['light_position']) if meta['light_position'] else None
+
+    towers = []
+    for row in arrays['towers']:
+        tower = Tower(TOWER_TYPES[row['type']], float(row['x']), float(row['y']))
+        tower.current_health = float(row['health'])
+        tower.attack_cooldown = float(row['attack_cooldown'])
+        tower.is_dead = bool(row['dead'])
+        tower.is_firing = bool(row['firing'])
+        towers.append(tower)
+    simulation.towers = towers
+
+    simulation.clear_monsters()
+    monsters = []
+    for row in arrays['monsters']:
+        monster = simulation.create_monster(MONSTER_TYPES[row['type']], float(row['x']), float(row['y']))
+        for name in MONSTER_FLOAT_FIELDS:
+            value = float(row[name])
+            setattr(monster, name, None if name.startswith('flee_target') and math.isnan(value) else value)
+        monster.is_dead = bool(row['dead'])
+        monster.is_fleeing = bool(row['fleeing'])
+        if row['knows_village']:
+            monster.village_x = simulation.village_x
+            monster.village_y = simulation.village_y
+        target = int(row['target'])
+        if target >= 0:
+            monster.current_target = towers[target]
+            monster.current_target_type = 'tower'
+        elif target == VILLAGE_TARGET:
+            monster.current_target = None
+            monster.current_target_type = 'village'
+        monsters.append(monster)
+    if simulation.monster_store is None:
+        simulation.monsters = monsters
+    else:
+        simulation.monster_store.rng.bit_generator.state = meta['monster_rng']
+
+    for tower, row in zip(towers, arrays['towers']):
+        tower.target = monsters[row['target']] if row['target'] >= 0 else None
+    for row in arrays['projectiles']:
+        # Les projectiles sont recréés sans passer par le constructeur, qui recalcule la direction
+        projectile = Projectile.__new__(Projectile)
+        projectile.x, projectile.y = float(row['x']), float(row['y'])
+        projectile.prev_x, projectile.prev_y = float(row['prev_x']), float(row['prev_y'])
+        projectile.dx, projectile.dy = float(row['dx']), float(row['dy'])
+        projectile.target = monsters[row['target']]
+        projectile.damage = float(row['damage'])
+        projectile.speed = float(row['speed'])
+        projectile.color = tuple(int(channel) for channel in row['color'])
+        projectile.reached = bool(row['reached'])
+        towers[row['tower']].projectiles.append(projectile)
+
+    explosions = []
+    for row in arrays['explosions']:
+        explosion = Explosion(float(row['x']), float(row['y']), float(row['max_radius']), float(row['duration']),
+                              tuple(int(channel) for channel in row['color']))
+        explosion.time = float(row['time'])
+        explosion.finished = bool(row['finished'])
+        explosions.append(explosion)
+    simulation.explosions = explosions
+
+    if 'wave' in meta:
+        wave_manager = WaveManager(simulation.village_x, simulation.village_y, simulation)
+        wave_manager.current_wave = meta['wave']['current_wave']
+        wave_manager.next_wave_time = meta['wave']['next_wave_time']
+        wave_manager.spawn_queue.clear()
+        wave_manager.spawn_queue.extend(
+            ScheduledSpawn(float(row['spawn_time']), int(row['wave_index']), MONSTER_TYPES[row['type']],
+                           float(row['group_factor']), bool(row['last_of_wave']))
+            for row in arrays['spawns'])
+        simulation.wave_manager = wave_manager
+    else:
+        simulation.wave_manager = None
+
+    random_version, gauss_next = meta['random']
+    random.setstate((random_version, tuple(int(word) for word in arrays['random']), gauss_next))
+    simulation.update_spatial_grids()
+
+
+def encode(snapshot: Snapshot, base: Optional[Snapshot] = None) -> bytes:
+    """Sérialise un instantané, complet ou en delta par rapport à `base`.
+
+    En delta, les lignes de chaque tableau présentes aussi dans `base`
+    (les `min(n, n_base)` premières) sont stockées en XOR octet à octet avec
+    celles-ci, le reste tel quel : les champs inchangés deviennent des zéros,
+    que la compression réduit presque entièrement, même si des entités sont
+    apparues ou ont disparu depuis la base.
+    """
+    meta = json.dumps(snapshot.meta).encode('utf-8')
+    kind = FULL if base is None else DELTA
+    parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, kind, snapshot.sequence,
+                         base.sequence if base is not None else 0, len(meta)), meta, struct.pack("<B", len(snapshot.arrays))]
+    for name, array in snapshot.arrays.items():
+        raw = np.ascontiguousarray(array).tobytes()
+        xor = base is not None and name in base.arrays and min(len(array), len(base.arrays[name])) > 0
+        if xor:
+            raw = xor_common_rows(raw, base.arrays[name])
+        payload = zlib.compress(raw, 1)
+        encoded_name = name.encode('ascii')
+        parts.append(SECTION_HEADER.pack(len(encoded_name), len(array), int(xor), len(payload)))
+        parts.append(encoded_name)
+        parts.append(payload)
+    return b''.join(parts)
+
+
+def xor_common_rows(raw: bytes, base_array: np.ndarray) -> bytes:
+    """XOR des octets de `raw` avec ceux de `base_array`, sur leur longueur commune (opération involutive)"""
+    data = np.frombuffer(raw, dtype=np.uint8).copy()
+    previous = np.frombuffer(np.ascontiguousarray(base_array).tobytes(), dtype=np.uint8)
+    common = min(len(data), len(previous))
+    data[:common] ^= previous[:common]
+    return data.tobytes()
+
+
+def decode(data: bytes, base: Optional[Snapshot] = None) -> Snapshot:
+    """Relit un instantané écrit par `encode` ; un delta nécessite sa base"""
+    magic, version, kind, sequence, base_sequence, meta_size = HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Fichier d'instantané invalide")
+    if version not in (1, SNAPSHOT_VERSION):  # La version 1 n'utilise que des XOR sur des tailles égales
+        raise ValueError(f"Version d'instantané non prise en charge: {version}")
+    if kind == DELTA and (base is None or base.sequence != base_sequence):
+        raise ValueError(f"Delta de l'instantané {base_sequence} appliqué à une autre base")
+
+    offset = HEADER.size
+    meta = json.loads(data[offset:offset + meta_size].decode('utf-8'))
+    offset += meta_size
+    (section_count,) = struct.unpack_from("<B", data, offset)
+    offset += 1
+    arrays = {}
+    for _ in range(section_count):
+        name_size, rows, xor, payload_size = SECTION_HEADER.unpack_from(data, offset)
+        offset += SECTION_HEADER.size
+        name = data[offset:offset + name_size].decode('ascii')
+        offset += name_size
+        raw = zlib.decompress(data[offset:offset + payload_size])
+        offset += payload_size
+        if xor:
+            raw = xor_common_rows(raw, base.arrays[name])
+        arrays[name] = np.frombuffer(raw, dtype=SECTION_DTYPES[name], count=rows).copy()
+    return Snapshot(meta, arrays, sequence)
+
+
+def write_snapshot(path: str, data: bytes):
+    """Écrit un instantané encodé de façon atomique (fichier temporaire puis renommage)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path + ".tmp", 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def read_snapshot(path: str, base: Optional[Snapshot] = None) -> Optional[Snapshot]:
+    """Relit un instantané, ou None si le fichier est absent ou illisible"""
+    try:
+        with open(path, 'rb') as f:
+            return decode(f.read(), base)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error, zlib.error) as e:
+        print(f"Instantané illisible {path}: {e}")
+        return None
+
+
+class Autosaver:
+    """Sauvegarde automatique sur un thread dédié.
+
+    La capture reste sur le thread principal (elle copie l'état dans des
+    tableaux) ; l'encodage, la compression et l'écriture sont faits en
+    arrière-plan. Une sauvegarde complète (`keyframe.snap`) est écrite toutes
+    les `keyframe_interval` sauvegardes ; chacune des suivantes est un delta
+    par rapport à la sauvegarde précédente (`delta-01.snap`, `delta-02.snap`...),
+    quelques secondes plus ancienne seulement. La reprise relit la sauvegarde
+    complète puis applique les deltas dans l'ordre.
+    """
+
+    def __init__(self, directory: str = AUTOSAVE_DIR, keyframe_interval: int = AUTOSAVE_KEYFRAME_INTERVAL):
+        self.directory = directory
+        self.keyframe_path = os.path.join(directory, "keyframe.snap")
+        self.keyframe_interval = keyframe_interval
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self.previous = None  # Dernière sauvegarde, base du prochain delta
+        self.saves = 0
+        self.sequence = 0
+
+    def delta_path(self, position: int) -> str:
+        """Fichier du delta numéro `position` depuis la sauvegarde complète (à partir de 1)"""
+        return os.path.join(self.directory, f"delta-{position:02d}.snap")
+
+    def save(self, snapshot: Snapshot):
+        """Planifie l'écriture d'un instantané capturé par `Simulation.snapshot`"""
+        self.sequence += 1
+        snapshot.sequence = self.sequence
+        position = self.saves % self.keyframe_interval
+        if self.previous is None or position == 0:
+            self.executor.submit(self.write_keyframe, snapshot)
+            self.saves = 0
+        else:
+            self.executor.submit(self.write_delta, snapshot, self.previous, position)
+        self.previous = snapshot
+        self.saves += 1
+
+    def write_keyframe(self, snapshot: Snapshot):
+        try:
+            # Les deltas précédents ne s'appliquent plus à la nouvelle base
+            position = 1
+            while os.path.exists(self.delta_path(position)):
+                os.remove(self.delta_path(position))
+                position += 1
+            write_snapshot(self.keyframe_path, encode(snapshot))
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde automatique: {e}")
+
+    def write_delta(self, snapshot: Snapshot, previous: Snapshot, position: int):
+        try:
+            write_snapshot(self.delta_path(position), encode(snapshot, previous))
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde automatique: {e}")
+
+    def load_latest(self) -> Optional[Snapshot]:
+        """Dernier état sauvegardé : la sauvegarde complète et tous les deltas qui s'y enchaînent"""
+        self.executor.submit(lambda: None).result()  # Attend les écritures en cours
+        latest = read_snapshot(self.keyframe_path)
+        if latest is None:
+            return None
+        position = 1
+        while os.path.exists(self.delta_path(position)):
+            delta = read_snapshot(self.delta_path(position), latest)
+            if delta is None:
+                break
+            latest = delta
+            position += 1
+        return latest
+
+    def reset(self):
+        """Repart d'une sauvegarde complète (nouvelle partie)"""
+        self.previous = None
+        self.saves = 0
+
+    def shutdown(self):
+        """Termine les écritures en attente"""
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,105 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.constants import WORLD_SIZE
+
+
+class SpatialHashGrid:
+    """Index spatial à cellules uniformes sur les coordonnées du monde.
+
+    Les objets indexés doivent exposer des attributs `x` et `y`. Les requêtes
+    ne parcourent que les cellules qui recouvrent la zone demandée, le coût
+    dépend donc de la densité locale et non de la population totale.
+    """
+
+    def __init__(self, cell_size: float, world_size: float = WORLD_SIZE):
+        self.cell_size = cell_size
+        self.columns = max(1, math.ceil(world_size / cell_size))
+        self.cells: Dict[Tuple[int, int], List] = {}
+        self.max_radius = 0.0  # Plus grand rayon propre des objets indexés (voir `rebuild`)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Cellule contenant la position, bornée aux limites du monde"""
+        last = self.columns - 1
+        cell_x = min(max(int(x // self.cell_size), 0), last)
+        cell_y = min(max(int(y // self.cell_size), 0), last)
+        return cell_x, cell_y
+
+    def clear(self):
+        self.cells.clear()
+        self.max_radius = 0.0
+
+    def insert(self, item):
+        """Ajoute un objet dans la cellule correspondant à sa position"""
+        cell = self.cell_of(item.x, item.y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            self.cells[cell] = [item]
+        else:
+            bucket.append(item)
+
+    def rebuild(self, items, radius_of: Optional[Callable] = None):
+        """Reconstruit entièrement l'index.
+
+        Args:
+            items: Objets à indexer
+            radius_of: Fonction optionnelle donnant le rayon d'action propre de
+                chaque objet (ex: portée de vision d'une tour), utilisée par
+                `query_candidates` pour borner la recherche
+        """
+        self.clear()
+        for item in items:
+            self.insert(item)
+            if radius_of is not None:
+                self.max_radius = max(self.max_radius, radius_of(item))
+
+    def rebuild_from_arrays(self, items, xs, ys):
+        """Reconstruit l'index à partir de positions déjà rangées dans des tableaux NumPy.
+
+        Le calcul des cellules et le regroupement sont vectorisés ; seule la
+        création des listes par cellule reste en Python.
+        """
+        self.clear()
+        if len(items) == 0:
+            return
+        last = self.columns - 1
+        cell_x = np.clip((xs // self.cell_size).astype(np.int64), 0, last)
+        cell_y = np.clip((ys // self.cell_size).astype(np.int64), 0, last)
+        keys = cell_x * self.columns + cell_y
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        order = order.tolist()
+        for start, end, key in zip(starts.tolist(), ends.tolist(), sorted_keys[starts].tolist()):
+            self.cells[(key // self.columns, key % self.columns)] = [items[i] for i in order[start:end]]
+
+    def query_candidates(self, x: float, y: float, radius: float) -> List:
+        """Objets des cellules qui recouvrent le carré englobant du cercle, sans test de distance"""
+        return self.query_rect_candidates(x - radius, y - radius, x + radius, y + radius)
+
+    def query_rect_candidates(self, left: float, top: float, right: float, bottom: float) -> List:
+        """Objets des cellules qui recouvrent le rectangle, sans test de position"""
+        min_x, min_y = self.cell_of(left, top)
+        max_x, max_y = self.cell_of(right, bottom)
+        cells = self.cells
+        candidates = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    def query_radius(self, x: float, y: float, radius: float) -> List:
+        """Objets situés à une distance inférieure ou égale à `radius` de (x, y)"""
+        radius_sq = radius * radius
+        return [item for item in self.query_candidates(x, y, radius)
+                if (item.x - x) ** 2 + (item.y - y) ** 2 <= radius_sq]
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List:
+        """Objets situés dans le rectangle [left, right] x [top, bottom]"""
+        return [item for item in self.query_rect_candidates(left, top, right, bottom)
+                if left <= item.x <= right and top <= item.y <= bottom]
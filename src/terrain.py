@@ -0,0 +1,86 @@
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from src.constants import WORLD_SIZE
+
+SPEED_MASK_PATH = "src/assets/speedmask.png"
+
+
+def load_speed_mask(path: str = SPEED_MASK_PATH) -> pygame.Surface:
+    """Charge l'image de terrain.
+
+    La conversion au format d'affichage n'est faite que si une fenêtre existe,
+    ce qui permet de charger le terrain en mode sans affichage.
+    """
+    try:
+        speed_mask = pygame.image.load(path)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            speed_mask = speed_mask.convert()
+    except FileNotFoundError:
+        print("Warning: speedmask.png not found in assets folder. Using default speedmask.")
+        speed_mask = pygame.Surface((WORLD_SIZE, WORLD_SIZE))
+        speed_mask.fill((255, 255, 255))  # Terrain blanc par défaut
+    return speed_mask
+
+
+class TerrainGrid:
+    """Multiplicateurs de vitesse du terrain précalculés une fois au chargement.
+
+    La grille (indexée [x, y]) couvre tout le monde ; sa résolution peut être
+    plus grossière que celle de l'image source. Les recherches se font par
+    une simple lecture de tableau, ou en un seul `gather` NumPy pour des
+    tableaux de positions.
+    """
+
+    def __init__(self, values: np.ndarray, world_size: float = WORLD_SIZE,
+                 multipliers: Optional[np.ndarray] = None):
+        """
+        Args:
+            values: Niveaux de gris du terrain (uint8, 0 = noir, 255 = blanc)
+            world_size: Taille du monde couvert par la grille
+            multipliers: Multiplicateurs déjà calculés (ex: lus depuis le cache de carte)
+        """
+        self.values = values.astype(np.uint8, copy=False)
+        self.width, self.height = self.values.shape
+        self.scale_x = self.width / world_size
+        self.scale_y = self.height / world_size
+        if multipliers is None:
+            # Conversion en multiplicateur (0.5 pour noir, 1.0 pour blanc)
+            multipliers = 0.5 + self.values.astype(np.float32) * (0.5 / 255.0)
+        self.multipliers = multipliers.astype(np.float32, copy=False)
+
+    @classmethod
+    def from_surface(cls, surface: pygame.Surface, resolution: Optional[int] = None,
+                     world_size: float = WORLD_SIZE) -> 'TerrainGrid':
+        """Construit la grille à partir de l'image de terrain.
+
+        Args:
+            surface: Image de terrain, de taille quelconque
+            resolution: Nombre de cellules par côté (par défaut celle de l'image)
+        """
+        # Seul l'octet de poids faible est utilisé (image en niveaux de gris)
+        values = (pygame.surfarray.array2d(surface) & 0xFF).astype(np.uint8)
+        if resolution is not None and values.shape != (resolution, resolution):
+            # Échantillonnage au plus proche vers la résolution demandée
+            source_x = (np.arange(resolution) * values.shape[0] // resolution)
+            source_y = (np.arange(resolution) * values.shape[1] // resolution)
+            values = values[np.ix_(source_x, source_y)]
+        return cls(values, world_size)
+
+    @classmethod
+    def load(cls, path: str = SPEED_MASK_PATH, resolution: Optional[int] = None) -> 'TerrainGrid':
+        return cls.from_surface(load_speed_mask(path), resolution)
+
+    def sample(self, x: float, y: float) -> float:
+        """Multiplicateur de vitesse à une position du monde"""
+        terrain_x = min(max(int(x * self.scale_x), 0), self.width - 1)
+        terrain_y = min(max(int(y * self.scale_y), 0), self.height - 1)
+        return float(self.multipliers[terrain_x, terrain_y])
+
+    def sample_many(self, xs, ys) -> np.ndarray:
+        """Multiplicateurs de vitesse pour des tableaux de positions"""
+        terrain_x = np.clip((np.asarray(xs) * self.scale_x).astype(np.int64), 0, self.width - 1)
+        terrain_y = np.clip((np.asarray(ys) * self.scale_y).astype(np.int64), 0, self.height - 1)
+        return self.multipliers[terrain_x, terrain_y]
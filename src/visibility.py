@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+
+from src.constants import WORLD_SIZE, VISIBILITY_CELL_SIZE, MAX_VISIBILITY_RANGE, LIGHT_MAX_RANGE
+
+
+class VisibilityGrid:
+    """Rasters grossiers du monde (indexés [x, y]) : zones visibles et zone d'usage de la lumière.
+
+    Une cellule est visible si son centre est à portée du village
+    (MAX_VISIBILITY_RANGE) ou dans la portée de vision d'une tour ; la
+    lumière peut être posée à LIGHT_MAX_RANGE du village ou dans la vision
+    d'une tour. Les rasters ne sont reconstruits que lorsque le village ou
+    les tours changent ; chaque test est ensuite une simple lecture de
+    tableau, vectorisable sur tous les monstres.
+    """
+
+    def __init__(self, cell_size: float = VISIBILITY_CELL_SIZE, world_size: float = WORLD_SIZE):
+        self.cell_size = cell_size
+        self.columns = max(1, math.ceil(world_size / cell_size))
+        self.centers = (np.arange(self.columns) + 0.5) * cell_size
+        self.visible = np.zeros((self.columns, self.columns), dtype=bool)
+        self.light_zone = np.zeros((self.columns, self.columns), dtype=bool)
+        self.signature = None
+
+    def update(self, village_x: float, village_y: float, towers) -> bool:
+        """Reconstruit les rasters si le village ou une tour a changé ; renvoie True si c'est le cas"""
+        signature = (village_x, village_y, tuple((tower.x, tower.y, tower.vision_range) for tower in towers))
+        if signature == self.signature:
+            return False
+        self.rebuild(village_x, village_y, towers)
+        self.signature = signature
+        return True
+
+    def rebuild(self, village_x: float, village_y: float, towers):
+        self.visible.fill(False)
+        self.light_zone.fill(False)
+        self.stamp(self.visible, village_x, village_y, MAX_VISIBILITY_RANGE)
+        self.stamp(self.light_zone, village_x, village_y, LIGHT_MAX_RANGE)
+        for tower in towers:
+            self.stamp(self.visible, tower.x, tower.y, tower.vision_range)
+            self.stamp(self.light_zone, tower.x, tower.y, tower.vision_range)
+
+    def stamp(self, raster: np.ndarray, x: float, y: float, radius: float):
+        """Marque les cellules dont le centre est à moins de `radius` de (x, y)"""
+        first_x, first_y = self.cell_of(x - radius, y - radius)
+        last_x, last_y = self.cell_of(x + radius, y + radius)
+        dx = self.centers[first_x:last_x + 1] - x
+        dy = self.centers[first_y:last_y + 1] - y
+        raster[first_x:last_x + 1, first_y:last_y + 1] |= (dx[:, None] ** 2 + dy[None, :] ** 2) <= radius * radius
+
+    def cell_of(self, x: float, y: float):
+        last = self.columns - 1
+        return (min(max(int(x // self.cell_size), 0), last),
+                min(max(int(y // self.cell_size), 0), last))
+
+    def cells_of(self, xs, ys):
+        last = self.columns - 1
+        return (np.clip((np.asarray(xs) // self.cell_size).astype(np.int64), 0, last),
+                np.clip((np.asarray(ys) // self.cell_size).astype(np.int64), 0, last))
+
+    def is_visible(self, x: float, y: float) -> bool:
+        return bool(self.visible[self.cell_of(x, y)])
+
+    def visible_many(self, xs, ys) -> np.ndarray:
+        """Visibilité de tableaux de positions, en une seule lecture"""
+        return self.visible[self.cells_of(xs, ys)]
+
+    def in_light_zone(self, x: float, y: float) -> bool:
+        """Vérifie si la lumière peut être posée en (x, y)"""
+        return bool(self.light_zone[self.cell_of(x, y)])